@@ -26,6 +26,7 @@ const dailyQuotaBuildRegister = app.node.tryGetContext("dailyQuotaBuildRegister"
 const dailyQuotaUploadCapability = app.node.tryGetContext("dailyQuotaUploadCapability") || process.env.DXCP_DAILY_QUOTA_UPLOAD_CAPABILITY || "50";
 const corsOriginsRaw = app.node.tryGetContext("corsOrigins") || process.env.DXCP_CORS_ORIGINS || "*";
 const spinnakerMode = app.node.tryGetContext("spinnakerMode") || process.env.DXCP_SPINNAKER_MODE || "http";
+const deploymentIndex = String(app.node.tryGetContext("deploymentIndex") ?? "true") !== "false";
 
 const env = { account, region };
 const iamAccount = account || cdk.Aws.ACCOUNT_ID;
@@ -122,6 +123,7 @@ const dataStack = new DataStack(app, "DxcpDataStack", {
   dailyQuotaRollback,
   dailyQuotaBuildRegister,
   dailyQuotaUploadCapability,
+  deploymentIndex,
 });
 
 const demoRuntimeStack = new DemoRuntimeStack(app, "DxcpDemoRuntimeStack", { env, configPrefix });
@@ -15,6 +15,7 @@ export interface DataStackProps extends StackProps {
   dailyQuotaRollback: string;
   dailyQuotaBuildRegister: string;
   dailyQuotaUploadCapability: string;
+  deploymentIndex: boolean;
 }
 
 export class DataStack extends Stack {
@@ -34,6 +35,24 @@ export class DataStack extends Stack {
       removalPolicy: RemovalPolicy.DESTROY,
     });
 
+    // Builds by service: gsi1pk = "BUILD#<service>", gsi1sk = "<version>#<registeredAt>".
+    this.table.addGlobalSecondaryIndex({
+      indexName: "GSI1",
+      partitionKey: { name: "gsi1pk", type: dynamodb.AttributeType.STRING },
+      sortKey: { name: "gsi1sk", type: dynamodb.AttributeType.STRING },
+    });
+
+    // DynamoDB adds one GSI per table update. For an existing table that has neither index,
+    // scripts/deploy_aws.sh first deploys with `-c deploymentIndex=false` to add GSI1 alone.
+    // Deployments by target, newest first: gsi2pk = "DEPLOYMENT#<service>#<environment>", gsi2sk = "<createdAt>#<id>".
+    if (props.deploymentIndex) {
+      this.table.addGlobalSecondaryIndex({
+        indexName: "GSI2",
+        partitionKey: { name: "gsi2pk", type: dynamodb.AttributeType.STRING },
+        sortKey: { name: "gsi2sk", type: dynamodb.AttributeType.STRING },
+      });
+    }
+
     const param = (name: string, value: string) => {
       new ssm.StringParameter(this, `Param${name}`, {
         parameterName: `${props.configPrefix}/${name}`,
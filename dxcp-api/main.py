@@ -793,11 +793,8 @@ def _promotion_path_allowed(group: dict, source_environment: str, target_environ
 
 
 def _version_successful_in_environment(service: str, environment: str, version: str) -> bool:
-    deployments = storage.list_deployments(service, None, environment)
-    return any(
-        deployment.get("version") == version and deployment.get("state") == "SUCCEEDED"
-        for deployment in deployments
-    )
+    deployments = storage.list_deployments(service, "SUCCEEDED", environment)
+    return any(deployment.get("version") == version for deployment in deployments)
 
 
 def _resolve_promotion_context(intent: PromotionIntent, actor: Actor) -> tuple[Optional[dict], Optional[JSONResponse]]:
@@ -881,8 +878,8 @@ def _promotion_candidate_for_service(service: str, source_environment: str, acto
     if target_error:
         return {"eligible": False, "reason": _error_code_from_response(target_error)}
     _ = target_env
-    deployments = storage.list_deployments(service, None, source_environment)
-    promotable = next((item for item in deployments if item.get("state") == "SUCCEEDED"), None)
+    deployments = storage.list_deployments(service, "SUCCEEDED", source_environment, limit=1)
+    promotable = deployments[0] if deployments else None
     if not promotable:
         return {"eligible": False, "reason": "PROMOTION_NO_SUCCESSFUL_SOURCE_VERSION", "target_environment": target_environment}
     routed_recipe, _, routed_recipe_error = resolve_routed_recipe_for_service_environment(
@@ -1135,8 +1132,9 @@ def _spinnaker_scope_for_actor(actor: Actor) -> tuple[Optional[dict], Optional[J
         )
     allowed_apps: set[str] = set()
     pipelines_by_app: dict[str, set[str]] = {}
+    recipes_by_id = storage.get_recipes_bulk(sorted(allowed_recipes))
     for recipe_id in allowed_recipes:
-        recipe = storage.get_recipe(recipe_id)
+        recipe = recipes_by_id.get(recipe_id)
         if not recipe or recipe.get("status") == "deprecated":
             continue
         application = recipe.get("spinnaker_application")
@@ -5099,7 +5097,9 @@ def register_build(
     record["run_url"] = run_url
     record["ci_publisher"] = publisher_name
     record["registeredAt"] = utc_now()
-    record = storage.insert_build(record)
+    with storage.transaction():
+        record = storage.insert_build(record)
+        storage.delete_upload_capability(cap["id"])
     logger.info(
         "event=build.registration.succeeded request_id=%s publisher_name=%s actor_id=%s sub=%s email=%s service=%s version=%s artifactRef=%s",
         request_id_ctx.get() or str(uuid.uuid4()),
@@ -5111,7 +5111,6 @@ def register_build(
         record.get("version"),
         record.get("artifactRef"),
     )
-    storage.delete_upload_capability(cap["id"])
     response_payload = _build_public_view(record)
     store_idempotency(request, idempotency_key, response_payload, 201)
     return response_payload
@@ -0,0 +1,7 @@
+MIGRATION_ID = "202610160900_backfill_build_index_keys"
+
+
+def run(storage) -> None:
+    backfill = getattr(storage, "backfill_build_index_keys", None)
+    if callable(backfill):
+        backfill()
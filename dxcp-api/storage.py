@@ -1,25 +1,49 @@
+import base64
+import copy
+import heapq
+import itertools
 import json
 import os
+import queue
 import re
 import sqlite3
+import threading
+import time
 import uuid
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional
 
 from delivery_state import base_outcome_from_state, normalize_deployment_kind
 
 try:
     import boto3
     from boto3.dynamodb.conditions import Attr, Key
+    from boto3.dynamodb.types import TypeSerializer
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import ClientError
 except Exception:  # pragma: no cover - optional dependency for local mode
     boto3 = None
     Key = None
     Attr = None
+    TypeSerializer = None
+    BotoConfig = None
     ClientError = None
 
 
+_SSM_GET_PARAMETERS_MAX_NAMES = 10
+
+
+@lru_cache(maxsize=1)
+def _ssm_client():
+    # boto3 clients are thread-safe; building one per lookup re-resolves credentials and endpoints each time.
+    return boto3.client("ssm")
+
+
 def _read_ssm_parameter(name: str, cache: dict) -> Optional[str]:
     if name in cache:
         return cache[name]
@@ -27,7 +51,7 @@ def _read_ssm_parameter(name: str, cache: dict) -> Optional[str]:
         cache[name] = None
         return None
     try:
-        client = boto3.client("ssm")
+        client = _ssm_client()
         response = client.get_parameter(Name=name)
         value = response.get("Parameter", {}).get("Value")
     except Exception:
@@ -36,6 +60,28 @@ def _read_ssm_parameter(name: str, cache: dict) -> Optional[str]:
     return value
 
 
+def _prefetch_ssm_parameters(values, cache: dict) -> None:
+    names = sorted(
+        {value[len("ssm:") :] for value in values if isinstance(value, str) and value.startswith("ssm:")} - cache.keys()
+    )
+    if not names or not boto3:
+        return
+    try:
+        client = _ssm_client()
+    except Exception:
+        return
+    for start in range(0, len(names), _SSM_GET_PARAMETERS_MAX_NAMES):
+        try:
+            response = client.get_parameters(Names=names[start : start + _SSM_GET_PARAMETERS_MAX_NAMES])
+        except Exception:
+            # Left uncached; _read_ssm_parameter retries these one at a time.
+            continue
+        for parameter in response.get("Parameters", []):
+            cache[parameter.get("Name")] = parameter.get("Value")
+        for name in response.get("InvalidParameters", []):
+            cache[name] = None
+
+
 def _resolve_ssm_template(value: Optional[str], cache: dict) -> Optional[str]:
     if not isinstance(value, str):
         return value
@@ -72,6 +118,259 @@ PROTECTED_DEPLOYMENT_FIELDS = (
     "policySnapshot",
     "intentCorrelationId",
 )
+# Timestamps and a fresh allowed_parameters list are filled in by ensure_default_recipe.
+_DEFAULT_RECIPE_TEMPLATES = (
+    {
+        "id": "default",
+        "name": "Standard",
+        "description": "Standard deploy recipe for demo deployments",
+        "allowed_parameters": [],
+        "engine_type": DEFAULT_ENGINE_TYPE,
+        "spinnaker_application": "demo-app",
+        "deploy_pipeline": "demo-deploy",
+        "rollback_pipeline": "rollback-demo-service",
+        "recipe_revision": 1,
+        "effective_behavior_summary": "Standard roll-forward deploy with rollback support.",
+        "status": "active",
+        "created_by": "system",
+        "updated_by": "system",
+    },
+    {
+        "id": "canary",
+        "name": "Canary",
+        "description": "Canary deploy recipe with automated verification.",
+        "allowed_parameters": [],
+        "engine_type": DEFAULT_ENGINE_TYPE,
+        "spinnaker_application": "demo-app",
+        "deploy_pipeline": "demo-deploy-canary",
+        "rollback_pipeline": "rollback-demo-service",
+        "recipe_revision": 1,
+        "effective_behavior_summary": "Progressive rollout with verification and rollback on failed analysis.",
+        "status": "active",
+        "created_by": "system",
+        "updated_by": "system",
+    },
+    {
+        "id": "bluegreen",
+        "name": "BlueGreen",
+        "description": "Blue/green deploy recipe with controlled cutover.",
+        "allowed_parameters": [],
+        "engine_type": DEFAULT_ENGINE_TYPE,
+        "spinnaker_application": "demo-app",
+        "deploy_pipeline": "demo-deploy-bluegreen",
+        "rollback_pipeline": "rollback-demo-service",
+        "recipe_revision": 1,
+        "effective_behavior_summary": "Parallel rollout with cutover and rollback capability.",
+        "status": "active",
+        "created_by": "system",
+        "updated_by": "system",
+    },
+)
+# Hot statements are kept as shared constants so pooled connections hit their statement cache.
+# (column, API key) pairs for failure rows, selected in this order.
+_FAILURE_FIELDS = (
+    ("category", "category"),
+    ("summary", "summary"),
+    ("detail", "detail"),
+    ("action_hint", "actionHint"),
+    ("observed_at", "observedAt"),
+)
+_FAILURE_KEYS = tuple(key for _, key in _FAILURE_FIELDS)
+_FAILURE_SELECT = ", ".join(column for column, _ in _FAILURE_FIELDS)
+_SQL_GET_FAILURES = f"SELECT {_FAILURE_SELECT} FROM failures WHERE deployment_id = ?"
+_SQL_DELETE_FAILURES = "DELETE FROM failures WHERE deployment_id = ?"
+_SQL_INSERT_FAILURE = """
+    INSERT INTO failures (
+        deployment_id, category, summary, detail, action_hint, observed_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_DEPLOYMENT = """
+    INSERT INTO deployments (
+        id, service, environment, version, recipe_id, recipe_revision, effective_behavior_summary, state, deployment_kind, outcome,
+        intent_correlation_id, superseded_by, change_summary, created_at, updated_at,
+        engine_type, spinnaker_execution_id, spinnaker_execution_url, spinnaker_application, spinnaker_pipeline,
+        rollback_of, source_environment, delivery_group_id, actor_identity_json, policy_snapshot_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_AUDIT_EVENT_COLUMNS = (
+    "event_id",
+    "event_type",
+    "actor_id",
+    "actor_role",
+    "target_type",
+    "target_id",
+    "timestamp",
+    "outcome",
+    "summary",
+    "delivery_group_id",
+    "service_name",
+    "environment",
+)
+# The leading columns are required on every event; the scoping columns are optional.
+_audit_event_required_values = itemgetter(*_AUDIT_EVENT_COLUMNS[:9])
+_AUDIT_EVENT_OPTIONAL_COLUMNS = _AUDIT_EVENT_COLUMNS[9:]
+_SQL_INSERT_AUDIT_EVENT = (
+    f"INSERT INTO audit_events ({', '.join(_AUDIT_EVENT_COLUMNS)}) VALUES ({', '.join('?' for _ in _AUDIT_EVENT_COLUMNS)})"
+)
+# (column, API key) pairs; SELECTs list columns in this order so rows unpack positionally.
+_DEPLOYMENT_FIELDS = (
+    ("id", "id"),
+    ("service", "service"),
+    ("environment", "environment"),
+    ("version", "version"),
+    ("recipe_id", "recipeId"),
+    ("recipe_revision", "recipeRevision"),
+    ("effective_behavior_summary", "effectiveBehaviorSummary"),
+    ("state", "state"),
+    ("deployment_kind", "deploymentKind"),
+    ("outcome", "outcome"),
+    ("intent_correlation_id", "intentCorrelationId"),
+    ("superseded_by", "supersededBy"),
+    ("change_summary", "changeSummary"),
+    ("created_at", "createdAt"),
+    ("updated_at", "updatedAt"),
+    ("engine_type", "engine_type"),
+    ("spinnaker_execution_id", "spinnakerExecutionId"),
+    ("spinnaker_execution_url", "spinnakerExecutionUrl"),
+    ("spinnaker_application", "spinnakerApplication"),
+    ("spinnaker_pipeline", "spinnakerPipeline"),
+    ("rollback_of", "rollbackOf"),
+    ("source_environment", "sourceEnvironment"),
+    ("delivery_group_id", "deliveryGroupId"),
+    ("actor_identity_json", "actorIdentity"),
+    ("policy_snapshot_json", "policySnapshot"),
+)
+_DEPLOYMENT_COLUMNS = tuple(column for column, _ in _DEPLOYMENT_FIELDS)
+_DEPLOYMENT_KEYS = tuple(key for _, key in _DEPLOYMENT_FIELDS)
+_DEPLOYMENT_SELECT = ", ".join(_DEPLOYMENT_COLUMNS)
+_BUILD_FIELDS = (
+    ("id", "id"),
+    ("service", "service"),
+    ("version", "version"),
+    ("artifact_ref", "artifactRef"),
+    ("git_sha", "git_sha"),
+    ("git_branch", "git_branch"),
+    ("ci_publisher", "ci_publisher"),
+    ("ci_provider", "ci_provider"),
+    ("ci_run_id", "ci_run_id"),
+    ("built_at", "built_at"),
+    ("sha256", "sha256"),
+    ("size_bytes", "sizeBytes"),
+    ("content_type", "contentType"),
+    ("checksum_sha256", "checksum_sha256"),
+    ("repo", "repo"),
+    ("actor", "actor"),
+    ("commit_url", "commit_url"),
+    ("run_url", "run_url"),
+    ("registered_at", "registeredAt"),
+)
+_BUILD_KEYS = tuple(key for _, key in _BUILD_FIELDS)
+# Everything but the generated id, in insert column order.
+_BUILD_RECORD_KEYS = _BUILD_KEYS[1:]
+_BUILD_SELECT = ", ".join(column for column, _ in _BUILD_FIELDS)
+_SQL_INSERT_BUILD = f"INSERT INTO builds ({_BUILD_SELECT}) VALUES ({', '.join('?' for _ in _BUILD_FIELDS)})"
+_SQL_FIND_LATEST_BUILD = f"""
+    SELECT {_BUILD_SELECT} FROM builds
+    WHERE service = ? AND version = ?
+    ORDER BY registered_at DESC
+    LIMIT 1
+"""
+_SQL_LIST_BUILDS_FOR_SERVICE = f"""
+    SELECT {_BUILD_SELECT} FROM builds
+    WHERE service = ?
+    ORDER BY registered_at DESC
+"""
+_SQL_INSERT_UPLOAD_CAPABILITY = """
+    INSERT INTO build_upload_caps (
+        id, service, version, expected_size_bytes, expected_sha256,
+        expected_content_type, token, expires_at, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Callers only need the id, expiry and token of a matching capability.
+_UPLOAD_CAPABILITY_MATCH_KEYS = ("id", "expiresAt", "token")
+_SQL_FIND_UPLOAD_CAPABILITY = """
+    SELECT id, expires_at, token FROM build_upload_caps
+    WHERE service = ? AND version = ? AND expected_size_bytes = ?
+      AND expected_sha256 = ? AND expected_content_type = ?
+"""
+_SQL_DELETE_UPLOAD_CAPABILITY = "DELETE FROM build_upload_caps WHERE id = ?"
+_ENVIRONMENT_COLUMNS = (
+    "id",
+    "name",
+    "display_name",
+    "type",
+    "lifecycle_state",
+    "promotion_order",
+    "delivery_group_id",
+    "is_enabled",
+    "guardrails",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+    "last_change_reason",
+)
+_ENVIRONMENT_SELECT = ", ".join(_ENVIRONMENT_COLUMNS)
+_RECIPE_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "allowed_parameters",
+    "engine_type",
+    "spinnaker_application",
+    "deploy_pipeline",
+    "rollback_pipeline",
+    "recipe_revision",
+    "effective_behavior_summary",
+    "status",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+    "last_change_reason",
+)
+_RECIPE_SELECT = ", ".join(_RECIPE_COLUMNS)
+_DELIVERY_GROUP_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "owner",
+    "services",
+    "allowed_environments",
+    "allowed_recipes",
+    "guardrails",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+    "last_change_reason",
+)
+_DELIVERY_GROUP_SELECT = ", ".join(_DELIVERY_GROUP_COLUMNS)
+_SQL_GET_ENVIRONMENT = f"SELECT {_ENVIRONMENT_SELECT} FROM environments WHERE id = ?"
+_SQL_LIST_ENVIRONMENTS = f"SELECT {_ENVIRONMENT_SELECT} FROM environments ORDER BY name ASC"
+_SQL_GET_DEPLOYMENT = f"SELECT {_DEPLOYMENT_SELECT} FROM deployments WHERE id = ?"
+_SQL_FIND_PRIOR_SUCCESSFUL_DEPLOYMENT = f"""
+    SELECT {", ".join(f"d.{column}" for column in _DEPLOYMENT_COLUMNS)}
+    FROM deployments d
+    JOIN deployments t ON t.id = ?
+    WHERE d.service = t.service AND d.environment = t.environment AND d.state = ? AND d.created_at < t.created_at
+    ORDER BY d.created_at DESC
+    LIMIT 1
+"""
+_SQL_INSERT_ENVIRONMENT = """
+    INSERT INTO environments (
+        id, name, display_name, type, lifecycle_state, promotion_order, delivery_group_id, is_enabled, guardrails,
+        created_at, created_by, updated_at, updated_by, last_change_reason
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPSERT_DG_ENV_POLICY = """
+    INSERT INTO delivery_group_environment_policy (
+        delivery_group_id, environment_id, is_enabled, order_index
+    ) VALUES (?, ?, ?, ?)
+    ON CONFLICT(delivery_group_id, environment_id) DO UPDATE SET
+        is_enabled = excluded.is_enabled,
+        order_index = excluded.order_index
+"""
 
 
 class ImmutableDeploymentError(Exception):
@@ -89,12 +388,49 @@ def _assert_protected_fields_unchanged(before: Optional[dict], after: Optional[d
             raise ImmutableDeploymentError(f"Cannot change protected deployment field: {field}")
 
 
+def _assert_deployment_transition_allowed(existing: Optional[dict], state: str, outcome: Optional[str]) -> None:
+    if not existing:
+        return
+    existing_state = existing.get("state")
+    if existing_state in TERMINAL_DEPLOYMENT_STATES and state != existing_state:
+        raise ImmutableDeploymentError("Cannot change terminal deployment state")
+    if outcome is not None:
+        existing_outcome = existing.get("outcome") or base_outcome_from_state(existing_state)
+        if existing_outcome in TERMINAL_DEPLOYMENT_OUTCOMES and outcome != existing_outcome:
+            raise ImmutableDeploymentError("Cannot change terminal deployment outcome")
+
+
 def _json_dumps_compact(value: Optional[dict]) -> Optional[str]:
     if value is None:
         return None
     return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
 
 
+def _encode_page_cursor(*values: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode("utf-8")).decode("ascii")
+
+
+def _decode_page_cursor(cursor: str, size: int) -> List[str]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("invalid page cursor") from exc
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(value, str) for value in values):
+        raise ValueError("invalid page cursor")
+    return values
+
+
+def _build_page_key(build: dict) -> tuple:
+    return (build.get("registeredAt") or "", build.get("id") or "")
+
+
+def _page_result(items: List[dict], has_more: bool, *cursor_keys: str) -> dict:
+    next_cursor = None
+    if has_more and items:
+        next_cursor = _encode_page_cursor(*(items[-1][key] for key in cursor_keys))
+    return {"items": items, "next_cursor": next_cursor}
+
+
 def _json_loads_safe(value: Optional[str]) -> Optional[dict]:
     if not value:
         return None
@@ -104,6 +440,64 @@ def _json_loads_safe(value: Optional[str]) -> Optional[dict]:
         return None
 
 
+_DDB_SET_SUPERSEDED_BY = "SET supersededBy = :supersededBy, updatedAt = :updatedAt"
+
+
+_DDB_TERMINAL_STATE_VALUES = {f":ts{index}": value for index, value in enumerate(sorted(TERMINAL_DEPLOYMENT_STATES))}
+_DDB_TERMINAL_OUTCOME_VALUES = {
+    f":to{index}": value for index, value in enumerate(sorted(TERMINAL_DEPLOYMENT_OUTCOMES))
+}
+
+
+@lru_cache(maxsize=None)
+def _deployment_update_condition(with_outcome: bool) -> str:
+    # Server-side form of _assert_deployment_transition_allowed; missing items fail attribute_exists.
+    not_terminal = f"attribute_not_exists(#state) OR NOT #state IN ({', '.join(_DDB_TERMINAL_STATE_VALUES)})"
+    condition = f"attribute_exists(pk) AND ({not_terminal} OR #state = :state)"
+    if with_outcome:
+        # An empty or NULL stored outcome falls back to the state, as base_outcome_from_state does.
+        condition += (
+            f" AND (NOT outcome IN ({', '.join(_DDB_TERMINAL_OUTCOME_VALUES)}) OR outcome = :outcome)"
+            f" AND ({not_terminal} OR #state = :outcome"
+            " OR (attribute_type(outcome, :stringType) AND size(outcome) > :zero))"
+        )
+    return condition
+
+
+@lru_cache(maxsize=None)
+def _deployment_update_expression(with_outcome: bool, with_superseded_by: bool) -> str:
+    updates = ["#state = :state", "updatedAt = :updatedAt", "failures = :failures"]
+    if with_outcome:
+        updates.append("outcome = :outcome")
+    if with_superseded_by:
+        updates.append("supersededBy = :supersededBy")
+    return f"SET {', '.join(updates)}"
+
+
+@lru_cache(maxsize=None)
+def _audit_events_page_sql(
+    with_event_type: bool, with_delivery_group: bool, with_start: bool, with_end: bool, with_cursor: bool
+) -> str:
+    clauses = []
+    if with_event_type:
+        clauses.append("event_type = ?")
+    if with_delivery_group:
+        clauses.append("delivery_group_id = ?")
+    if with_start:
+        clauses.append("timestamp >= ?")
+    if with_end:
+        clauses.append("timestamp <= ?")
+    if with_cursor:
+        clauses.append("(timestamp, event_id) < (?, ?)")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return f"SELECT * FROM audit_events {where} ORDER BY timestamp DESC, event_id DESC LIMIT ?"
+
+
+@lru_cache(maxsize=1024)
+def _cached_json_loads(value: str):
+    return json.loads(value)
+
+
 def _normalize_environment_lifecycle_state(
     lifecycle_state: Optional[str],
     is_enabled: Optional[bool],
@@ -140,20 +534,132 @@ def _legacy_environment_canonical_id(legacy_id: str, canonical_name: str) -> Opt
     return canonical_name
 
 
+
+def _row_to_build(row: sqlite3.Row) -> dict:
+    return dict(zip(_BUILD_KEYS, row))
+
+
 class Storage:
+    READ_POOL_SIZE = 5
+    WRITE_POOL_SIZE = 1
+    # Stays below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+    SQL_IN_CHUNK_SIZE = 900
+    CACHED_STATEMENTS = 256
+    BUSY_TIMEOUT_SECONDS = 5.0
+    # Negative cache_size is in KiB, so this is ~64 MB of page cache per pooled connection.
+    PAGE_CACHE_KIB = 64000
+    # Reads of the first 256 MB come straight from a shared memory map instead of a read() per page.
+    MMAP_SIZE_BYTES = 256 * 1024 * 1024
+    # Stamped into PRAGMA user_version once _init_db has applied every table, column and index below; bump it when adding to them.
+    SCHEMA_VERSION = 2
+
     def __init__(self, db_path: str, registry_path: str) -> None:
         self.db_path = db_path
         self.registry_path = registry_path
+        self._read_pool = self._new_pool(self.READ_POOL_SIZE)
+        self._write_pool = self._new_pool(self.WRITE_POOL_SIZE)
+        self._transaction = threading.local()
+        self._registry_cache = (None, [], {})
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _new_pool(self, size: int) -> queue.LifoQueue:
+        # Each slot holds one long-lived cursor on its own connection, created on first checkout.
+        pool: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            pool.put(None)
+        return pool
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        # Autocommit at the driver level; write transactions are opened explicitly in _rw_conn().
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
+        # WAL stays durable across application crashes with NORMAL; only the fsync per commit is dropped.
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA cache_size = -{self.PAGE_CACHE_KIB}")
+        conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE_BYTES}")
+        if read_only:
+            conn.execute("PRAGMA query_only = 1")
         return conn
 
+    def _release_cursor(self, cur: sqlite3.Cursor) -> sqlite3.Cursor:
+        # Drain unread rows so an idle pooled connection never pins a read snapshot.
+        try:
+            cur.fetchall()
+        except sqlite3.Error:
+            return cur.connection.cursor()
+        return cur
+
+    @contextmanager
+    def _ro_conn(self) -> Iterator[sqlite3.Cursor]:
+        active = getattr(self._transaction, "cursor", None)
+        if active is not None:
+            # Reads inside transaction() must see its uncommitted writes.
+            yield active
+            return
+        cur = self._read_pool.get()
+        try:
+            if cur is None:
+                cur = self._connect(read_only=True).cursor()
+            try:
+                yield cur
+            finally:
+                cur = self._release_cursor(cur)
+        finally:
+            self._read_pool.put(cur)
+
+    @contextmanager
+    def _rw_conn(self) -> Iterator[sqlite3.Cursor]:
+        active = getattr(self._transaction, "cursor", None)
+        if active is not None:
+            yield active
+            return
+        cur = self._write_pool.get()
+        try:
+            if cur is None:
+                cur = self._connect().cursor()
+            try:
+                # Take the write lock up front so contention waits on busy_timeout instead of failing mid-transaction.
+                cur.execute("BEGIN IMMEDIATE")
+                yield cur
+                cur = self._release_cursor(cur)
+                cur.execute("COMMIT")
+            except BaseException:
+                cur = self._release_cursor(cur)
+                if cur.connection.in_transaction:
+                    cur.execute("ROLLBACK")
+                raise
+        finally:
+            self._write_pool.put(cur)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # Storage calls made on this thread inside the block share one write transaction and commit together.
+        if getattr(self._transaction, "cursor", None) is not None:
+            yield
+            return
+        with self._rw_conn() as cur:
+            self._transaction.cursor = cur
+            try:
+                yield
+            finally:
+                self._transaction.cursor = None
+
     def _init_db(self) -> None:
         conn = self._connect()
         cur = conn.cursor()
+        # WAL lets the read pool run alongside the single writer.
+        cur.execute("PRAGMA journal_mode=WAL")
+        if cur.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+            conn.close()
+            return
+        cur.execute("BEGIN IMMEDIATE")
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS deployments (
@@ -213,6 +719,16 @@ class Storage:
             )
             """
         )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_failures_deployment_id ON failures(deployment_id)")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_deployments_state_group_env ON deployments(state, delivery_group_id, environment)"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_deployments_service_env_state_created ON deployments(service, environment, state, created_at DESC)"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_deployments_service_env_created ON deployments(service, environment, created_at DESC, id DESC)"
+        )
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS build_upload_caps (
@@ -228,6 +744,9 @@ class Storage:
             )
             """
         )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_build_upload_caps_lookup ON build_upload_caps(service, version, expected_sha256)"
+        )
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS builds (
@@ -262,6 +781,10 @@ class Storage:
         self._ensure_column(cur, "builds", "actor", "TEXT")
         self._ensure_column(cur, "builds", "commit_url", "TEXT")
         self._ensure_column(cur, "builds", "run_url", "TEXT")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_builds_service_version_registered ON builds(service, version, registered_at DESC)"
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_builds_service_registered ON builds(service, registered_at DESC)")
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS services (
@@ -370,6 +893,12 @@ class Storage:
             """
         )
         cur.execute("CREATE INDEX IF NOT EXISTS idx_audit_events_timestamp ON audit_events(timestamp)")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_events_type_timestamp ON audit_events(event_type, timestamp DESC, event_id DESC)"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_events_group_timestamp ON audit_events(delivery_group_id, timestamp DESC, event_id DESC)"
+        )
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS admin_environments (
@@ -414,7 +943,9 @@ class Storage:
         cur.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS idx_service_env_routing_unique ON service_environment_routing(service_id, environment_id)"
         )
+        cur.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
         conn.commit()
+        cur.execute("PRAGMA optimize")
         conn.close()
 
     def _ensure_column(self, cur: sqlite3.Cursor, table: str, column: str, column_type: str) -> None:
@@ -585,29 +1116,43 @@ class Storage:
             )
 
     def normalize_legacy_environment_identities(self) -> int:
-        conn = self._connect()
-        cur = conn.cursor()
-        before = cur.execute("SELECT COUNT(1) FROM environments WHERE instr(id, ':') > 0").fetchone()[0]
-        self._normalize_legacy_environment_identity_rows(cur)
-        conn.commit()
-        after = cur.execute("SELECT COUNT(1) FROM environments WHERE instr(id, ':') > 0").fetchone()[0]
-        conn.close()
+        with self._rw_conn() as cur:
+            before = cur.execute("SELECT COUNT(1) FROM environments WHERE instr(id, ':') > 0").fetchone()[0]
+            self._normalize_legacy_environment_identity_rows(cur)
+            after = cur.execute("SELECT COUNT(1) FROM environments WHERE instr(id, ':') > 0").fetchone()[0]
         return int(before - after)
 
     def _read_registry(self) -> List[dict]:
+        return self._registry_snapshot()[0]
+
+    def _registry_snapshot(self) -> tuple:
+        # Parsed entries are reused until the registry file is replaced or rewritten; callers must not mutate them.
+        try:
+            stat = os.stat(self.registry_path)
+        except FileNotFoundError:
+            return [], {}
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cached_signature, cached, cached_by_name = self._registry_cache
+        if signature == cached_signature:
+            return cached, cached_by_name
         try:
             with open(self.registry_path, "r", encoding="utf-8") as handle:
                 data = json.load(handle)
         except FileNotFoundError:
-            return []
+            return [], {}
         if not isinstance(data, list):
             print("service registry invalid: root must be a list")
-            return []
+            data = []
         valid = []
         for entry in data:
             if self._is_valid_service_entry(entry):
                 valid.append(entry)
-        return valid
+        valid.sort(key=itemgetter("service_name"))
+        by_name: Dict[str, dict] = {}
+        for entry in valid:
+            by_name.setdefault(entry["service_name"], entry)
+        self._registry_cache = (signature, valid, by_name)
+        return valid, by_name
 
     def _is_valid_service_entry(self, entry: dict) -> bool:
         if not isinstance(entry, dict):
@@ -636,41 +1181,41 @@ class Storage:
     def list_services(self) -> List[dict]:
         data = self._read_registry()
         ssm_cache: dict = {}
-        return sorted(
-            [
-                {
-                    "service_name": entry.get("service_name"),
-                    "allowed_environments": entry.get("allowed_environments", []),
-                    "allowed_recipes": entry.get("allowed_recipes", []),
-                    "allowed_artifact_sources": entry.get("allowed_artifact_sources", []),
-                    "stable_service_url_template": _resolve_ssm_template(
-                        entry.get("stable_service_url_template"),
-                        ssm_cache,
-                    ),
-                    "backstage_entity_ref": entry.get("backstage_entity_ref"),
-                    "backstage_entity_url": _resolve_ssm_template(
-                        entry.get("backstage_entity_url_template"),
-                        ssm_cache,
-                    ),
-                }
-                for entry in data
-                if entry.get("service_name")
-            ],
-            key=lambda item: item["service_name"],
+        _prefetch_ssm_parameters(
+            (entry.get(field) for entry in data for field in ("stable_service_url_template", "backstage_entity_url_template")),
+            ssm_cache,
         )
+        # _read_registry returns entries already sorted by service_name.
+        return [self._service_from_entry(entry, ssm_cache) for entry in data]
+
+    def _service_from_entry(self, entry: dict, ssm_cache: dict) -> dict:
+        return {
+            "service_name": entry.get("service_name"),
+            "allowed_environments": copy.copy(entry.get("allowed_environments", [])),
+            "allowed_recipes": copy.copy(entry.get("allowed_recipes", [])),
+            "allowed_artifact_sources": copy.copy(entry.get("allowed_artifact_sources", [])),
+            "stable_service_url_template": _resolve_ssm_template(
+                entry.get("stable_service_url_template"),
+                ssm_cache,
+            ),
+            "backstage_entity_ref": entry.get("backstage_entity_ref"),
+            "backstage_entity_url": _resolve_ssm_template(
+                entry.get("backstage_entity_url_template"),
+                ssm_cache,
+            ),
+        }
 
     def get_service(self, service_name: str) -> Optional[dict]:
-        for entry in self.list_services():
-            if entry["service_name"] == service_name:
-                return entry
-        return None
+        # Only this entry's SSM templates are resolved, instead of every service in the registry.
+        entry = self._registry_snapshot()[1].get(service_name)
+        if entry is None:
+            return None
+        return self._service_from_entry(entry, {})
 
     def _has_delivery_groups(self) -> bool:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT id FROM delivery_groups LIMIT 1")
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute("SELECT id FROM delivery_groups LIMIT 1")
+            row = cur.fetchone()
         return row is not None
 
     def _serialize_json(self, value) -> Optional[str]:
@@ -682,69 +1227,65 @@ class Storage:
         if value is None:
             return default
         try:
-            return json.loads(value)
+            parsed = _cached_json_loads(value)
         except json.JSONDecodeError:
             return default
+        # Parsed values are shared through the cache; callers get their own container.
+        return copy.copy(parsed) if isinstance(parsed, (dict, list)) else parsed
 
     def insert_delivery_group(self, group: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO delivery_groups (
-                id, name, description, owner, services, allowed_environments, allowed_recipes, guardrails,
-                created_at, created_by, updated_at, updated_by, last_change_reason
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                group["id"],
-                group["name"],
-                group.get("description"),
-                group.get("owner"),
-                self._serialize_json(group.get("services", [])),
-                self._serialize_json(group.get("allowed_environments")),
-                self._serialize_json(group.get("allowed_recipes", [])),
-                self._serialize_json(group.get("guardrails")),
-                group.get("created_at"),
-                group.get("created_by"),
-                group.get("updated_at"),
-                group.get("updated_by"),
-                group.get("last_change_reason"),
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                """
+                INSERT INTO delivery_groups (
+                    id, name, description, owner, services, allowed_environments, allowed_recipes, guardrails,
+                    created_at, created_by, updated_at, updated_by, last_change_reason
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    group["id"],
+                    group["name"],
+                    group.get("description"),
+                    group.get("owner"),
+                    self._serialize_json(group.get("services", [])),
+                    self._serialize_json(group.get("allowed_environments")),
+                    self._serialize_json(group.get("allowed_recipes", [])),
+                    self._serialize_json(group.get("guardrails")),
+                    group.get("created_at"),
+                    group.get("created_by"),
+                    group.get("updated_at"),
+                    group.get("updated_by"),
+                    group.get("last_change_reason"),
+                ),
+            )
         self._ensure_group_environments(group)
         return group
 
     def update_delivery_group(self, group: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE delivery_groups
-            SET name = ?, description = ?, owner = ?, services = ?, allowed_environments = ?, allowed_recipes = ?, guardrails = ?,
-                created_at = ?, created_by = ?, updated_at = ?, updated_by = ?, last_change_reason = ?
-            WHERE id = ?
-            """,
-            (
-                group["name"],
-                group.get("description"),
-                group.get("owner"),
-                self._serialize_json(group.get("services", [])),
-                self._serialize_json(group.get("allowed_environments")),
-                self._serialize_json(group.get("allowed_recipes", [])),
-                self._serialize_json(group.get("guardrails")),
-                group.get("created_at"),
-                group.get("created_by"),
-                group.get("updated_at"),
-                group.get("updated_by"),
-                group.get("last_change_reason"),
-                group["id"],
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                """
+                UPDATE delivery_groups
+                SET name = ?, description = ?, owner = ?, services = ?, allowed_environments = ?, allowed_recipes = ?, guardrails = ?,
+                    created_at = ?, created_by = ?, updated_at = ?, updated_by = ?, last_change_reason = ?
+                WHERE id = ?
+                """,
+                (
+                    group["name"],
+                    group.get("description"),
+                    group.get("owner"),
+                    self._serialize_json(group.get("services", [])),
+                    self._serialize_json(group.get("allowed_environments")),
+                    self._serialize_json(group.get("allowed_recipes", [])),
+                    self._serialize_json(group.get("guardrails")),
+                    group.get("created_at"),
+                    group.get("created_by"),
+                    group.get("updated_at"),
+                    group.get("updated_by"),
+                    group.get("last_change_reason"),
+                    group["id"],
+                ),
+            )
         self._ensure_group_environments(group)
         return group
 
@@ -755,105 +1296,109 @@ class Storage:
         allowed = group.get("allowed_environments")
         if not isinstance(allowed, list):
             return
-        now = utc_now()
+        order_by_name: Dict[str, int] = {}
         for index, env_name in enumerate(allowed):
-            if not isinstance(env_name, str) or not env_name.strip():
-                continue
-            existing = self.get_environment_for_group(env_name, group["id"])
-            if existing:
-                continue
-            self.insert_environment(
-                {
-                    "id": f"{group['id']}:{env_name}",
-                    "name": env_name,
-                    "type": self._derive_environment_type(env_name),
-                    "display_name": None,
-                    "promotion_order": index + 1,
-                    "delivery_group_id": group["id"],
-                    "is_enabled": True,
-                    "guardrails": None,
-                    "created_at": now,
-                    "created_by": "system",
-                    "updated_at": now,
-                    "updated_by": "system",
-                }
+            if isinstance(env_name, str) and env_name.strip():
+                order_by_name.setdefault(env_name, index + 1)
+        if not order_by_name:
+            return
+        now = utc_now()
+        names = list(order_by_name)
+        with self._rw_conn() as cur:
+            existing = set()
+            for start in range(0, len(names), self.SQL_IN_CHUNK_SIZE):
+                chunk = names[start : start + self.SQL_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur.execute(f"SELECT id FROM environments WHERE id IN ({placeholders})", chunk)
+                existing.update(row[0] for row in cur.fetchall())
+            missing = [name for name in names if name not in existing]
+            if not missing:
+                return
+            cur.executemany(
+                _SQL_INSERT_ENVIRONMENT,
+                [
+                    self._admin_environment_params(
+                        {
+                            "environment_id": env_name,
+                            "display_name": env_name,
+                            "type": self._derive_environment_type(env_name),
+                            "is_enabled": True,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                    )
+                    for env_name in missing
+                ],
+            )
+            cur.executemany(
+                _SQL_UPSERT_DG_ENV_POLICY,
+                [
+                    self._environment_policy_params(
+                        {
+                            "delivery_group_id": group["id"],
+                            "environment_id": env_name,
+                            "is_enabled": True,
+                            "order_index": order_by_name[env_name],
+                        }
+                    )
+                    for env_name in missing
+                ],
             )
 
     def _has_recipes(self) -> bool:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT id FROM recipes LIMIT 1")
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute("SELECT id FROM recipes LIMIT 1")
+            row = cur.fetchone()
         return row is not None
 
     def insert_recipe(self, recipe: dict) -> dict:
+        self._insert_recipe(recipe, ignore_existing=False)
+        return recipe
+
+    def _insert_recipe(self, recipe: dict, ignore_existing: bool) -> bool:
+        on_conflict = " ON CONFLICT(id) DO NOTHING" if ignore_existing else ""
         recipe_revision = recipe.get("recipe_revision") or 1
         effective_behavior_summary = recipe.get("effective_behavior_summary") or "No behavior summary provided."
         engine_type = recipe.get("engine_type") or DEFAULT_ENGINE_TYPE
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO recipes (
-                id, name, description, allowed_parameters, engine_type,
-                spinnaker_application, deploy_pipeline, rollback_pipeline, recipe_revision, effective_behavior_summary, status,
-                created_at, created_by, updated_at, updated_by, last_change_reason
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                recipe["id"],
-                recipe["name"],
-                recipe.get("description"),
-                self._serialize_json(recipe.get("allowed_parameters", [])),
-                engine_type,
-                recipe.get("spinnaker_application"),
-                recipe.get("deploy_pipeline"),
-                recipe.get("rollback_pipeline"),
-                recipe_revision,
-                effective_behavior_summary,
-                recipe.get("status", "active"),
-                recipe.get("created_at"),
-                recipe.get("created_by"),
-                recipe.get("updated_at"),
-                recipe.get("updated_by"),
-                recipe.get("last_change_reason"),
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                """
+                INSERT INTO recipes (
+                    id, name, description, allowed_parameters, engine_type,
+                    spinnaker_application, deploy_pipeline, rollback_pipeline, recipe_revision, effective_behavior_summary, status,
+                    created_at, created_by, updated_at, updated_by, last_change_reason
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """
+                + on_conflict,
+                (
+                    recipe["id"],
+                    recipe["name"],
+                    recipe.get("description"),
+                    self._serialize_json(recipe.get("allowed_parameters", [])),
+                    engine_type,
+                    recipe.get("spinnaker_application"),
+                    recipe.get("deploy_pipeline"),
+                    recipe.get("rollback_pipeline"),
+                    recipe_revision,
+                    effective_behavior_summary,
+                    recipe.get("status", "active"),
+                    recipe.get("created_at"),
+                    recipe.get("created_by"),
+                    recipe.get("updated_at"),
+                    recipe.get("updated_by"),
+                    recipe.get("last_change_reason"),
+                ),
+            )
+            inserted = cur.rowcount > 0
         recipe["recipe_revision"] = recipe_revision
         recipe["effective_behavior_summary"] = effective_behavior_summary
         recipe["engine_type"] = engine_type
-        return recipe
+        return inserted
 
     def insert_audit_event(self, event: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO audit_events (
-                event_id, event_type, actor_id, actor_role, target_type, target_id,
-                timestamp, outcome, summary, delivery_group_id, service_name, environment
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event["event_id"],
-                event["event_type"],
-                event["actor_id"],
-                event["actor_role"],
-                event["target_type"],
-                event["target_id"],
-                event["timestamp"],
-                event["outcome"],
-                event["summary"],
-                event.get("delivery_group_id"),
-                event.get("service_name"),
-                event.get("environment"),
-            ),
-        )
-        conn.commit()
-        conn.close()
+        params = (*_audit_event_required_values(event), *map(event.get, _AUDIT_EVENT_OPTIONAL_COLUMNS))
+        with self._rw_conn() as cur:
+            cur.execute(_SQL_INSERT_AUDIT_EVENT, params)
         return event
 
     def list_audit_events(
@@ -864,131 +1409,123 @@ class Storage:
         end_time: Optional[str] = None,
         limit: int = 200,
     ) -> List[dict]:
-        clauses = []
-        params = []
-        if event_type:
-            clauses.append("event_type = ?")
-            params.append(event_type)
-        if delivery_group_id:
-            clauses.append("delivery_group_id = ?")
-            params.append(delivery_group_id)
-        if start_time:
-            clauses.append("timestamp >= ?")
-            params.append(start_time)
-        if end_time:
-            clauses.append("timestamp <= ?")
-            params.append(end_time)
-        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
-        sql = f"SELECT * FROM audit_events {where} ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(sql, params)
-        rows = cur.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        return self.list_audit_events_page(
+            event_type=event_type,
+            delivery_group_id=delivery_group_id,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+        )["items"]
+
+    def list_audit_events_page(
+        self,
+        event_type: Optional[str] = None,
+        delivery_group_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: int = 200,
+        cursor: Optional[str] = None,
+    ) -> dict:
+        params = [value for value in (event_type, delivery_group_id, start_time, end_time) if value]
+        if cursor:
+            params.extend(_decode_page_cursor(cursor, 2))
+        params.append(limit + 1)
+        sql = _audit_events_page_sql(bool(event_type), bool(delivery_group_id), bool(start_time), bool(end_time), bool(cursor))
+        with self._ro_conn() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+        return _page_result([dict(row) for row in rows[:limit]], len(rows) > limit, "timestamp", "event_id")
 
     def update_recipe(self, recipe: dict) -> dict:
         recipe_revision = recipe.get("recipe_revision") or 1
         effective_behavior_summary = recipe.get("effective_behavior_summary") or "No behavior summary provided."
         engine_type = recipe.get("engine_type") or DEFAULT_ENGINE_TYPE
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE recipes
-            SET name = ?, description = ?, allowed_parameters = ?, engine_type = ?,
-                spinnaker_application = ?, deploy_pipeline = ?, rollback_pipeline = ?, recipe_revision = ?, effective_behavior_summary = ?, status = ?,
-                created_at = ?, created_by = ?, updated_at = ?, updated_by = ?, last_change_reason = ?
-            WHERE id = ?
-            """,
-            (
-                recipe["name"],
-                recipe.get("description"),
-                self._serialize_json(recipe.get("allowed_parameters", [])),
-                engine_type,
-                recipe.get("spinnaker_application"),
-                recipe.get("deploy_pipeline"),
-                recipe.get("rollback_pipeline"),
-                recipe_revision,
-                effective_behavior_summary,
-                recipe.get("status", "active"),
-                recipe.get("created_at"),
-                recipe.get("created_by"),
-                recipe.get("updated_at"),
-                recipe.get("updated_by"),
-                recipe.get("last_change_reason"),
-                recipe["id"],
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                """
+                UPDATE recipes
+                SET name = ?, description = ?, allowed_parameters = ?, engine_type = ?,
+                    spinnaker_application = ?, deploy_pipeline = ?, rollback_pipeline = ?, recipe_revision = ?, effective_behavior_summary = ?, status = ?,
+                    created_at = ?, created_by = ?, updated_at = ?, updated_by = ?, last_change_reason = ?
+                WHERE id = ?
+                """,
+                (
+                    recipe["name"],
+                    recipe.get("description"),
+                    self._serialize_json(recipe.get("allowed_parameters", [])),
+                    engine_type,
+                    recipe.get("spinnaker_application"),
+                    recipe.get("deploy_pipeline"),
+                    recipe.get("rollback_pipeline"),
+                    recipe_revision,
+                    effective_behavior_summary,
+                    recipe.get("status", "active"),
+                    recipe.get("created_at"),
+                    recipe.get("created_by"),
+                    recipe.get("updated_at"),
+                    recipe.get("updated_by"),
+                    recipe.get("last_change_reason"),
+                    recipe["id"],
+                ),
+            )
         recipe["recipe_revision"] = recipe_revision
         recipe["effective_behavior_summary"] = effective_behavior_summary
         recipe["engine_type"] = engine_type
         return recipe
 
     def _row_to_recipe(self, row: sqlite3.Row) -> dict:
-        recipe_revision = row["recipe_revision"] if row["recipe_revision"] is not None else 1
-        effective_behavior_summary = row["effective_behavior_summary"] or "No behavior summary provided."
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "description": row["description"],
-            "allowed_parameters": self._deserialize_json(row["allowed_parameters"], []),
-            "engine_type": row["engine_type"] or DEFAULT_ENGINE_TYPE,
-            "spinnaker_application": row["spinnaker_application"],
-            "deploy_pipeline": row["deploy_pipeline"],
-            "rollback_pipeline": row["rollback_pipeline"],
-            "recipe_revision": recipe_revision,
-            "effective_behavior_summary": effective_behavior_summary,
-            "status": row["status"] or "active",
-            "created_at": row["created_at"],
-            "created_by": row["created_by"],
-            "updated_at": row["updated_at"],
-            "updated_by": row["updated_by"],
-            "last_change_reason": row["last_change_reason"],
-        }
+        recipe = dict(zip(_RECIPE_COLUMNS, row))
+        recipe["allowed_parameters"] = self._deserialize_json(recipe["allowed_parameters"], [])
+        recipe["engine_type"] = recipe["engine_type"] or DEFAULT_ENGINE_TYPE
+        if recipe["recipe_revision"] is None:
+            recipe["recipe_revision"] = 1
+        recipe["effective_behavior_summary"] = recipe["effective_behavior_summary"] or "No behavior summary provided."
+        recipe["status"] = recipe["status"] or "active"
+        return recipe
 
     def list_recipes(self) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM recipes ORDER BY name ASC")
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(f"SELECT {_RECIPE_SELECT} FROM recipes ORDER BY name ASC")
+            rows = cur.fetchall()
         return [self._row_to_recipe(row) for row in rows]
 
     def get_recipe(self, recipe_id: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM recipes WHERE id = ?", (recipe_id,))
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(f"SELECT {_RECIPE_SELECT} FROM recipes WHERE id = ?", (recipe_id,))
+            row = cur.fetchone()
         if not row:
             return None
         return self._row_to_recipe(row)
 
+    def get_recipes_bulk(self, recipe_ids: List[str]) -> Dict[str, dict]:
+        recipes: Dict[str, dict] = {}
+        ids = list(dict.fromkeys(recipe_ids))
+        with self._ro_conn() as cur:
+            for start in range(0, len(ids), self.SQL_IN_CHUNK_SIZE):
+                chunk = ids[start : start + self.SQL_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur.execute(f"SELECT {_RECIPE_SELECT} FROM recipes WHERE id IN ({placeholders})", tuple(chunk))
+                for row in cur.fetchall():
+                    recipe = self._row_to_recipe(row)
+                    recipes[recipe["id"]] = recipe
+        return recipes
+
     def delete_recipe(self, recipe_id: str) -> None:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM recipes WHERE id = ?", (recipe_id,))
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute("DELETE FROM recipes WHERE id = ?", (recipe_id,))
 
     def list_service_environment_routing_by_recipe(self, recipe_id: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT service_id, environment_id, recipe_id
-            FROM service_environment_routing
-            WHERE recipe_id = ?
-            ORDER BY service_id ASC, environment_id ASC
-            """,
-            (recipe_id,),
-        )
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT service_id, environment_id, recipe_id
+                FROM service_environment_routing
+                WHERE recipe_id = ?
+                ORDER BY service_id ASC, environment_id ASC
+                """,
+                (recipe_id,),
+            )
+            rows = cur.fetchall()
         return [
             {
                 "service_id": row["service_id"],
@@ -999,97 +1536,77 @@ class Storage:
         ]
 
     def list_delivery_groups_by_allowed_recipe(self, recipe_id: str) -> List[dict]:
-        groups = []
-        for group in self.list_delivery_groups():
-            allowed = group.get("allowed_recipes") or []
-            if recipe_id in allowed:
-                groups.append(
-                    {
-                        "id": group.get("id"),
-                        "name": group.get("name"),
-                    }
-                )
-        groups.sort(key=lambda row: row.get("id") or "")
-        return groups
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT id, name FROM delivery_groups
+                WHERE json_valid(allowed_recipes) AND json_type(allowed_recipes) = 'array'
+                  AND EXISTS (SELECT 1 FROM json_each(delivery_groups.allowed_recipes) WHERE value = ?)
+                ORDER BY id ASC
+                """,
+                (recipe_id,),
+            )
+            rows = cur.fetchall()
+        return [{"id": row["id"], "name": row["name"]} for row in rows]
 
     def _row_to_delivery_group(self, row: sqlite3.Row) -> dict:
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "description": row["description"],
-            "owner": row["owner"],
-            "services": self._deserialize_json(row["services"], []),
-            "allowed_environments": self._deserialize_json(row["allowed_environments"], None),
-            "allowed_recipes": self._deserialize_json(row["allowed_recipes"], []),
-            "guardrails": self._deserialize_json(row["guardrails"], None),
-            "created_at": row["created_at"],
-            "created_by": row["created_by"],
-            "updated_at": row["updated_at"],
-            "updated_by": row["updated_by"],
-            "last_change_reason": row["last_change_reason"],
-        }
+        group = dict(zip(_DELIVERY_GROUP_COLUMNS, row))
+        group["services"] = self._deserialize_json(group["services"], [])
+        group["allowed_environments"] = self._deserialize_json(group["allowed_environments"], None)
+        group["allowed_recipes"] = self._deserialize_json(group["allowed_recipes"], [])
+        group["guardrails"] = self._deserialize_json(group["guardrails"], None)
+        return group
 
     def list_delivery_groups(self) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM delivery_groups ORDER BY name ASC")
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(f"SELECT {_DELIVERY_GROUP_SELECT} FROM delivery_groups ORDER BY name ASC")
+            rows = cur.fetchall()
         return [self._row_to_delivery_group(row) for row in rows]
 
     def get_delivery_group(self, group_id: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM delivery_groups WHERE id = ?", (group_id,))
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(f"SELECT {_DELIVERY_GROUP_SELECT} FROM delivery_groups WHERE id = ?", (group_id,))
+            row = cur.fetchone()
         if not row:
             return None
         return self._row_to_delivery_group(row)
 
     def get_delivery_group_for_service(self, service_name: str) -> Optional[dict]:
-        for group in self.list_delivery_groups():
-            services = group.get("services", [])
-            if service_name in services:
-                return group
-        return None
+        with self._ro_conn() as cur:
+            cur.execute(
+                f"""
+                SELECT {_DELIVERY_GROUP_SELECT} FROM delivery_groups
+                WHERE json_valid(services)
+                  AND EXISTS (SELECT 1 FROM json_each(delivery_groups.services) WHERE value = ?)
+                ORDER BY name ASC
+                LIMIT 1
+                """,
+                (service_name,),
+            )
+            row = cur.fetchone()
+        if not row:
+            return None
+        return self._row_to_delivery_group(row)
 
     def _row_to_environment(self, row: sqlite3.Row) -> dict:
-        lifecycle_state = _normalize_environment_lifecycle_state(
-            row["lifecycle_state"] if "lifecycle_state" in row.keys() else None,
-            bool(row["is_enabled"]),
-        )
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "display_name": row["display_name"],
-            "type": row["type"],
-            "lifecycle_state": lifecycle_state,
-            "promotion_order": row["promotion_order"],
-            "delivery_group_id": row["delivery_group_id"],
-            "is_enabled": _environment_is_enabled_for_lifecycle(lifecycle_state, bool(row["is_enabled"])),
-            "guardrails": self._deserialize_json(row["guardrails"], None),
-            "created_at": row["created_at"],
-            "created_by": row["created_by"],
-            "updated_at": row["updated_at"],
-            "updated_by": row["updated_by"],
-            "last_change_reason": row["last_change_reason"],
-        }
+        environment = dict(zip(_ENVIRONMENT_COLUMNS, row))
+        is_enabled = bool(environment["is_enabled"])
+        lifecycle_state = _normalize_environment_lifecycle_state(environment["lifecycle_state"], is_enabled)
+        environment["lifecycle_state"] = lifecycle_state
+        environment["is_enabled"] = _environment_is_enabled_for_lifecycle(lifecycle_state, is_enabled)
+        environment["guardrails"] = self._deserialize_json(environment["guardrails"], None)
+        return environment
 
     def list_environments(self) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM environments ORDER BY name ASC")
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_LIST_ENVIRONMENTS)
+            rows = cur.fetchall()
         return [self._row_to_environment(row) for row in rows]
 
     def get_environment(self, environment_id: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM environments WHERE id = ?", (environment_id,))
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_GET_ENVIRONMENT, (environment_id,))
+            row = cur.fetchone()
         if not row:
             return None
         return self._row_to_environment(row)
@@ -1124,9 +1641,6 @@ class Storage:
         environment_id = environment.get("environment_id") or environment.get("name") or environment.get("id")
         if not isinstance(environment_id, str) or not environment_id:
             raise ValueError("environment id is required")
-        existing = self.get_environment(environment_id)
-        if existing:
-            return existing
         now = environment.get("created_at") or utc_now()
         canonical = {
             "environment_id": environment_id,
@@ -1136,7 +1650,8 @@ class Storage:
             "created_at": now,
             "updated_at": environment.get("updated_at") or now,
         }
-        self.insert_admin_environment(canonical)
+        if not self._insert_admin_environment(canonical, ignore_existing=True):
+            return self.get_environment(environment_id)
         delivery_group_id = environment.get("delivery_group_id")
         if delivery_group_id:
             order_index = environment.get("promotion_order")
@@ -1214,7 +1729,7 @@ class Storage:
         if self._has_delivery_groups():
             return None
         now = utc_now()
-        services = [entry["service_name"] for entry in self.list_services() if entry.get("service_name")]
+        services = list(map(itemgetter("service_name"), self.list_services()))
         group = {
             "id": "default",
             "name": "Default Delivery Group",
@@ -1229,29 +1744,32 @@ class Storage:
             "updated_at": now,
             "updated_by": "system",
         }
-        return self.insert_delivery_group(group)
+        # Re-checked under the write lock so concurrent starts seed the group (and its environments) only once, in one commit.
+        with self.transaction():
+            if self._has_delivery_groups():
+                return None
+            return self.insert_delivery_group(group)
 
     def _has_environments(self) -> bool:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT id FROM environments LIMIT 1")
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute("SELECT id FROM environments LIMIT 1")
+            row = cur.fetchone()
         return row is not None
 
     def ensure_default_environments(self) -> List[dict]:
-        if self.list_environments():
+        if self._has_environments():
             return []
         now = utc_now()
-        created = []
+        environment_rows = {}
+        policy_rows = []
         for group in self.list_delivery_groups():
             configured = group.get("allowed_environments")
             env_names = configured if isinstance(configured, list) and configured else ["sandbox"]
             for index, env_name in enumerate(env_names):
                 if not isinstance(env_name, str) or not env_name.strip():
                     continue
-                if not self.get_environment(env_name):
-                    self.insert_admin_environment(
+                if env_name not in environment_rows:
+                    environment_rows[env_name] = self._admin_environment_params(
                         {
                             "environment_id": env_name,
                             "display_name": env_name,
@@ -1261,96 +1779,60 @@ class Storage:
                             "updated_at": now,
                         }
                     )
-                    created.append(self.get_environment(env_name))
-                self.upsert_delivery_group_environment_policy(
-                    {
-                        "delivery_group_id": group["id"],
-                        "environment_id": env_name,
-                        "is_enabled": True,
-                        "order_index": index + 1,
-                    }
+                policy_rows.append(
+                    self._environment_policy_params(
+                        {
+                            "delivery_group_id": group["id"],
+                            "environment_id": env_name,
+                            "is_enabled": True,
+                            "order_index": index + 1,
+                        }
+                    )
                 )
-        return created
+        if not environment_rows:
+            return []
+        with self._rw_conn() as cur:
+            if cur.execute("SELECT 1 FROM environments LIMIT 1").fetchone():
+                return []
+            cur.executemany(_SQL_INSERT_ENVIRONMENT + " ON CONFLICT(id) DO NOTHING", list(environment_rows.values()))
+            cur.executemany(_SQL_UPSERT_DG_ENV_POLICY, policy_rows)
+        environments = {row["id"]: row for row in self.list_environments()}
+        return [environments[name] for name in environment_rows if name in environments]
 
     def ensure_default_recipe(self) -> Optional[dict]:
         now = utc_now()
         recipes = [
-            {
-                "id": "default",
-                "name": "Standard",
-                "description": "Standard deploy recipe for demo deployments",
-                "allowed_parameters": [],
-                "engine_type": DEFAULT_ENGINE_TYPE,
-                "spinnaker_application": "demo-app",
-                "deploy_pipeline": "demo-deploy",
-                "rollback_pipeline": "rollback-demo-service",
-                "recipe_revision": 1,
-                "effective_behavior_summary": "Standard roll-forward deploy with rollback support.",
-                "status": "active",
-                "created_at": now,
-                "created_by": "system",
-                "updated_at": now,
-                "updated_by": "system",
-            },
-            {
-                "id": "canary",
-                "name": "Canary",
-                "description": "Canary deploy recipe with automated verification.",
-                "allowed_parameters": [],
-                "engine_type": DEFAULT_ENGINE_TYPE,
-                "spinnaker_application": "demo-app",
-                "deploy_pipeline": "demo-deploy-canary",
-                "rollback_pipeline": "rollback-demo-service",
-                "recipe_revision": 1,
-                "effective_behavior_summary": "Progressive rollout with verification and rollback on failed analysis.",
-                "status": "active",
-                "created_at": now,
-                "created_by": "system",
-                "updated_at": now,
-                "updated_by": "system",
-            },
-            {
-                "id": "bluegreen",
-                "name": "BlueGreen",
-                "description": "Blue/green deploy recipe with controlled cutover.",
-                "allowed_parameters": [],
-                "engine_type": DEFAULT_ENGINE_TYPE,
-                "spinnaker_application": "demo-app",
-                "deploy_pipeline": "demo-deploy-bluegreen",
-                "rollback_pipeline": "rollback-demo-service",
-                "recipe_revision": 1,
-                "effective_behavior_summary": "Parallel rollout with cutover and rollback capability.",
-                "status": "active",
-                "created_at": now,
-                "created_by": "system",
-                "updated_at": now,
-                "updated_by": "system",
-            },
+            {**template, "allowed_parameters": [], "created_at": now, "updated_at": now}
+            for template in _DEFAULT_RECIPE_TEMPLATES
         ]
         created = None
-        for recipe in recipes:
-            if self.get_recipe(recipe["id"]):
-                continue
-            self.insert_recipe(recipe)
-            if created is None:
-                created = recipe
+        with self.transaction():
+            for recipe in recipes:
+                if self._insert_recipe(recipe, ignore_existing=True) and created is None:
+                    created = recipe
         return created
 
     def ensure_default_service_environment_routing(self) -> List[dict]:
         created = []
-        for service in self.list_services():
-            service_id = service.get("service_name")
-            if not service_id:
-                continue
-            for group in self.list_delivery_groups():
+        service_ids = [service.get("service_name") for service in self.list_services() if service.get("service_name")]
+        groups = self.list_delivery_groups()
+        policies = self.list_delivery_group_environment_policy_bulk([group["id"] for group in groups if group.get("id")])
+        routed = {
+            (route["service_id"], route["environment_id"])
+            for routes in self.list_service_environment_routing_bulk(service_ids).values()
+            for route in routes
+        }
+        for service_id in service_ids:
+            for group in groups:
                 if service_id not in (group.get("services") or []):
                     continue
-                for env in self.list_delivery_group_environment_policy(group.get("id")):
+                for env in policies.get(group.get("id"), []):
                     environment_id = env.get("environment_id")
                     if not environment_id:
                         continue
-                    if self.get_service_environment_routing(service_id, environment_id):
+                    if (service_id, environment_id) in routed:
                         continue
+                    routed.add((service_id, environment_id))
                     row = {
                         "service_id": service_id,
                         "environment_id": environment_id,
@@ -1389,174 +1871,142 @@ class Storage:
         }
 
     def insert_admin_environment(self, environment: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO environments (
-                id, name, display_name, type, lifecycle_state, promotion_order, delivery_group_id, is_enabled, guardrails,
-                created_at, created_by, updated_at, updated_by, last_change_reason
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                environment["environment_id"],
-                environment["environment_id"],
-                environment["display_name"],
-                environment["type"],
-                environment.get("lifecycle_state") or _normalize_environment_lifecycle_state(
-                    None,
-                    environment.get("is_enabled", True),
-                ),
-                None,
-                "",
-                1 if _environment_is_enabled_for_lifecycle(
-                    environment.get("lifecycle_state"),
-                    environment.get("is_enabled", True),
-                ) else 0,
-                None,
-                environment["created_at"],
-                None,
-                environment["updated_at"],
-                None,
+        self._insert_admin_environment(environment, ignore_existing=False)
+        return environment
+
+    def _insert_admin_environment(self, environment: dict, ignore_existing: bool) -> bool:
+        on_conflict = " ON CONFLICT(id) DO NOTHING" if ignore_existing else ""
+        with self._rw_conn() as cur:
+            cur.execute(_SQL_INSERT_ENVIRONMENT + on_conflict, self._admin_environment_params(environment))
+            return cur.rowcount > 0
+
+    def _admin_environment_params(self, environment: dict) -> tuple:
+        return (
+            environment["environment_id"],
+            environment["environment_id"],
+            environment["display_name"],
+            environment["type"],
+            environment.get("lifecycle_state") or _normalize_environment_lifecycle_state(
                 None,
+                environment.get("is_enabled", True),
             ),
+            None,
+            "",
+            1 if _environment_is_enabled_for_lifecycle(
+                environment.get("lifecycle_state"),
+                environment.get("is_enabled", True),
+            ) else 0,
+            None,
+            environment["created_at"],
+            None,
+            environment["updated_at"],
+            None,
+            None,
         )
-        conn.commit()
-        conn.close()
-        return environment
 
     def update_admin_environment(self, environment: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE environments
-            SET name = ?, display_name = ?, type = ?, lifecycle_state = ?, is_enabled = ?, updated_at = ?
-            WHERE id = ?
-            """,
-            (
-                environment["environment_id"],
-                environment["display_name"],
-                environment["type"],
-                environment.get("lifecycle_state") or _normalize_environment_lifecycle_state(
-                    None,
-                    environment.get("is_enabled", True),
+        with self._rw_conn() as cur:
+            cur.execute(
+                """
+                UPDATE environments
+                SET name = ?, display_name = ?, type = ?, lifecycle_state = ?, is_enabled = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    environment["environment_id"],
+                    environment["display_name"],
+                    environment["type"],
+                    environment.get("lifecycle_state") or _normalize_environment_lifecycle_state(
+                        None,
+                        environment.get("is_enabled", True),
+                    ),
+                    1 if _environment_is_enabled_for_lifecycle(
+                        environment.get("lifecycle_state"),
+                        environment.get("is_enabled", True),
+                    ) else 0,
+                    environment["updated_at"],
+                    environment["environment_id"],
                 ),
-                1 if _environment_is_enabled_for_lifecycle(
-                    environment.get("lifecycle_state"),
-                    environment.get("is_enabled", True),
-                ) else 0,
-                environment["updated_at"],
-                environment["environment_id"],
-            ),
-        )
-        conn.commit()
-        conn.close()
+            )
         return environment
 
     def list_delivery_group_environment_policy(self, delivery_group_id: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT p.delivery_group_id, p.environment_id, p.is_enabled, p.order_index,
-                   e.display_name, e.type
-            FROM delivery_group_environment_policy p
-            LEFT JOIN environments e ON e.id = p.environment_id
-            WHERE p.delivery_group_id = ?
-            ORDER BY p.order_index ASC, p.environment_id ASC
-            """,
-            (delivery_group_id,),
-        )
-        rows = cur.fetchall()
-        conn.close()
-        return [
-            {
-                "delivery_group_id": row["delivery_group_id"],
-                "environment_id": row["environment_id"],
-                "is_enabled": bool(row["is_enabled"]),
-                "order_index": row["order_index"],
-                "display_name": row["display_name"],
-                "type": row["type"],
-                "lifecycle_state": _normalize_environment_lifecycle_state(
-                    row["lifecycle_state"] if "lifecycle_state" in row.keys() else None,
-                    bool(row["is_enabled"]),
-                ),
-            }
-            for row in rows
-        ]
+        return self.list_delivery_group_environment_policy_bulk([delivery_group_id])[delivery_group_id]
+
+    def list_delivery_group_environment_policy_bulk(self, delivery_group_ids: List[str]) -> Dict[str, List[dict]]:
+        policies: Dict[str, List[dict]] = defaultdict(list)
+        ids = list(dict.fromkeys(delivery_group_ids))
+        with self._ro_conn() as cur:
+            for start in range(0, len(ids), self.SQL_IN_CHUNK_SIZE):
+                chunk = ids[start : start + self.SQL_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur.execute(
+                    f"""
+                    SELECT p.delivery_group_id, p.environment_id, p.is_enabled, p.order_index,
+                           e.display_name, e.type
+                    FROM delivery_group_environment_policy p
+                    LEFT JOIN environments e ON e.id = p.environment_id
+                    WHERE p.delivery_group_id IN ({placeholders})
+                    ORDER BY p.delivery_group_id ASC, p.order_index ASC, p.environment_id ASC
+                    """,
+                    tuple(chunk),
+                )
+                for row in cur.fetchall():
+                    policies[row["delivery_group_id"]].append(
+                        {
+                            "delivery_group_id": row["delivery_group_id"],
+                            "environment_id": row["environment_id"],
+                            "is_enabled": bool(row["is_enabled"]),
+                            "order_index": row["order_index"],
+                            "display_name": row["display_name"],
+                            "type": row["type"],
+                            "lifecycle_state": _normalize_environment_lifecycle_state(
+                                row["lifecycle_state"] if "lifecycle_state" in row.keys() else None,
+                                bool(row["is_enabled"]),
+                            ),
+                        }
+                    )
+        return policies
 
     def upsert_delivery_group_environment_policy(self, row: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO delivery_group_environment_policy (
-                delivery_group_id, environment_id, is_enabled, order_index
-            ) VALUES (?, ?, ?, ?)
-            ON CONFLICT(delivery_group_id, environment_id) DO UPDATE SET
-                is_enabled = excluded.is_enabled,
-                order_index = excluded.order_index
-            """,
-            (
-                row["delivery_group_id"],
-                row["environment_id"],
-                1 if row.get("is_enabled", True) else 0,
-                int(row["order_index"]),
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(_SQL_UPSERT_DG_ENV_POLICY, self._environment_policy_params(row))
         return row
 
-    def list_service_environment_routing(self, service_id: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT r.service_id, r.environment_id, r.recipe_id,
-                   e.display_name, e.type, e.lifecycle_state, e.is_enabled
-            FROM service_environment_routing r
-            LEFT JOIN environments e ON e.id = r.environment_id
-            WHERE r.service_id = ?
-            ORDER BY r.environment_id ASC
-            """,
-            (service_id,),
+    def _environment_policy_params(self, row: dict) -> tuple:
+        return (
+            row["delivery_group_id"],
+            row["environment_id"],
+            1 if row.get("is_enabled", True) else 0,
+            int(row["order_index"]),
         )
-        rows = cur.fetchall()
-        conn.close()
-        return [
-            {
-                "service_id": row["service_id"],
-                "environment_id": row["environment_id"],
-                "recipe_id": row["recipe_id"],
-                "display_name": row["display_name"],
-                "type": row["type"],
-                "lifecycle_state": _normalize_environment_lifecycle_state(
-                    row["lifecycle_state"] if "lifecycle_state" in row.keys() else None,
-                    bool(row["is_enabled"]) if row["is_enabled"] is not None else None,
-                ),
-            }
-            for row in rows
-        ]
 
-    def get_service_environment_routing(self, service_id: str, environment_id: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT r.service_id, r.environment_id, r.recipe_id,
-                   e.display_name, e.type, e.lifecycle_state, e.is_enabled
-            FROM service_environment_routing r
-            LEFT JOIN environments e ON e.id = r.environment_id
-            WHERE r.service_id = ? AND r.environment_id = ?
-            """,
-            (service_id, environment_id),
-        )
-        row = cur.fetchone()
-        conn.close()
-        if not row:
-            return None
+    def list_service_environment_routing(self, service_id: str) -> List[dict]:
+        return self.list_service_environment_routing_bulk([service_id])[service_id]
+
+    def list_service_environment_routing_bulk(self, service_ids: List[str]) -> Dict[str, List[dict]]:
+        routes: Dict[str, List[dict]] = defaultdict(list)
+        ids = list(dict.fromkeys(service_ids))
+        with self._ro_conn() as cur:
+            for start in range(0, len(ids), self.SQL_IN_CHUNK_SIZE):
+                chunk = ids[start : start + self.SQL_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur.execute(
+                    f"""
+                    SELECT r.service_id, r.environment_id, r.recipe_id,
+                           e.display_name, e.type, e.lifecycle_state, e.is_enabled
+                    FROM service_environment_routing r
+                    LEFT JOIN environments e ON e.id = r.environment_id
+                    WHERE r.service_id IN ({placeholders})
+                    ORDER BY r.service_id ASC, r.environment_id ASC
+                    """,
+                    tuple(chunk),
+                )
+                for row in cur.fetchall():
+                    routes[row["service_id"]].append(self._row_to_service_environment_routing(row))
+        return routes
+
+    def _row_to_service_environment_routing(self, row: sqlite3.Row) -> dict:
         return {
             "service_id": row["service_id"],
             "environment_id": row["environment_id"],
@@ -1569,41 +2019,53 @@ class Storage:
             ),
         }
 
+    def get_service_environment_routing(self, service_id: str, environment_id: str) -> Optional[dict]:
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT r.service_id, r.environment_id, r.recipe_id,
+                       e.display_name, e.type, e.lifecycle_state, e.is_enabled
+                FROM service_environment_routing r
+                LEFT JOIN environments e ON e.id = r.environment_id
+                WHERE r.service_id = ? AND r.environment_id = ?
+                """,
+                (service_id, environment_id),
+            )
+            row = cur.fetchone()
+        if not row:
+            return None
+        return self._row_to_service_environment_routing(row)
+
     def upsert_service_environment_routing(self, row: dict) -> dict:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO service_environment_routing (
-                service_id, environment_id, recipe_id
-            ) VALUES (?, ?, ?)
-            ON CONFLICT(service_id, environment_id) DO UPDATE SET
-                recipe_id = excluded.recipe_id
-            """,
-            (
-                row["service_id"],
-                row["environment_id"],
-                row["recipe_id"],
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                """
+                INSERT INTO service_environment_routing (
+                    service_id, environment_id, recipe_id
+                ) VALUES (?, ?, ?)
+                ON CONFLICT(service_id, environment_id) DO UPDATE SET
+                    recipe_id = excluded.recipe_id
+                """,
+                (
+                    row["service_id"],
+                    row["environment_id"],
+                    row["recipe_id"],
+                ),
+            )
         return row
 
     def list_service_environment_routing_for_environment(self, environment_id: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT service_id, environment_id, recipe_id
-            FROM service_environment_routing
-            WHERE environment_id = ?
-            ORDER BY service_id ASC
-            """,
-            (environment_id,),
-        )
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT service_id, environment_id, recipe_id
+                FROM service_environment_routing
+                WHERE environment_id = ?
+                ORDER BY service_id ASC
+                """,
+                (environment_id,),
+            )
+            rows = cur.fetchall()
         return [
             {
                 "service_id": row["service_id"],
@@ -1614,19 +2076,17 @@ class Storage:
         ]
 
     def list_delivery_group_environment_policy_for_environment(self, environment_id: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT delivery_group_id, environment_id, is_enabled, order_index
-            FROM delivery_group_environment_policy
-            WHERE environment_id = ?
-            ORDER BY delivery_group_id ASC
-            """,
-            (environment_id,),
-        )
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT delivery_group_id, environment_id, is_enabled, order_index
+                FROM delivery_group_environment_policy
+                WHERE environment_id = ?
+                ORDER BY delivery_group_id ASC
+                """,
+                (environment_id,),
+            )
+            rows = cur.fetchall()
         return [
             {
                 "delivery_group_id": row["delivery_group_id"],
@@ -1638,33 +2098,31 @@ class Storage:
         ]
 
     def list_delivery_groups_by_allowed_environment(self, environment_id: str) -> List[dict]:
-        matches = []
-        for group in self.list_delivery_groups():
-            allowed = group.get("allowed_environments")
-            if isinstance(allowed, list) and environment_id in allowed:
-                matches.append(
-                    {
-                        "delivery_group_id": group.get("id"),
-                        "environment_id": environment_id,
-                    }
-                )
-        matches.sort(key=lambda row: str(row.get("delivery_group_id") or ""))
-        return matches
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT id FROM delivery_groups
+                WHERE json_valid(allowed_environments) AND json_type(allowed_environments) = 'array'
+                  AND EXISTS (SELECT 1 FROM json_each(delivery_groups.allowed_environments) WHERE value = ?)
+                ORDER BY id ASC
+                """,
+                (environment_id,),
+            )
+            rows = cur.fetchall()
+        return [{"delivery_group_id": row["id"], "environment_id": environment_id} for row in rows]
 
     def list_deployments_for_environment(self, environment_id: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT id, service, environment, rollback_of
-            FROM deployments
-            WHERE environment = ?
-            ORDER BY created_at DESC, id DESC
-            """,
-            (environment_id,),
-        )
-        rows = cur.fetchall()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(
+                """
+                SELECT id, service, environment, rollback_of
+                FROM deployments
+                WHERE environment = ?
+                ORDER BY created_at DESC, id DESC
+                """,
+                (environment_id,),
+            )
+            rows = cur.fetchall()
         return [
             {
                 "id": row["id"],
@@ -1688,45 +2146,38 @@ class Storage:
         }
 
     def delete_environment(self, environment_id: str) -> bool:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM delivery_group_environment_policy WHERE environment_id = ?", (environment_id,))
-        cur.execute("DELETE FROM service_environment_routing WHERE environment_id = ?", (environment_id,))
-        cur.execute("DELETE FROM environments WHERE id = ?", (environment_id,))
-        deleted = cur.rowcount > 0
-        cur.execute("DELETE FROM admin_environments WHERE environment_id = ?", (environment_id,))
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute("DELETE FROM delivery_group_environment_policy WHERE environment_id = ?", (environment_id,))
+            cur.execute("DELETE FROM service_environment_routing WHERE environment_id = ?", (environment_id,))
+            cur.execute("DELETE FROM environments WHERE id = ?", (environment_id,))
+            deleted = cur.rowcount > 0
+            cur.execute("DELETE FROM admin_environments WHERE environment_id = ?", (environment_id,))
         return deleted
 
     def has_active_deployment(self) -> bool:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT id FROM deployments WHERE state IN (?, ?) LIMIT 1",
-            ("ACTIVE", "IN_PROGRESS"),
-        )
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(
+                "SELECT 1 FROM deployments WHERE state IN (?, ?) LIMIT 1",
+                ("ACTIVE", "IN_PROGRESS"),
+            )
+            row = cur.fetchone()
         return row is not None
 
     def count_active_deployments_for_group(self, group_id: str, environment: Optional[str] = None) -> int:
-        conn = self._connect()
-        cur = conn.cursor()
-        params = ["ACTIVE", "IN_PROGRESS", group_id]
-        env_clause = ""
-        if environment:
-            env_clause = " AND environment = ?"
-            params.append(environment)
-        query = (
-            "SELECT COUNT(1) AS total "
-            "FROM deployments "
-            "WHERE state IN (?, ?) AND delivery_group_id = ?"
-            f"{env_clause}"
-        )
-        cur.execute(query, tuple(params))
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            params = [group_id, "ACTIVE", "IN_PROGRESS"]
+            env_clause = ""
+            if environment:
+                env_clause = " AND environment = ?"
+                params.append(environment)
+            query = (
+                "SELECT COUNT(*) AS total "
+                "FROM deployments "
+                "WHERE delivery_group_id = ? AND state IN (?, ?)"
+                f"{env_clause}"
+            )
+            cur.execute(query, tuple(params))
+            row = cur.fetchone()
         return int(row["total"]) if row else 0
 
     def insert_deployment(self, record: dict, failures: List[dict]) -> None:
@@ -1742,48 +2193,38 @@ class Storage:
         engine_type = record.get("engine_type") or DEFAULT_ENGINE_TYPE
         actor_identity_json = _json_dumps_compact(record.get("actorIdentity"))
         policy_snapshot_json = _json_dumps_compact(record.get("policySnapshot"))
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO deployments (
-                id, service, environment, version, recipe_id, recipe_revision, effective_behavior_summary, state, deployment_kind, outcome,
-                intent_correlation_id, superseded_by, change_summary, created_at, updated_at,
-                engine_type, spinnaker_execution_id, spinnaker_execution_url, spinnaker_application, spinnaker_pipeline,
-                rollback_of, source_environment, delivery_group_id, actor_identity_json, policy_snapshot_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                record["id"],
-                record["service"],
-                record["environment"],
-                record["version"],
-                record.get("recipeId"),
-                record.get("recipeRevision"),
-                record.get("effectiveBehaviorSummary"),
-                record["state"],
-                deployment_kind,
-                outcome,
-                intent_correlation_id,
-                superseded_by,
-                record["changeSummary"],
-                record["createdAt"],
-                record["updatedAt"],
-                engine_type,
-                record["spinnakerExecutionId"],
-                record["spinnakerExecutionUrl"],
-                record.get("spinnakerApplication"),
-                record.get("spinnakerPipeline"),
-                record.get("rollbackOf"),
-                record.get("sourceEnvironment"),
-                record.get("deliveryGroupId"),
-                actor_identity_json,
-                policy_snapshot_json,
-            ),
-        )
-        self._replace_failures(cur, record["id"], failures)
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                _SQL_INSERT_DEPLOYMENT,
+                (
+                    record["id"],
+                    record["service"],
+                    record["environment"],
+                    record["version"],
+                    record.get("recipeId"),
+                    record.get("recipeRevision"),
+                    record.get("effectiveBehaviorSummary"),
+                    record["state"],
+                    deployment_kind,
+                    outcome,
+                    intent_correlation_id,
+                    superseded_by,
+                    record["changeSummary"],
+                    record["createdAt"],
+                    record["updatedAt"],
+                    engine_type,
+                    record["spinnakerExecutionId"],
+                    record["spinnakerExecutionUrl"],
+                    record.get("spinnakerApplication"),
+                    record.get("spinnakerPipeline"),
+                    record.get("rollbackOf"),
+                    record.get("sourceEnvironment"),
+                    record.get("deliveryGroupId"),
+                    actor_identity_json,
+                    policy_snapshot_json,
+                ),
+            )
+            self._replace_failures(cur, record["id"], failures)
         record["deploymentKind"] = deployment_kind
         record["outcome"] = outcome
         record["intentCorrelationId"] = intent_correlation_id
@@ -1800,58 +2241,51 @@ class Storage:
         outcome: Optional[str] = None,
         superseded_by: Optional[str] = None,
     ) -> None:
-        existing = self.get_deployment(deployment_id)
-        if existing:
-            existing_state = existing.get("state")
-            if existing_state in TERMINAL_DEPLOYMENT_STATES and state != existing_state:
-                raise ImmutableDeploymentError("Cannot change terminal deployment state")
+        with self._rw_conn() as cur:
+            existing = self._select_deployment_for_update(cur, deployment_id)
+            _assert_deployment_transition_allowed(existing, state, outcome)
+            updates = ["state = ?", "updated_at = ?"]
+            params = [state, utc_now()]
             if outcome is not None:
-                existing_outcome = existing.get("outcome") or base_outcome_from_state(existing_state)
-                if existing_outcome in TERMINAL_DEPLOYMENT_OUTCOMES and outcome != existing_outcome:
-                    raise ImmutableDeploymentError("Cannot change terminal deployment outcome")
-        conn = self._connect()
-        cur = conn.cursor()
-        updates = ["state = ?", "updated_at = ?"]
-        params = [state, utc_now()]
-        if outcome is not None:
-            updates.append("outcome = ?")
-            params.append(outcome)
-        if superseded_by is not None:
-            updates.append("superseded_by = ?")
-            params.append(superseded_by)
-        params.append(deployment_id)
-        cur.execute(
-            f"UPDATE deployments SET {', '.join(updates)} WHERE id = ?",
-            tuple(params),
-        )
-        self._replace_failures(cur, deployment_id, failures)
-        conn.commit()
-        conn.close()
-        current = self.get_deployment(deployment_id)
-        _assert_protected_fields_unchanged(existing, current)
+                updates.append("outcome = ?")
+                params.append(outcome)
+            if superseded_by is not None:
+                updates.append("superseded_by = ?")
+                params.append(superseded_by)
+            params.append(deployment_id)
+            cur.execute(
+                f"UPDATE deployments SET {', '.join(updates)} WHERE id = ? RETURNING {_DEPLOYMENT_SELECT}",
+                tuple(params),
+            )
+            current_row = cur.fetchone()
+            current = self._row_to_deployment(current_row, []) if current_row else None
+            self._replace_failures(cur, deployment_id, failures)
+            _assert_protected_fields_unchanged(existing, current)
 
     def update_deployment_superseded_by(self, deployment_id: str, superseded_by: Optional[str]) -> None:
-        existing = self.get_deployment(deployment_id)
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE deployments SET superseded_by = ?, updated_at = ? WHERE id = ?",
-            (superseded_by, utc_now(), deployment_id),
-        )
-        conn.commit()
-        conn.close()
-        current = self.get_deployment(deployment_id)
-        _assert_protected_fields_unchanged(existing, current)
+        with self._rw_conn() as cur:
+            existing = self._select_deployment_for_update(cur, deployment_id)
+            cur.execute(
+                f"UPDATE deployments SET superseded_by = ?, updated_at = ? WHERE id = ? RETURNING {_DEPLOYMENT_SELECT}",
+                (superseded_by, utc_now(), deployment_id),
+            )
+            current_row = cur.fetchone()
+            current = self._row_to_deployment(current_row, []) if current_row else None
+            _assert_protected_fields_unchanged(existing, current)
+
+    def _select_deployment_for_update(self, cur: sqlite3.Cursor, deployment_id: str) -> Optional[dict]:
+        # Protected-field checks never look at failures, so they are not loaded here.
+        cur.execute(_SQL_GET_DEPLOYMENT, (deployment_id,))
+        row = cur.fetchone()
+        return self._row_to_deployment(row, []) if row else None
 
     def _replace_failures(self, cur: sqlite3.Cursor, deployment_id: str, failures: List[dict]) -> None:
-        cur.execute("DELETE FROM failures WHERE deployment_id = ?", (deployment_id,))
-        for failure in failures:
-            cur.execute(
-                """
-                INSERT INTO failures (
-                    deployment_id, category, summary, detail, action_hint, observed_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        cur.execute(_SQL_DELETE_FAILURES, (deployment_id,))
+        if not failures:
+            return
+        cur.executemany(
+            _SQL_INSERT_FAILURE,
+            [
                 (
                     deployment_id,
                     failure.get("category"),
@@ -1859,19 +2293,18 @@ class Storage:
                     failure.get("detail"),
                     failure.get("actionHint"),
                     failure.get("observedAt"),
-                ),
-            )
+                )
+                for failure in failures
+            ],
+        )
 
     def get_deployment(self, deployment_id: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM deployments WHERE id = ?", (deployment_id,))
-        row = cur.fetchone()
-        if not row:
-            conn.close()
-            return None
-        failures = self._get_failures(cur, deployment_id)
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_GET_DEPLOYMENT, (deployment_id,))
+            row = cur.fetchone()
+            if not row:
+                return None
+            failures = self._get_failures(cur, deployment_id)
         return self._row_to_deployment(row, failures)
 
     def list_deployments(
@@ -1879,78 +2312,66 @@ class Storage:
         service: Optional[str],
         state: Optional[str],
         environment: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        query = "SELECT * FROM deployments"
-        params = []
-        conditions = []
-        if service:
-            conditions.append("service = ?")
-            params.append(service)
-        if environment:
-            conditions.append("environment = ?")
-            params.append(environment)
-        if state:
-            conditions.append("state = ?")
-            params.append(state)
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-        query += " ORDER BY created_at DESC, id DESC"
-        cur.execute(query, tuple(params))
-        rows = cur.fetchall()
-        deployments = []
-        for row in rows:
-            failures = self._get_failures(cur, row["id"])
-            deployments.append(self._row_to_deployment(row, failures))
-        conn.close()
-        return deployments
+        with self._ro_conn() as cur:
+            query = f"SELECT {_DEPLOYMENT_SELECT} FROM deployments"
+            params = []
+            conditions = []
+            if service:
+                conditions.append("service = ?")
+                params.append(service)
+            if environment:
+                conditions.append("environment = ?")
+                params.append(environment)
+            if state:
+                conditions.append("state = ?")
+                params.append(state)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY created_at DESC, id DESC"
+            if limit is not None or offset:
+                # SQLite only accepts OFFSET after a LIMIT; -1 means no limit.
+                query += " LIMIT ? OFFSET ?"
+                params.extend((-1 if limit is None else limit, offset))
+            cur.execute(query, tuple(params))
+            rows = cur.fetchall()
+            failures_by_id = self._get_failures_by_deployment(cur, [row[0] for row in rows])
+        return [self._row_to_deployment(row, failures_by_id[row[0]]) for row in rows]
 
     def _get_failures(self, cur: sqlite3.Cursor, deployment_id: str) -> List[dict]:
-        cur.execute("SELECT * FROM failures WHERE deployment_id = ?", (deployment_id,))
-        rows = cur.fetchall()
-        failures = []
-        for row in rows:
-            failures.append(
-                {
-                    "category": row["category"],
-                    "summary": row["summary"],
-                    "detail": row["detail"],
-                    "actionHint": row["action_hint"],
-                    "observedAt": row["observed_at"],
-                }
+        cur.execute(_SQL_GET_FAILURES, (deployment_id,))
+        return [self._row_to_failure(row) for row in cur.fetchall()]
+
+    def _row_to_failure(self, row: sqlite3.Row) -> dict:
+        return dict(zip(_FAILURE_KEYS, row))
+
+    def _get_failures_by_deployment(self, cur: sqlite3.Cursor, deployment_ids: List[str]) -> Dict[str, List[dict]]:
+        failures_by_id: Dict[str, List[dict]] = defaultdict(list)
+        for start in range(0, len(deployment_ids), self.SQL_IN_CHUNK_SIZE):
+            chunk = deployment_ids[start : start + self.SQL_IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            cur.execute(
+                f"""
+                SELECT deployment_id, {_FAILURE_SELECT}
+                FROM failures
+                WHERE deployment_id IN ({placeholders})
+                ORDER BY id ASC
+                """,
+                tuple(chunk),
             )
-        return failures
+            for row in cur.fetchall():
+                failures_by_id[row[0]].append(self._row_to_failure(row[1:]))
+        return failures_by_id
 
     def _row_to_deployment(self, row: sqlite3.Row, failures: List[dict]) -> dict:
-        return {
-            "id": row["id"],
-            "service": row["service"],
-            "environment": row["environment"],
-            "version": row["version"],
-            "recipeId": row["recipe_id"],
-            "recipeRevision": row["recipe_revision"],
-            "effectiveBehaviorSummary": row["effective_behavior_summary"],
-            "state": row["state"],
-            "deploymentKind": row["deployment_kind"],
-            "outcome": row["outcome"],
-            "intentCorrelationId": row["intent_correlation_id"],
-            "supersededBy": row["superseded_by"],
-            "changeSummary": row["change_summary"],
-            "createdAt": row["created_at"],
-            "updatedAt": row["updated_at"],
-            "engine_type": row["engine_type"] or DEFAULT_ENGINE_TYPE,
-            "spinnakerExecutionId": row["spinnaker_execution_id"],
-            "spinnakerExecutionUrl": row["spinnaker_execution_url"],
-            "spinnakerApplication": row["spinnaker_application"],
-            "spinnakerPipeline": row["spinnaker_pipeline"],
-            "rollbackOf": row["rollback_of"],
-            "sourceEnvironment": row["source_environment"],
-            "deliveryGroupId": row["delivery_group_id"],
-            "actorIdentity": _json_loads_safe(row["actor_identity_json"]),
-            "policySnapshot": _json_loads_safe(row["policy_snapshot_json"]),
-            "failures": failures,
-        }
+        deployment = dict(zip(_DEPLOYMENT_KEYS, row))
+        deployment["engine_type"] = deployment["engine_type"] or DEFAULT_ENGINE_TYPE
+        deployment["actorIdentity"] = _json_loads_safe(deployment["actorIdentity"])
+        deployment["policySnapshot"] = _json_loads_safe(deployment["policySnapshot"])
+        deployment["failures"] = failures
+        return deployment
 
     def apply_supersession(self, record: dict) -> None:
         if record.get("state") != "SUCCEEDED":
@@ -1959,62 +2380,54 @@ class Storage:
         if not service:
             return
         environment = record.get("environment")
-        deployments = self.list_deployments(service, None, environment)
-        latest_success = None
-        for deployment in deployments:
-            if deployment.get("state") == "SUCCEEDED":
-                latest_success = deployment
-                break
-        if not latest_success:
+        latest_success_id = self._latest_successful_deployment_id(service, environment)
+        if not latest_success_id:
             return
-        if latest_success.get("id") != record.get("id"):
-            self.update_deployment_superseded_by(record["id"], latest_success.get("id"))
+        if latest_success_id != record.get("id"):
+            self.update_deployment_superseded_by(record["id"], latest_success_id)
             return
-        for deployment in deployments:
-            if deployment.get("state") == "SUCCEEDED" and deployment.get("id") != record.get("id"):
-                self.update_deployment_superseded_by(deployment["id"], record.get("id"))
-                break
+        prior_success_id = self._latest_successful_deployment_id(service, environment, exclude_id=record.get("id"))
+        if prior_success_id:
+            self.update_deployment_superseded_by(prior_success_id, record.get("id"))
+
+    def _latest_successful_deployment_id(
+        self,
+        service: str,
+        environment: Optional[str],
+        exclude_id: Optional[str] = None,
+    ) -> Optional[str]:
+        conditions = ["service = ?", "state = ?"]
+        params = [service, "SUCCEEDED"]
+        if environment:
+            conditions.append("environment = ?")
+            params.append(environment)
+        if exclude_id:
+            conditions.append("id != ?")
+            params.append(exclude_id)
+        with self._ro_conn() as cur:
+            cur.execute(
+                f"SELECT id FROM deployments WHERE {' AND '.join(conditions)} ORDER BY created_at DESC, id DESC LIMIT 1",
+                tuple(params),
+            )
+            row = cur.fetchone()
+        return row["id"] if row else None
 
     def find_prior_successful_deployment(self, deployment_id: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM deployments WHERE id = ?", (deployment_id,))
-        target = cur.fetchone()
-        if not target:
-            conn.close()
-            return None
-        cur.execute(
-            """
-            SELECT * FROM deployments
-            WHERE service = ? AND environment = ? AND state = ? AND created_at < ?
-            ORDER BY created_at DESC
-            LIMIT 1
-            """,
-            (target["service"], target["environment"], "SUCCEEDED", target["created_at"]),
-        )
-        row = cur.fetchone()
-        if not row:
-            conn.close()
-            return None
-        failures = self._get_failures(cur, row["id"])
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_FIND_PRIOR_SUCCESSFUL_DEPLOYMENT, (deployment_id, "SUCCEEDED"))
+            row = cur.fetchone()
+            if not row:
+                return None
+            failures = self._get_failures(cur, row["id"])
         return self._row_to_deployment(row, failures)
 
     def insert_upload_capability(self, service: str, version: str, size_bytes: int, sha256: str, content_type: str, expires_at: str, token: str) -> dict:
         cap_id = str(uuid.uuid4())
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO build_upload_caps (
-                id, service, version, expected_size_bytes, expected_sha256,
-                expected_content_type, token, expires_at, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (cap_id, service, version, size_bytes, sha256, content_type, token, expires_at, utc_now()),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(
+                _SQL_INSERT_UPLOAD_CAPABILITY,
+                (cap_id, service, version, size_bytes, sha256, content_type, token, expires_at, utc_now()),
+            )
         return {
             "id": cap_id,
             "service": service,
@@ -2027,181 +2440,178 @@ class Storage:
         }
 
     def find_upload_capability(self, service: str, version: str, size_bytes: int, sha256: str, content_type: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT * FROM build_upload_caps
-            WHERE service = ? AND version = ? AND expected_size_bytes = ?
-              AND expected_sha256 = ? AND expected_content_type = ?
-            """,
-            (service, version, size_bytes, sha256, content_type),
-        )
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_FIND_UPLOAD_CAPABILITY, (service, version, size_bytes, sha256, content_type))
+            row = cur.fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "expiresAt": row["expires_at"],
-            "token": row["token"],
-        }
+        return dict(zip(_UPLOAD_CAPABILITY_MATCH_KEYS, row))
 
     def delete_upload_capability(self, cap_id: str) -> None:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM build_upload_caps WHERE id = ?", (cap_id,))
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(_SQL_DELETE_UPLOAD_CAPABILITY, (cap_id,))
 
     def insert_build(self, record: dict) -> dict:
         build_id = str(uuid.uuid4())
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO builds (
-                id, service, version, artifact_ref, git_sha, git_branch, ci_publisher, ci_provider, ci_run_id, built_at,
-                sha256, size_bytes, content_type, checksum_sha256, repo, actor, commit_url, run_url, registered_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                build_id,
-                record["service"],
-                record["version"],
-                record["artifactRef"],
-                record.get("git_sha"),
-                record.get("git_branch"),
-                record.get("ci_publisher"),
-                record.get("ci_provider"),
-                record.get("ci_run_id"),
-                record.get("built_at"),
-                record["sha256"],
-                record["sizeBytes"],
-                record["contentType"],
-                record.get("checksum_sha256"),
-                record.get("repo"),
-                record.get("actor"),
-                record.get("commit_url"),
-                record.get("run_url"),
-                record["registeredAt"],
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._rw_conn() as cur:
+            cur.execute(_SQL_INSERT_BUILD, (build_id, *map(record.get, _BUILD_RECORD_KEYS)))
         record["id"] = build_id
         return record
 
     def find_latest_build(self, service: str, version: str) -> Optional[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT * FROM builds
-            WHERE service = ? AND version = ?
-            ORDER BY registered_at DESC
-            LIMIT 1
-            """,
-            (service, version),
-        )
-        row = cur.fetchone()
-        conn.close()
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_FIND_LATEST_BUILD, (service, version))
+            row = cur.fetchone()
         if not row:
             return None
-        return {
-            "id": row["id"],
-            "service": row["service"],
-            "version": row["version"],
-            "artifactRef": row["artifact_ref"],
-            "git_sha": row["git_sha"],
-            "git_branch": row["git_branch"],
-            "ci_publisher": row["ci_publisher"],
-            "ci_provider": row["ci_provider"],
-            "ci_run_id": row["ci_run_id"],
-            "built_at": row["built_at"],
-            "sha256": row["sha256"],
-            "sizeBytes": row["size_bytes"],
-            "contentType": row["content_type"],
-            "checksum_sha256": row["checksum_sha256"],
-            "repo": row["repo"],
-            "actor": row["actor"],
-            "commit_url": row["commit_url"],
-            "run_url": row["run_url"],
-            "registeredAt": row["registered_at"],
-        }
+        return _row_to_build(row)
 
     def list_builds_for_service(self, service: str) -> List[dict]:
-        conn = self._connect()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT * FROM builds
-            WHERE service = ?
-            ORDER BY registered_at DESC
-            """,
-            (service,),
-        )
-        rows = cur.fetchall()
-        conn.close()
-        return [
-            {
-                "id": row["id"],
-                "service": row["service"],
-                "version": row["version"],
-                "artifactRef": row["artifact_ref"],
-                "git_sha": row["git_sha"],
-                "git_branch": row["git_branch"],
-                "ci_publisher": row["ci_publisher"],
-                "ci_provider": row["ci_provider"],
-                "ci_run_id": row["ci_run_id"],
-                "built_at": row["built_at"],
-                "sha256": row["sha256"],
-                "sizeBytes": row["size_bytes"],
-                "contentType": row["content_type"],
-                "checksum_sha256": row["checksum_sha256"],
-                "repo": row["repo"],
-                "actor": row["actor"],
-                "commit_url": row["commit_url"],
-                "run_url": row["run_url"],
-                "registeredAt": row["registered_at"],
-            }
-            for row in rows
-        ]
+        with self._ro_conn() as cur:
+            cur.execute(_SQL_LIST_BUILDS_FOR_SERVICE, (service,))
+            rows = cur.fetchall()
+        return [_row_to_build(row) for row in rows]
+
+    def list_builds_for_service_page(self, service: str, limit: int = 50, cursor: Optional[str] = None) -> dict:
+        clauses = ["service = ?"]
+        params = [service]
+        if cursor:
+            clauses.append("(registered_at, id) < (?, ?)")
+            params.extend(_decode_page_cursor(cursor, 2))
+        params.append(limit + 1)
+        with self._ro_conn() as cur:
+            cur.execute(
+                f"""
+                SELECT {_BUILD_SELECT} FROM builds
+                WHERE {' AND '.join(clauses)}
+                ORDER BY registered_at DESC, id DESC
+                LIMIT ?
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+        return _page_result([_row_to_build(row) for row in rows[:limit]], len(rows) > limit, "registeredAt", "id")
 
 
 class DynamoStorage:
+    BATCH_GET_MAX_KEYS = 100
+    BATCH_GET_MAX_BACKOFF_SECONDS = 1.0
+    # Short enough that edits made through another API instance show up quickly.
+    ADMIN_ENVIRONMENT_CACHE_TTL_SECONDS = 30.0
+    LISTING_CACHE_TTL_SECONDS = 30.0
+    CLIENT_MAX_POOL_CONNECTIONS = 50
+    CLIENT_MAX_ATTEMPTS = 10
+    # gsi1pk = "BUILD#<service>", gsi1sk = "<version>#<registeredAt>"; see cdk/lib/data-stack.ts.
+    BUILD_INDEX_NAME = "GSI1"
+    # gsi2pk = "DEPLOYMENT#<service>#<environment>", gsi2sk = "<createdAt>#<id>".
+    DEPLOYMENT_INDEX_NAME = "GSI2"
+    # Deployment items store the API keys as-is, except the delivery group id.
+    DEPLOYMENT_ATTRIBUTES = tuple("delivery_group_id" if key == "deliveryGroupId" else key for key in _DEPLOYMENT_KEYS)
+    PRIOR_DEPLOYMENT_ATTRIBUTES = (
+        "id",
+        "service",
+        "environment",
+        "version",
+        "recipeId",
+        "recipeRevision",
+        "effectiveBehaviorSummary",
+        "state",
+        "deploymentKind",
+        "outcome",
+        "intentCorrelationId",
+        "supersededBy",
+        "changeSummary",
+        "createdAt",
+        "updatedAt",
+        "spinnakerExecutionId",
+        "spinnakerExecutionUrl",
+        "spinnakerApplication",
+        "spinnakerPipeline",
+        "rollbackOf",
+        "failures",
+    )
+
     def __init__(self, table_name: str) -> None:
         if not boto3:
             raise RuntimeError("boto3 is required for DynamoDB storage")
-        self.table = boto3.resource("dynamodb").Table(table_name)
+        # One session and config for both handles, so they share credentials resolution, keep-alive
+        # connections and adaptive retry (client-side rate limiting on throttles).
+        session = boto3.session.Session()
+        config = BotoConfig(
+            retries={"mode": "adaptive", "max_attempts": self.CLIENT_MAX_ATTEMPTS},
+            max_pool_connections=self.CLIENT_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+        )
+        self.table = session.resource("dynamodb", config=config).Table(table_name)
+        # Plain client for hot writes: table.meta.client carries the resource layer's (de)serialization hooks.
+        self._client = session.client("dynamodb", config=config)
+        self._serialize = TypeSerializer().serialize
+        self._admin_environment_cache: Dict[str, tuple] = {}
+        self._listing_cache: Dict[str, tuple] = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # Each DynamoDB write is committed on its own; this keeps callers backend-agnostic.
+        yield
 
     def _dec(self, value: int) -> Decimal:
+        # Decimal(int) is exact; only other types go through str() so floats keep their short repr.
+        if type(value) is int:
+            return Decimal(value)
         return Decimal(str(value))
 
+    def _cached_listing(self, name: str, load) -> List[dict]:
+        # Services and delivery groups are read on most requests but change rarely.
+        entry = self._listing_cache.get(name)
+        now = time.monotonic()
+        if entry is None or now - entry[0] >= self.LISTING_CACHE_TTL_SECONDS:
+            entry = (now, load())
+            self._listing_cache[name] = entry
+        # Container fields are copied too: group membership lists must not be shared with the cached entry.
+        return [
+            {key: copy.copy(value) if isinstance(value, (dict, list)) else value for key, value in row.items()}
+            for row in entry[1]
+        ]
+
     def list_services(self) -> List[dict]:
-        response = self.table.query(KeyConditionExpression=Key("pk").eq("SERVICE"))
-        items = response.get("Items", [])
+        return self._cached_listing("services", self._load_services)
+
+    def _load_services(self) -> List[dict]:
+        items = list(self._query_partition("SERVICE"))
         ssm_cache: dict = {}
-        services = []
-        for item in items:
-            services.append(
-                {
-                    "service_name": item.get("service_name"),
-                    "allowed_environments": item.get("allowed_environments", []),
-                    "allowed_recipes": item.get("allowed_recipes", []),
-                    "allowed_artifact_sources": item.get("allowed_artifact_sources", []),
-                    "stable_service_url_template": _resolve_ssm_template(
-                        item.get("stable_service_url_template"),
-                        ssm_cache,
-                    ),
-                    "backstage_entity_ref": item.get("backstage_entity_ref"),
-                    "backstage_entity_url": _resolve_ssm_template(
-                        item.get("backstage_entity_url_template"),
-                        ssm_cache,
-                    ),
-                }
-            )
-        return sorted([s for s in services if s.get("service_name")], key=lambda item: item["service_name"])
+        _prefetch_ssm_parameters(
+            (item.get(field) for item in items for field in ("stable_service_url_template", "backstage_entity_url_template")),
+            ssm_cache,
+        )
+        return sorted(
+            (self._service_from_item(item, ssm_cache) for item in items if item.get("service_name")),
+            key=itemgetter("service_name"),
+        )
+
+    def _list_service_names(self) -> List[str]:
+        # Projected read: skips the other attributes and the SSM template resolution list_services would do.
+        return sorted(
+            item["service_name"]
+            for item in self._query_partition("SERVICE", attributes=("service_name",))
+            if item.get("service_name")
+        )
+
+    def _service_from_item(self, item: dict, ssm_cache: dict) -> dict:
+        return {
+            "service_name": item.get("service_name"),
+            "allowed_environments": item.get("allowed_environments", []),
+            "allowed_recipes": item.get("allowed_recipes", []),
+            "allowed_artifact_sources": item.get("allowed_artifact_sources", []),
+            "stable_service_url_template": _resolve_ssm_template(
+                item.get("stable_service_url_template"),
+                ssm_cache,
+            ),
+            "backstage_entity_ref": item.get("backstage_entity_ref"),
+            "backstage_entity_url": _resolve_ssm_template(
+                item.get("backstage_entity_url_template"),
+                ssm_cache,
+            ),
+        }
 
     def get_service(self, service_name: str) -> Optional[dict]:
         response = self.table.get_item(Key={"pk": "SERVICE", "sk": service_name})
@@ -2218,37 +2628,87 @@ class DynamoStorage:
             "backstage_entity_url": item.get("backstage_entity_url"),
         }
 
-    def _scan_delivery_groups(self, limit: Optional[int] = None) -> List[dict]:
-        params = {
-            "FilterExpression": Attr("pk").eq("DELIVERY_GROUP"),
-        }
-        if limit:
-            params["Limit"] = limit
-        response = self.table.scan(**params)
-        return response.get("Items", [])
+    def _query_partition(
+        self,
+        pk: str,
+        sk_prefix: Optional[str] = None,
+        filter_expression=None,
+        limit: Optional[int] = None,
+        attributes: Optional[tuple] = None,
+    ) -> Iterator[dict]:
+        # Every entity type lives in its own partition, so a Query only reads (and bills) matching items.
+        key_condition = Key("pk").eq(pk)
+        if sk_prefix is not None:
+            key_condition = key_condition & Key("sk").begins_with(sk_prefix)
+        params = {"KeyConditionExpression": key_condition}
+        if filter_expression is not None:
+            params["FilterExpression"] = filter_expression
+        if attributes:
+            params.update(self._projection(attributes))
+        return self._paginate(self.table.query, limit=limit, **params)
+
+    def _projection(self, attributes: tuple) -> dict:
+        # Placeholders for every name, since several attributes (state, environment) are reserved words.
+        return {
+            "ProjectionExpression": ", ".join(f"#{name}" for name in attributes),
+            "ExpressionAttributeNames": {f"#{name}": name for name in attributes},
+        }
+
+    def _paginate(self, operation, limit: Optional[int] = None, **params) -> Iterator[dict]:
+        # Follows LastEvaluatedKey so results past the 1MB page are not dropped; limit caps the items yielded.
+        if limit:
+            params["Limit"] = limit
+        remaining = limit
+        while True:
+            response = operation(**params)
+            for item in response.get("Items", []):
+                yield item
+                if remaining:
+                    remaining -= 1
+                    if not remaining:
+                        return
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return
+            params["ExclusiveStartKey"] = last_evaluated_key
+
+    def _batch_get_items(self, keys: List[dict]) -> List[dict]:
+        client = self.table.meta.client
+        items = []
+        for start in range(0, len(keys), self.BATCH_GET_MAX_KEYS):
+            request = {self.table.name: {"Keys": keys[start : start + self.BATCH_GET_MAX_KEYS]}}
+            attempt = 0
+            while request:
+                if attempt:
+                    time.sleep(min(0.05 * (2 ** attempt), self.BATCH_GET_MAX_BACKOFF_SECONDS))
+                response = client.batch_get_item(RequestItems=request)
+                items.extend(response.get("Responses", {}).get(self.table.name, []))
+                request = response.get("UnprocessedKeys") or None
+                attempt += 1
+        return items
+
+    def _scan_delivery_groups(self, limit: Optional[int] = None) -> Iterator[dict]:
+        return self._query_partition("DELIVERY_GROUP", limit=limit)
+
+    def _delivery_group_from_item(self, item: dict) -> dict:
+        group = {column: item.get(column) for column in _DELIVERY_GROUP_COLUMNS}
+        group["services"] = item.get("services", [])
+        group["allowed_recipes"] = item.get("allowed_recipes", [])
+        return group
+
+    def _delivery_group_item(self, group: dict) -> dict:
+        item = {"pk": "DELIVERY_GROUP", "sk": group["id"]}
+        item.update((column, group.get(column)) for column in _DELIVERY_GROUP_COLUMNS)
+        item["services"] = group.get("services", [])
+        item["allowed_recipes"] = group.get("allowed_recipes", [])
+        return item
 
     def list_delivery_groups(self) -> List[dict]:
-        items = self._scan_delivery_groups()
-        groups = []
-        for item in items:
-            groups.append(
-                {
-                    "id": item.get("id"),
-                    "name": item.get("name"),
-                    "description": item.get("description"),
-                    "owner": item.get("owner"),
-                    "services": item.get("services", []),
-                    "allowed_environments": item.get("allowed_environments"),
-                    "allowed_recipes": item.get("allowed_recipes", []),
-                    "guardrails": item.get("guardrails"),
-                    "created_at": item.get("created_at"),
-                    "created_by": item.get("created_by"),
-                    "updated_at": item.get("updated_at"),
-                    "updated_by": item.get("updated_by"),
-                    "last_change_reason": item.get("last_change_reason"),
-                }
-            )
-        groups.sort(key=lambda g: g.get("name", ""))
+        return self._cached_listing("delivery_groups", self._load_delivery_groups)
+
+    def _load_delivery_groups(self) -> List[dict]:
+        groups = [self._delivery_group_from_item(item) for item in self._scan_delivery_groups()]
+        groups.sort(key=itemgetter("name"))
         return groups
 
     def get_delivery_group(self, group_id: str) -> Optional[dict]:
@@ -2256,37 +2716,17 @@ class DynamoStorage:
         item = response.get("Item")
         if not item:
             return None
-        return {
-            "id": item.get("id"),
-            "name": item.get("name"),
-            "description": item.get("description"),
-            "owner": item.get("owner"),
-            "services": item.get("services", []),
-            "allowed_environments": item.get("allowed_environments"),
-            "allowed_recipes": item.get("allowed_recipes", []),
-            "guardrails": item.get("guardrails"),
-            "created_at": item.get("created_at"),
-            "created_by": item.get("created_by"),
-            "updated_at": item.get("updated_at"),
-            "updated_by": item.get("updated_by"),
-            "last_change_reason": item.get("last_change_reason"),
-        }
+        return self._delivery_group_from_item(item)
 
     def get_delivery_group_for_service(self, service_name: str) -> Optional[dict]:
-        for group in self.list_delivery_groups():
-            services = group.get("services", [])
-            if service_name in services:
-                return group
-        return None
+        # Groups are listed by name, so the first match wins as in the SQLite lookup.
+        return next(
+            (group for group in self.list_delivery_groups() if service_name in (group.get("services") or [])),
+            None,
+        )
 
-    def _scan_environments(self, limit: Optional[int] = None) -> List[dict]:
-        params = {
-            "FilterExpression": Attr("pk").eq("ENVIRONMENT"),
-        }
-        if limit:
-            params["Limit"] = limit
-        response = self.table.scan(**params)
-        return response.get("Items", [])
+    def _scan_environments(self, limit: Optional[int] = None) -> Iterator[dict]:
+        return self._query_partition("ENVIRONMENT", limit=limit)
 
     def _environment_from_item(self, item: dict) -> dict:
         lifecycle_state = _normalize_environment_lifecycle_state(
@@ -2318,7 +2758,7 @@ class DynamoStorage:
 
     def list_environments(self) -> List[dict]:
         rows = [self._environment_from_item(item) for item in self._scan_environments()]
-        rows.sort(key=lambda env: env.get("name", ""))
+        rows.sort(key=itemgetter("name"))
         return rows
 
     def get_environment(self, environment_id: str) -> Optional[dict]:
@@ -2457,9 +2897,44 @@ class DynamoStorage:
         ]
 
     def get_admin_environment(self, environment_id: str) -> Optional[dict]:
+        cached = self._cached_admin_environment(environment_id)
+        if cached is not None:
+            return cached
         item = self.get_environment(environment_id)
         if not item:
             return None
+        environment = self._admin_environment_from_environment(item)
+        self._admin_environment_cache[environment_id] = (time.monotonic(), environment)
+        return dict(environment)
+
+    def _get_admin_environments(self, environment_ids) -> Dict[str, dict]:
+        environments = {}
+        missing = []
+        for environment_id in sorted(set(environment_ids)):
+            cached = self._cached_admin_environment(environment_id)
+            if cached is not None:
+                environments[environment_id] = cached
+            else:
+                missing.append(environment_id)
+        if missing:
+            now = time.monotonic()
+            for item in self._batch_get_items([{"pk": "ENVIRONMENT", "sk": environment_id} for environment_id in missing]):
+                environment = self._admin_environment_from_environment(self._environment_from_item(item))
+                self._admin_environment_cache[item["sk"]] = (now, environment)
+                environments[item["sk"]] = dict(environment)
+        return environments
+
+    def _cached_admin_environment(self, environment_id: str) -> Optional[dict]:
+        entry = self._admin_environment_cache.get(environment_id)
+        if entry is None:
+            return None
+        fetched_at, environment = entry
+        if time.monotonic() - fetched_at >= self.ADMIN_ENVIRONMENT_CACHE_TTL_SECONDS:
+            self._admin_environment_cache.pop(environment_id, None)
+            return None
+        return dict(environment)
+
+    def _admin_environment_from_environment(self, item: dict) -> dict:
         return {
             "environment_id": item.get("id"),
             "display_name": item.get("display_name"),
@@ -2492,6 +2967,7 @@ class DynamoStorage:
             Item=item,
             ConditionExpression="attribute_not_exists(pk) AND attribute_not_exists(sk)",
         )
+        self._admin_environment_cache.clear()
         return environment
 
     def update_admin_environment(self, environment: dict) -> dict:
@@ -2520,33 +2996,38 @@ class DynamoStorage:
             "updated_at": environment["updated_at"],
         }
         self.table.put_item(Item=item)
+        self._admin_environment_cache.clear()
         return environment
 
     def list_delivery_group_environment_policy(self, delivery_group_id: str) -> List[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("DG_ENV_POLICY") & Attr("delivery_group_id").eq(delivery_group_id)
+        items = list(self._query_partition("DG_ENV_POLICY", sk_prefix=f"{delivery_group_id}#"))
+        environments = self._get_admin_environments(
+            item["environment_id"] for item in items if item.get("environment_id")
         )
-        items = response.get("Items", [])
-        rows = []
-        for item in items:
-            env_id = item.get("environment_id")
-            env = self.get_admin_environment(env_id) if env_id else None
-            rows.append(
-                {
-                    "delivery_group_id": item.get("delivery_group_id"),
-                    "environment_id": env_id,
-                    "is_enabled": bool(item.get("is_enabled", True)),
-                    "order_index": int(item.get("order_index", 0)),
-                    "display_name": env.get("display_name") if env else None,
-                    "type": env.get("type") if env else None,
-                    "lifecycle_state": env.get("lifecycle_state") if env else None,
-                }
-            )
-        rows.sort(key=lambda row: (row.get("order_index", 0), row.get("environment_id", "")))
+        rows = [self._environment_policy_from_item(item, environments.get(item.get("environment_id"))) for item in items]
+        rows.sort(key=itemgetter("order_index", "environment_id"))
         return rows
 
+    def _environment_policy_from_item(self, item: dict, env: Optional[dict]) -> dict:
+        return {
+            "delivery_group_id": item.get("delivery_group_id"),
+            "environment_id": item.get("environment_id"),
+            "is_enabled": bool(item.get("is_enabled", True)),
+            "order_index": int(item.get("order_index", 0)),
+            "display_name": env.get("display_name") if env else None,
+            "type": env.get("type") if env else None,
+            "lifecycle_state": env.get("lifecycle_state") if env else None,
+        }
+
+    def list_delivery_group_environment_policy_bulk(self, delivery_group_ids: List[str]) -> Dict[str, List[dict]]:
+        return {group_id: self.list_delivery_group_environment_policy(group_id) for group_id in delivery_group_ids}
+
     def upsert_delivery_group_environment_policy(self, row: dict) -> dict:
-        item = {
+        self.table.put_item(Item=self._environment_policy_item(row))
+        return row
+
+    def _environment_policy_item(self, row: dict) -> dict:
+        return {
             "pk": "DG_ENV_POLICY",
             "sk": f"{row['delivery_group_id']}#{row['environment_id']}",
             "delivery_group_id": row["delivery_group_id"],
@@ -2554,37 +3035,30 @@ class DynamoStorage:
             "is_enabled": row.get("is_enabled", True),
             "order_index": int(row["order_index"]),
         }
-        self.table.put_item(Item=item)
-        return row
 
     def list_service_environment_routing(self, service_id: str) -> List[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("SERVICE_ENV_ROUTING") & Attr("service_id").eq(service_id)
+        items = list(self._query_partition("SERVICE_ENV_ROUTING", sk_prefix=f"{service_id}#"))
+        environments = self._get_admin_environments(
+            item["environment_id"] for item in items if item.get("environment_id")
         )
-        items = response.get("Items", [])
-        rows = []
-        for item in items:
-            env_id = item.get("environment_id")
-            env = self.get_admin_environment(env_id) if env_id else None
-            rows.append(
-                {
-                    "service_id": item.get("service_id"),
-                    "environment_id": env_id,
-                    "recipe_id": item.get("recipe_id"),
-                    "display_name": env.get("display_name") if env else None,
-                    "type": env.get("type") if env else None,
-                    "lifecycle_state": env.get("lifecycle_state") if env else None,
-                }
-            )
-        rows.sort(key=lambda row: row.get("environment_id", ""))
+        rows = [
+            self._service_environment_routing_from_item(item, environments.get(item.get("environment_id")))
+            for item in items
+        ]
+        rows.sort(key=itemgetter("environment_id"))
         return rows
 
+    def list_service_environment_routing_bulk(self, service_ids: List[str]) -> Dict[str, List[dict]]:
+        return {service_id: self.list_service_environment_routing(service_id) for service_id in service_ids}
+
     def get_service_environment_routing(self, service_id: str, environment_id: str) -> Optional[dict]:
         response = self.table.get_item(Key={"pk": "SERVICE_ENV_ROUTING", "sk": f"{service_id}#{environment_id}"})
         item = response.get("Item")
         if not item:
             return None
-        env = self.get_admin_environment(environment_id)
+        return self._service_environment_routing_from_item(item, self.get_admin_environment(environment_id))
+
+    def _service_environment_routing_from_item(self, item: dict, env: Optional[dict]) -> dict:
         return {
             "service_id": item.get("service_id"),
             "environment_id": item.get("environment_id"),
@@ -2606,10 +3080,10 @@ class DynamoStorage:
         return row
 
     def list_service_environment_routing_for_environment(self, environment_id: str) -> List[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("SERVICE_ENV_ROUTING") & Attr("environment_id").eq(environment_id)
+        items = self._query_partition(
+            "SERVICE_ENV_ROUTING",
+            filter_expression=Attr("environment_id").eq(environment_id),
         )
-        items = response.get("Items", [])
         rows = [
             {
                 "service_id": item.get("service_id"),
@@ -2622,10 +3096,10 @@ class DynamoStorage:
         return rows
 
     def list_delivery_group_environment_policy_for_environment(self, environment_id: str) -> List[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("DG_ENV_POLICY") & Attr("environment_id").eq(environment_id)
+        items = self._query_partition(
+            "DG_ENV_POLICY",
+            filter_expression=Attr("environment_id").eq(environment_id),
         )
-        items = response.get("Items", [])
         rows = [
             {
                 "delivery_group_id": item.get("delivery_group_id"),
@@ -2639,24 +3113,19 @@ class DynamoStorage:
         return rows
 
     def list_delivery_groups_by_allowed_environment(self, environment_id: str) -> List[dict]:
-        matches = []
-        for group in self.list_delivery_groups():
-            allowed = group.get("allowed_environments")
-            if isinstance(allowed, list) and environment_id in allowed:
-                matches.append(
-                    {
-                        "delivery_group_id": group.get("id"),
-                        "environment_id": environment_id,
-                    }
-                )
+        matches = [
+            {"delivery_group_id": group.get("id"), "environment_id": environment_id}
+            for group in self.list_delivery_groups()
+            if isinstance(group.get("allowed_environments"), list) and environment_id in group["allowed_environments"]
+        ]
         matches.sort(key=lambda row: str(row.get("delivery_group_id") or ""))
         return matches
 
     def list_deployments_for_environment(self, environment_id: str) -> List[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("DEPLOYMENT") & Attr("environment").eq(environment_id)
+        items = self._paginate(
+            self.table.scan,
+            FilterExpression=Attr("pk").eq("DEPLOYMENT") & Attr("environment").eq(environment_id),
         )
-        items = response.get("Items", [])
         rows = [
             {
                 "id": item.get("id"),
@@ -2678,6 +3147,7 @@ class DynamoStorage:
         }
 
     def normalize_legacy_environment_identities(self) -> int:
+        self._admin_environment_cache.clear()
         repaired = 0
         for item in list(self._scan_environments()):
             legacy_id = item.get("id") or item.get("sk")
@@ -2753,10 +3223,13 @@ class DynamoStorage:
                     }
                 )
 
-            deployment_items = self.table.scan(
-                FilterExpression=Attr("pk").eq("DEPLOYMENT")
-                & (Attr("environment").eq(legacy_id) | Attr("sourceEnvironment").eq(legacy_id))
-            ).get("Items", [])
+            deployment_items = list(
+                self._paginate(
+                    self.table.scan,
+                    FilterExpression=Attr("pk").eq("DEPLOYMENT")
+                    & (Attr("environment").eq(legacy_id) | Attr("sourceEnvironment").eq(legacy_id)),
+                )
+            )
             for deployment in deployment_items:
                 updated = dict(deployment)
                 if updated.get("environment") == legacy_id:
@@ -2771,6 +3244,7 @@ class DynamoStorage:
     def delete_environment(self, environment_id: str) -> bool:
         deleted = self.get_environment(environment_id) is not None
         self.table.delete_item(Key={"pk": "ENVIRONMENT", "sk": environment_id})
+        self._admin_environment_cache.clear()
         self.table.delete_item(Key={"pk": "ADMIN_ENVIRONMENT", "sk": environment_id})
         for row in self.list_delivery_groups():
             self.table.delete_item(Key={"pk": "DG_ENV_POLICY", "sk": f"{row['id']}#{environment_id}"})
@@ -2781,46 +3255,14 @@ class DynamoStorage:
         return deleted
 
     def insert_delivery_group(self, group: dict) -> dict:
-        item = {
-            "pk": "DELIVERY_GROUP",
-            "sk": group["id"],
-            "id": group["id"],
-            "name": group["name"],
-            "description": group.get("description"),
-            "owner": group.get("owner"),
-            "services": group.get("services", []),
-            "allowed_environments": group.get("allowed_environments"),
-            "allowed_recipes": group.get("allowed_recipes", []),
-            "guardrails": group.get("guardrails"),
-            "created_at": group.get("created_at"),
-            "created_by": group.get("created_by"),
-            "updated_at": group.get("updated_at"),
-            "updated_by": group.get("updated_by"),
-            "last_change_reason": group.get("last_change_reason"),
-        }
-        self.table.put_item(Item=item)
+        self.table.put_item(Item=self._delivery_group_item(group))
+        self._listing_cache.pop("delivery_groups", None)
         self._ensure_group_environments(group)
         return group
 
     def update_delivery_group(self, group: dict) -> dict:
-        item = {
-            "pk": "DELIVERY_GROUP",
-            "sk": group["id"],
-            "id": group["id"],
-            "name": group["name"],
-            "description": group.get("description"),
-            "owner": group.get("owner"),
-            "services": group.get("services", []),
-            "allowed_environments": group.get("allowed_environments"),
-            "allowed_recipes": group.get("allowed_recipes", []),
-            "guardrails": group.get("guardrails"),
-            "created_at": group.get("created_at"),
-            "created_by": group.get("created_by"),
-            "updated_at": group.get("updated_at"),
-            "updated_by": group.get("updated_by"),
-            "last_change_reason": group.get("last_change_reason"),
-        }
-        self.table.put_item(Item=item)
+        self.table.put_item(Item=self._delivery_group_item(group))
+        self._listing_cache.pop("delivery_groups", None)
         self._ensure_group_environments(group)
         return group
 
@@ -2832,10 +3274,12 @@ class DynamoStorage:
         if not isinstance(allowed, list):
             return
         now = utc_now()
+        existing = {item.get("id") or item.get("sk") for item in self._scan_environments()}
+        policies = []
         for index, env_name in enumerate(allowed):
             if not isinstance(env_name, str) or not env_name.strip():
                 continue
-            if not self.get_environment(env_name):
+            if env_name not in existing:
                 self.insert_admin_environment(
                     {
                         "environment_id": env_name,
@@ -2846,7 +3290,8 @@ class DynamoStorage:
                         "updated_at": now,
                     }
                 )
-            self.upsert_delivery_group_environment_policy(
+                existing.add(env_name)
+            policies.append(
                 {
                     "delivery_group_id": group["id"],
                     "environment_id": env_name,
@@ -2854,50 +3299,15 @@ class DynamoStorage:
                     "order_index": index + 1,
                 }
             )
+        # Environment creation stays conditional; the unconditional policy puts are flushed 25 at a time.
+        with self.table.batch_writer(overwrite_by_pkeys=["pk", "sk"]) as batch:
+            for row in policies:
+                batch.put_item(Item=self._environment_policy_item(row))
 
-    def _scan_recipes(self, limit: Optional[int] = None) -> List[dict]:
-        params = {
-            "FilterExpression": Attr("pk").eq("RECIPE"),
-        }
-        if limit:
-            params["Limit"] = limit
-        response = self.table.scan(**params)
-        return response.get("Items", [])
-
-    def list_recipes(self) -> List[dict]:
-        items = self._scan_recipes()
-        recipes = []
-        for item in items:
-            recipe_revision = item.get("recipe_revision") or 1
-            effective_behavior_summary = item.get("effective_behavior_summary") or "No behavior summary provided."
-            recipes.append(
-                {
-                    "id": item.get("id"),
-                    "name": item.get("name"),
-                    "description": item.get("description"),
-                    "allowed_parameters": item.get("allowed_parameters", []),
-                    "engine_type": item.get("engine_type") or DEFAULT_ENGINE_TYPE,
-                    "spinnaker_application": item.get("spinnaker_application"),
-                    "deploy_pipeline": item.get("deploy_pipeline"),
-                    "rollback_pipeline": item.get("rollback_pipeline"),
-                    "recipe_revision": recipe_revision,
-                    "effective_behavior_summary": effective_behavior_summary,
-                    "status": item.get("status") or "active",
-                    "created_at": item.get("created_at"),
-                    "created_by": item.get("created_by"),
-                    "updated_at": item.get("updated_at"),
-                    "updated_by": item.get("updated_by"),
-                    "last_change_reason": item.get("last_change_reason"),
-                }
-            )
-        recipes.sort(key=lambda r: r.get("name", ""))
-        return recipes
+    def _scan_recipes(self, limit: Optional[int] = None) -> Iterator[dict]:
+        return self._query_partition("RECIPE", limit=limit)
 
-    def get_recipe(self, recipe_id: str) -> Optional[dict]:
-        response = self.table.get_item(Key={"pk": "RECIPE", "sk": recipe_id})
-        item = response.get("Item")
-        if not item:
-            return None
+    def _recipe_from_item(self, item: dict) -> dict:
         recipe_revision = item.get("recipe_revision") or 1
         effective_behavior_summary = item.get("effective_behavior_summary") or "No behavior summary provided."
         return {
@@ -2919,14 +3329,30 @@ class DynamoStorage:
             "last_change_reason": item.get("last_change_reason"),
         }
 
+    def list_recipes(self) -> List[dict]:
+        recipes = [self._recipe_from_item(item) for item in self._scan_recipes()]
+        recipes.sort(key=itemgetter("name"))
+        return recipes
+
+    def get_recipe(self, recipe_id: str) -> Optional[dict]:
+        response = self.table.get_item(Key={"pk": "RECIPE", "sk": recipe_id})
+        item = response.get("Item")
+        if not item:
+            return None
+        return self._recipe_from_item(item)
+
+    def get_recipes_bulk(self, recipe_ids: List[str]) -> Dict[str, dict]:
+        keys = [{"pk": "RECIPE", "sk": recipe_id} for recipe_id in dict.fromkeys(recipe_ids)]
+        return {item["sk"]: self._recipe_from_item(item) for item in self._batch_get_items(keys)}
+
     def delete_recipe(self, recipe_id: str) -> None:
         self.table.delete_item(Key={"pk": "RECIPE", "sk": recipe_id})
 
     def list_service_environment_routing_by_recipe(self, recipe_id: str) -> List[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("SERVICE_ENV_ROUTING") & Attr("recipe_id").eq(recipe_id)
+        items = self._query_partition(
+            "SERVICE_ENV_ROUTING",
+            filter_expression=Attr("recipe_id").eq(recipe_id),
         )
-        items = response.get("Items", [])
         rows = [
             {
                 "service_id": item.get("service_id"),
@@ -2939,96 +3365,38 @@ class DynamoStorage:
         return rows
 
     def list_delivery_groups_by_allowed_recipe(self, recipe_id: str) -> List[dict]:
-        groups = []
-        for group in self.list_delivery_groups():
-            allowed = group.get("allowed_recipes") or []
-            if recipe_id in allowed:
-                groups.append(
-                    {
-                        "id": group.get("id"),
-                        "name": group.get("name"),
-                    }
-                )
+        groups = [
+            {"id": group.get("id"), "name": group.get("name")}
+            for group in self.list_delivery_groups()
+            if recipe_id in (group.get("allowed_recipes") or [])
+        ]
         groups.sort(key=lambda row: row.get("id") or "")
         return groups
 
     def insert_recipe(self, recipe: dict) -> dict:
-        recipe_revision = recipe.get("recipe_revision") or 1
-        effective_behavior_summary = recipe.get("effective_behavior_summary") or "No behavior summary provided."
-        engine_type = recipe.get("engine_type") or DEFAULT_ENGINE_TYPE
-        item = {
-            "pk": "RECIPE",
-            "sk": recipe["id"],
-            "id": recipe["id"],
-            "name": recipe["name"],
-            "description": recipe.get("description"),
-            "allowed_parameters": recipe.get("allowed_parameters", []),
-            "engine_type": engine_type,
-            "spinnaker_application": recipe.get("spinnaker_application"),
-            "deploy_pipeline": recipe.get("deploy_pipeline"),
-            "rollback_pipeline": recipe.get("rollback_pipeline"),
-            "recipe_revision": recipe_revision,
-            "effective_behavior_summary": effective_behavior_summary,
-            "status": recipe.get("status", "active"),
-            "created_at": recipe.get("created_at"),
-            "created_by": recipe.get("created_by"),
-            "updated_at": recipe.get("updated_at"),
-            "updated_by": recipe.get("updated_by"),
-            "last_change_reason": recipe.get("last_change_reason"),
-        }
-        self.table.put_item(Item=item)
-        recipe["recipe_revision"] = recipe_revision
-        recipe["effective_behavior_summary"] = effective_behavior_summary
-        recipe["engine_type"] = engine_type
-        return recipe
+        return self._put_recipe(recipe)
 
     def update_recipe(self, recipe: dict) -> dict:
-        recipe_revision = recipe.get("recipe_revision") or 1
-        effective_behavior_summary = recipe.get("effective_behavior_summary") or "No behavior summary provided."
-        engine_type = recipe.get("engine_type") or DEFAULT_ENGINE_TYPE
-        item = {
-            "pk": "RECIPE",
-            "sk": recipe["id"],
-            "id": recipe["id"],
-            "name": recipe["name"],
-            "description": recipe.get("description"),
-            "allowed_parameters": recipe.get("allowed_parameters", []),
-            "engine_type": engine_type,
-            "spinnaker_application": recipe.get("spinnaker_application"),
-            "deploy_pipeline": recipe.get("deploy_pipeline"),
-            "rollback_pipeline": recipe.get("rollback_pipeline"),
-            "recipe_revision": recipe_revision,
-            "effective_behavior_summary": effective_behavior_summary,
-            "status": recipe.get("status", "active"),
-            "created_at": recipe.get("created_at"),
-            "created_by": recipe.get("created_by"),
-            "updated_at": recipe.get("updated_at"),
-            "updated_by": recipe.get("updated_by"),
-            "last_change_reason": recipe.get("last_change_reason"),
-        }
+        return self._put_recipe(recipe)
+
+    def _put_recipe(self, recipe: dict) -> dict:
+        recipe["recipe_revision"] = recipe.get("recipe_revision") or 1
+        recipe["effective_behavior_summary"] = recipe.get("effective_behavior_summary") or "No behavior summary provided."
+        recipe["engine_type"] = recipe.get("engine_type") or DEFAULT_ENGINE_TYPE
+        item = {"pk": "RECIPE", "sk": recipe["id"]}
+        item.update((column, recipe.get(column)) for column in _RECIPE_COLUMNS)
+        item["allowed_parameters"] = recipe.get("allowed_parameters", [])
+        item["status"] = recipe.get("status", "active")
         self.table.put_item(Item=item)
-        recipe["recipe_revision"] = recipe_revision
-        recipe["effective_behavior_summary"] = effective_behavior_summary
-        recipe["engine_type"] = engine_type
         return recipe
 
     def insert_audit_event(self, event: dict) -> dict:
         item = {
             "pk": "AUDIT_EVENT",
             "sk": f"{event['timestamp']}#{event['event_id']}",
-            "event_id": event["event_id"],
-            "event_type": event["event_type"],
-            "actor_id": event["actor_id"],
-            "actor_role": event["actor_role"],
-            "target_type": event["target_type"],
-            "target_id": event["target_id"],
-            "timestamp": event["timestamp"],
-            "outcome": event["outcome"],
-            "summary": event["summary"],
-            "delivery_group_id": event.get("delivery_group_id"),
-            "service_name": event.get("service_name"),
-            "environment": event.get("environment"),
         }
+        item.update(zip(_AUDIT_EVENT_COLUMNS, _audit_event_required_values(event)))
+        item.update(zip(_AUDIT_EVENT_OPTIONAL_COLUMNS, map(event.get, _AUDIT_EVENT_OPTIONAL_COLUMNS)))
         self.table.put_item(Item=item)
         return event
 
@@ -3040,29 +3408,51 @@ class DynamoStorage:
         end_time: Optional[str] = None,
         limit: int = 200,
     ) -> List[dict]:
+        return self.list_audit_events_page(
+            event_type=event_type,
+            delivery_group_id=delivery_group_id,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+        )["items"]
+
+    def list_audit_events_page(
+        self,
+        event_type: Optional[str] = None,
+        delivery_group_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: int = 200,
+        cursor: Optional[str] = None,
+    ) -> dict:
+        # sk is "<timestamp>#<event_id>", so the time window is a key range and newest-first is a reverse Query.
+        key_condition = Key("pk").eq("AUDIT_EVENT")
+        if start_time and end_time:
+            key_condition = key_condition & Key("sk").between(start_time, f"{end_time}#\uffff")
+        elif start_time:
+            key_condition = key_condition & Key("sk").gte(start_time)
+        elif end_time:
+            key_condition = key_condition & Key("sk").lte(f"{end_time}#\uffff")
+        params = {"KeyConditionExpression": key_condition, "ScanIndexForward": False, "Limit": limit + 1}
+        filter_expression = None
+        for attribute, value in (("event_type", event_type), ("delivery_group_id", delivery_group_id)):
+            if value:
+                condition = Attr(attribute).eq(value)
+                filter_expression = condition if filter_expression is None else filter_expression & condition
+        if filter_expression is not None:
+            params["FilterExpression"] = filter_expression
+        if cursor:
+            timestamp, event_id = _decode_page_cursor(cursor, 2)
+            params["ExclusiveStartKey"] = {"pk": "AUDIT_EVENT", "sk": f"{timestamp}#{event_id}"}
         items = []
-        scan_kwargs = {"FilterExpression": Attr("pk").eq("AUDIT_EVENT")}
-        while True:
-            response = self.table.scan(**scan_kwargs)
+        while len(items) <= limit:
+            response = self.table.query(**params)
             items.extend(response.get("Items", []))
             last_evaluated_key = response.get("LastEvaluatedKey")
             if not last_evaluated_key:
                 break
-            scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
-        filtered = []
-        for item in items:
-            if event_type and item.get("event_type") != event_type:
-                continue
-            if delivery_group_id and item.get("delivery_group_id") != delivery_group_id:
-                continue
-            ts = item.get("timestamp")
-            if start_time and ts and ts < start_time:
-                continue
-            if end_time and ts and ts > end_time:
-                continue
-            filtered.append(item)
-        filtered.sort(key=lambda entry: entry.get("timestamp", ""), reverse=True)
-        return filtered[:limit]
+            params["ExclusiveStartKey"] = last_evaluated_key
+        return _page_result(items[:limit], len(items) > limit, "timestamp", "event_id")
 
     def ensure_default_delivery_group(self) -> Optional[dict]:
         try:
@@ -3073,11 +3463,11 @@ class DynamoStorage:
             if existing:
                 return None
         except Exception:
-            existing = self._scan_delivery_groups(limit=1)
+            existing = next(self._scan_delivery_groups(limit=1), None)
             if existing:
                 return None
         now = utc_now()
-        services = [entry["service_name"] for entry in self.list_services() if entry.get("service_name")]
+        services = self._list_service_names()
         group = {
             "id": "default",
             "name": "Default Delivery Group",
@@ -3092,30 +3482,14 @@ class DynamoStorage:
             "updated_at": now,
             "updated_by": "system",
         }
-        item = {
-            "pk": "DELIVERY_GROUP",
-            "sk": group["id"],
-            "id": group["id"],
-            "name": group["name"],
-            "description": group.get("description"),
-            "owner": group.get("owner"),
-            "services": group.get("services", []),
-            "allowed_environments": group.get("allowed_environments"),
-            "allowed_recipes": group.get("allowed_recipes", []),
-            "guardrails": group.get("guardrails"),
-            "created_at": group.get("created_at"),
-            "created_by": group.get("created_by"),
-            "updated_at": group.get("updated_at"),
-            "updated_by": group.get("updated_by"),
-            "last_change_reason": group.get("last_change_reason"),
-        }
         try:
             self.table.put_item(
-                Item=item,
+                Item=self._delivery_group_item(group),
                 ConditionExpression="attribute_not_exists(pk) AND attribute_not_exists(sk)",
             )
         except Exception:
             return None
+        self._listing_cache.pop("delivery_groups", None)
         return group
 
     def ensure_default_environments(self) -> List[dict]:
@@ -3123,13 +3497,16 @@ class DynamoStorage:
             return []
         now = utc_now()
         created = []
+        # The table had no environments, so only the ones created below can exist.
+        seeded = set()
+        policies = []
         for group in self.list_delivery_groups():
             configured = group.get("allowed_environments")
             env_names = configured if isinstance(configured, list) and configured else ["sandbox"]
             for index, env_name in enumerate(env_names):
                 if not isinstance(env_name, str) or not env_name.strip():
                     continue
-                if not self.get_environment(env_name):
+                if env_name not in seeded:
                     self.insert_admin_environment(
                         {
                             "environment_id": env_name,
@@ -3140,8 +3517,9 @@ class DynamoStorage:
                             "updated_at": now,
                         }
                     )
+                    seeded.add(env_name)
                     created.append(self.get_environment(env_name))
-                self.upsert_delivery_group_environment_policy(
+                policies.append(
                     {
                         "delivery_group_id": group["id"],
                         "environment_id": env_name,
@@ -3149,66 +3527,23 @@ class DynamoStorage:
                         "order_index": index + 1,
                     }
                 )
+        with self.table.batch_writer(overwrite_by_pkeys=["pk", "sk"]) as batch:
+            for row in policies:
+                batch.put_item(Item=self._environment_policy_item(row))
         return created
 
     def ensure_default_recipe(self) -> Optional[dict]:
         now = utc_now()
         recipes = [
-            {
-                "id": "default",
-                "name": "Standard",
-                "description": "Standard deploy recipe for demo deployments",
-                "allowed_parameters": [],
-                "engine_type": DEFAULT_ENGINE_TYPE,
-                "spinnaker_application": "demo-app",
-                "deploy_pipeline": "demo-deploy",
-                "rollback_pipeline": "rollback-demo-service",
-                "recipe_revision": 1,
-                "effective_behavior_summary": "Standard roll-forward deploy with rollback support.",
-                "status": "active",
-                "created_at": now,
-                "created_by": "system",
-                "updated_at": now,
-                "updated_by": "system",
-            },
-            {
-                "id": "canary",
-                "name": "Canary",
-                "description": "Canary deploy recipe with automated verification.",
-                "allowed_parameters": [],
-                "engine_type": DEFAULT_ENGINE_TYPE,
-                "spinnaker_application": "demo-app",
-                "deploy_pipeline": "demo-deploy-canary",
-                "rollback_pipeline": "rollback-demo-service",
-                "recipe_revision": 1,
-                "effective_behavior_summary": "Progressive rollout with verification and rollback on failed analysis.",
-                "status": "active",
-                "created_at": now,
-                "created_by": "system",
-                "updated_at": now,
-                "updated_by": "system",
-            },
-            {
-                "id": "bluegreen",
-                "name": "BlueGreen",
-                "description": "Blue/green deploy recipe with controlled cutover.",
-                "allowed_parameters": [],
-                "engine_type": DEFAULT_ENGINE_TYPE,
-                "spinnaker_application": "demo-app",
-                "deploy_pipeline": "demo-deploy-bluegreen",
-                "rollback_pipeline": "rollback-demo-service",
-                "recipe_revision": 1,
-                "effective_behavior_summary": "Parallel rollout with cutover and rollback capability.",
-                "status": "active",
-                "created_at": now,
-                "created_by": "system",
-                "updated_at": now,
-                "updated_by": "system",
-            },
+            {**template, "allowed_parameters": [], "created_at": now, "updated_at": now}
+            for template in _DEFAULT_RECIPE_TEMPLATES
         ]
+        existing = {
+            item.get("sk") for item in self._batch_get_items([{"pk": "RECIPE", "sk": recipe["id"]} for recipe in recipes])
+        }
         created = None
         for recipe in recipes:
-            if self.get_recipe(recipe["id"]):
+            if recipe["id"] in existing:
                 continue
             self.insert_recipe(recipe)
             if created is None:
@@ -3240,22 +3575,26 @@ class DynamoStorage:
         return created
 
     def has_active_deployment(self) -> bool:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("DEPLOYMENT") & Attr("state").is_in(["ACTIVE", "IN_PROGRESS"]),
-            Limit=1,
-        )
-        return response.get("Count", 0) > 0
+        active = self._query_partition("DEPLOYMENT", filter_expression=Attr("state").is_in(["ACTIVE", "IN_PROGRESS"]))
+        return next(active, None) is not None
 
     def count_active_deployments_for_group(self, group_id: str, environment: Optional[str] = None) -> int:
-        filter_expression = (
-            Attr("pk").eq("DEPLOYMENT")
-            & Attr("state").is_in(["ACTIVE", "IN_PROGRESS"])
-            & Attr("delivery_group_id").eq(group_id)
-        )
+        filter_expression = Attr("state").is_in(["ACTIVE", "IN_PROGRESS"]) & Attr("delivery_group_id").eq(group_id)
         if environment:
             filter_expression = filter_expression & Attr("environment").eq(environment)
-        response = self.table.scan(FilterExpression=filter_expression)
-        return int(response.get("Count", 0))
+        params = {
+            "KeyConditionExpression": Key("pk").eq("DEPLOYMENT"),
+            "FilterExpression": filter_expression,
+            "Select": "COUNT",
+        }
+        total = 0
+        while True:
+            response = self.table.query(**params)
+            total += int(response.get("Count", 0))
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return total
+            params["ExclusiveStartKey"] = last_evaluated_key
 
     def insert_deployment(self, record: dict, failures: List[dict]) -> None:
         deployment_kind = normalize_deployment_kind(
@@ -3298,16 +3637,12 @@ class DynamoStorage:
             "policySnapshot": record.get("policySnapshot"),
             "failures": failures,
         }
+        item.update(self._deployment_index_keys(item))
         try:
-            self.table.put_item(
-                Item=item,
-                ConditionExpression="attribute_not_exists(pk) AND attribute_not_exists(sk)",
-            )
+            self._put_item(item, ConditionExpression="attribute_not_exists(pk) AND attribute_not_exists(sk)")
         except Exception as exc:
-            if ClientError is not None and isinstance(exc, ClientError):
-                error_code = (exc.response.get("Error") or {}).get("Code")
-                if error_code == "ConditionalCheckFailedException":
-                    raise ImmutableDeploymentError("Deployment record already exists and cannot be replaced") from exc
+            if self._conditional_check_failed(exc):
+                raise ImmutableDeploymentError("Deployment record already exists and cannot be replaced") from exc
             raise
         record["deploymentKind"] = deployment_kind
         record["outcome"] = outcome
@@ -3325,136 +3660,115 @@ class DynamoStorage:
         outcome: Optional[str] = None,
         superseded_by: Optional[str] = None,
     ) -> None:
-        existing = self.get_deployment(deployment_id)
-        if existing:
-            existing_state = existing.get("state")
-            if existing_state in TERMINAL_DEPLOYMENT_STATES and state != existing_state:
-                raise ImmutableDeploymentError("Cannot change terminal deployment state")
-            if outcome is not None:
-                existing_outcome = existing.get("outcome") or base_outcome_from_state(existing_state)
-                if existing_outcome in TERMINAL_DEPLOYMENT_OUTCOMES and outcome != existing_outcome:
-                    raise ImmutableDeploymentError("Cannot change terminal deployment outcome")
-        updates = ["#state = :state", "updatedAt = :updatedAt", "failures = :failures"]
+        # The terminal-state guard runs server-side, and protected fields are never written, so the
+        # happy path is a single conditional write; the item is only read back to explain a rejection.
         values = {
             ":state": state,
             ":updatedAt": utc_now(),
             ":failures": failures,
+            **_DDB_TERMINAL_STATE_VALUES,
         }
-        names = {"#state": "state"}
         if outcome is not None:
-            updates.append("outcome = :outcome")
-            values[":outcome"] = outcome
+            values.update(_DDB_TERMINAL_OUTCOME_VALUES)
+            values.update({":outcome": outcome, ":stringType": "S", ":zero": 0})
         if superseded_by is not None:
-            updates.append("supersededBy = :supersededBy")
             values[":supersededBy"] = superseded_by
-        self.table.update_item(
-            Key={"pk": "DEPLOYMENT", "sk": deployment_id},
-            UpdateExpression=f"SET {', '.join(updates)}",
-            ExpressionAttributeNames=names,
-            ExpressionAttributeValues=values,
-        )
-        current = self.get_deployment(deployment_id)
-        _assert_protected_fields_unchanged(existing, current)
+        try:
+            self._update_deployment_item(
+                deployment_id,
+                _deployment_update_expression(outcome is not None, superseded_by is not None),
+                values,
+                ConditionExpression=_deployment_update_condition(outcome is not None),
+                ExpressionAttributeNames={"#state": "state"},
+            )
+        except Exception as exc:
+            if not self._conditional_check_failed(exc):
+                raise
+            existing = self.get_deployment(deployment_id)
+            if existing is None:
+                return
+            _assert_deployment_transition_allowed(existing, state, outcome)
+            raise ImmutableDeploymentError("Deployment changed during update") from exc
 
     def update_deployment_superseded_by(self, deployment_id: str, superseded_by: Optional[str]) -> None:
-        existing = self.get_deployment(deployment_id)
-        self.table.update_item(
-            Key={"pk": "DEPLOYMENT", "sk": deployment_id},
-            UpdateExpression="SET supersededBy = :supersededBy, updatedAt = :updatedAt",
-            ExpressionAttributeValues={
-                ":supersededBy": superseded_by,
-                ":updatedAt": utc_now(),
-            },
+        # Protected fields are not in the update, so no read-back is needed; the condition keeps this
+        # from creating a stub item for an unknown id, matching the SQLite UPDATE.
+        try:
+            self._update_deployment_item(
+                deployment_id,
+                _DDB_SET_SUPERSEDED_BY,
+                {":supersededBy": superseded_by, ":updatedAt": utc_now()},
+                ConditionExpression="attribute_exists(pk)",
+            )
+        except Exception as exc:
+            if self._conditional_check_failed(exc):
+                return
+            raise
+
+    def _put_item(self, item: dict, **params) -> None:
+        # Same TypeSerializer the resource layer would use, minus its per-call request transformation.
+        self._client.put_item(
+            TableName=self.table.name,
+            Item={name: self._serialize(value) for name, value in item.items()},
+            **params,
+        )
+
+    def _update_deployment_item(self, deployment_id: str, update_expression: str, values: dict, **params) -> None:
+        # Deployment updates run on every state transition, so they skip the resource layer and reuse
+        # prebuilt expressions.
+        self._client.update_item(
+            TableName=self.table.name,
+            Key={"pk": {"S": "DEPLOYMENT"}, "sk": {"S": deployment_id}},
+            UpdateExpression=update_expression,
+            ExpressionAttributeValues={name: self._serialize(value) for name, value in values.items()},
+            **params,
         )
-        current = self.get_deployment(deployment_id)
-        _assert_protected_fields_unchanged(existing, current)
+
+    def _conditional_check_failed(self, exc: Exception) -> bool:
+        if ClientError is None or not isinstance(exc, ClientError):
+            return False
+        return (exc.response.get("Error") or {}).get("Code") == "ConditionalCheckFailedException"
 
     def get_deployment(self, deployment_id: str) -> Optional[dict]:
         response = self.table.get_item(Key={"pk": "DEPLOYMENT", "sk": deployment_id})
         item = response.get("Item")
         if not item:
             return None
-        return {
-            "id": item.get("id"),
-            "service": item.get("service"),
-            "environment": item.get("environment"),
-            "version": item.get("version"),
-            "recipeId": item.get("recipeId"),
-            "recipeRevision": item.get("recipeRevision"),
-            "effectiveBehaviorSummary": item.get("effectiveBehaviorSummary"),
-            "state": item.get("state"),
-            "deploymentKind": item.get("deploymentKind"),
-            "outcome": item.get("outcome"),
-            "intentCorrelationId": item.get("intentCorrelationId"),
-            "supersededBy": item.get("supersededBy"),
-            "changeSummary": item.get("changeSummary"),
-            "createdAt": item.get("createdAt"),
-            "updatedAt": item.get("updatedAt"),
-            "engine_type": item.get("engine_type") or DEFAULT_ENGINE_TYPE,
-            "spinnakerExecutionId": item.get("spinnakerExecutionId"),
-            "spinnakerExecutionUrl": item.get("spinnakerExecutionUrl"),
-            "spinnakerApplication": item.get("spinnakerApplication"),
-            "spinnakerPipeline": item.get("spinnakerPipeline"),
-            "rollbackOf": item.get("rollbackOf"),
-            "sourceEnvironment": item.get("sourceEnvironment"),
-            "deliveryGroupId": item.get("delivery_group_id"),
-            "actorIdentity": item.get("actorIdentity"),
-            "policySnapshot": item.get("policySnapshot"),
-            "failures": item.get("failures", []),
-        }
+        return self._deployment_from_item(item)
+
+    def _deployment_from_item(self, item: dict) -> dict:
+        deployment = dict(zip(_DEPLOYMENT_KEYS, map(item.get, self.DEPLOYMENT_ATTRIBUTES)))
+        deployment["engine_type"] = deployment["engine_type"] or DEFAULT_ENGINE_TYPE
+        deployment["failures"] = item.get("failures", [])
+        return deployment
 
     def list_deployments(
         self,
         service: Optional[str],
         state: Optional[str],
         environment: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[dict]:
-        response = self.table.query(KeyConditionExpression=Key("pk").eq("DEPLOYMENT"))
-        items = response.get("Items", [])
-        deployments = []
-        for item in items:
-            if service and item.get("service") != service:
-                continue
-            if environment and item.get("environment") != environment:
-                continue
-            if state and item.get("state") != state:
-                continue
-            deployments.append(
-                {
-                    "id": item.get("id"),
-                    "service": item.get("service"),
-                    "environment": item.get("environment"),
-                    "version": item.get("version"),
-                    "recipeId": item.get("recipeId"),
-                    "recipeRevision": item.get("recipeRevision"),
-                    "effectiveBehaviorSummary": item.get("effectiveBehaviorSummary"),
-                    "state": item.get("state"),
-                    "deploymentKind": item.get("deploymentKind"),
-                    "outcome": item.get("outcome"),
-                    "intentCorrelationId": item.get("intentCorrelationId"),
-                    "supersededBy": item.get("supersededBy"),
-                    "changeSummary": item.get("changeSummary"),
-                    "createdAt": item.get("createdAt"),
-                    "updatedAt": item.get("updatedAt"),
-                    "engine_type": item.get("engine_type") or DEFAULT_ENGINE_TYPE,
-                    "spinnakerExecutionId": item.get("spinnakerExecutionId"),
-                    "spinnakerExecutionUrl": item.get("spinnakerExecutionUrl"),
-                    "spinnakerApplication": item.get("spinnakerApplication"),
-                    "spinnakerPipeline": item.get("spinnakerPipeline"),
-                    "rollbackOf": item.get("rollbackOf"),
-                    "sourceEnvironment": item.get("sourceEnvironment"),
-                    "deliveryGroupId": item.get("delivery_group_id"),
-                    "actorIdentity": item.get("actorIdentity"),
-                    "policySnapshot": item.get("policySnapshot"),
-                    "failures": item.get("failures", []),
-                }
-            )
-        deployments.sort(
-            key=lambda d: (d.get("createdAt", ""), d.get("id", "")),
-            reverse=True,
-        )
+        deployments = list(self._iter_deployments(service, state, environment))
+        deployments.sort(key=itemgetter("createdAt", "id"), reverse=True)
+        if limit is not None or offset:
+            return deployments[offset : None if limit is None else offset + limit]
         return deployments
 
+    def _iter_deployments(
+        self,
+        service: Optional[str],
+        state: Optional[str],
+        environment: Optional[str] = None,
+    ) -> Iterator[dict]:
+        filter_expression = None
+        for attribute, value in (("service", service), ("environment", environment), ("state", state)):
+            if value:
+                condition = Attr(attribute).eq(value)
+                filter_expression = condition if filter_expression is None else filter_expression & condition
+        return map(self._deployment_from_item, self._query_partition("DEPLOYMENT", filter_expression=filter_expression))
+
     def apply_supersession(self, record: dict) -> None:
         if record.get("state") != "SUCCEEDED":
             return
@@ -3462,67 +3776,93 @@ class DynamoStorage:
         if not service:
             return
         environment = record.get("environment")
-        deployments = self.list_deployments(service, None, environment)
-        latest_success = None
-        for deployment in deployments:
-            if deployment.get("state") == "SUCCEEDED":
-                latest_success = deployment
-                break
-        if not latest_success:
-            return
+        # Only the two newest successes matter: the latest one and, if that is this record, the one before it.
+        if environment:
+            candidates = itertools.islice(self._iter_recent_successes(service, environment), 2)
+        else:
+            candidates = self._iter_deployments(service, "SUCCEEDED", environment)
+        # GSI2 is eventually consistent and may not show the write that just made this record succeed yet,
+        # so the record itself is always a candidate.
+        candidates = {deployment.get("id"): deployment for deployment in candidates}
+        candidates[record.get("id")] = record
+        latest_successes = heapq.nlargest(
+            2,
+            candidates.values(),
+            key=lambda deployment: (deployment.get("createdAt") or "", deployment.get("id") or ""),
+        )
+        latest_success = latest_successes[0]
         if latest_success.get("id") != record.get("id"):
             self.update_deployment_superseded_by(record["id"], latest_success.get("id"))
             return
-        for deployment in deployments:
-            if deployment.get("state") == "SUCCEEDED" and deployment.get("id") != record.get("id"):
-                self.update_deployment_superseded_by(deployment["id"], record.get("id"))
-                break
+        for deployment in latest_successes[1:]:
+            self.update_deployment_superseded_by(deployment["id"], record.get("id"))
+
+    def _deployment_index_keys(self, item: dict) -> dict:
+        return {
+            "gsi2pk": f"DEPLOYMENT#{item.get('service')}#{item.get('environment')}",
+            "gsi2sk": f"{item.get('createdAt') or ''}#{item.get('id')}",
+        }
+
+    def _iter_recent_successes(self, service: str, environment: str) -> Iterator[dict]:
+        # Newest first, so callers can stop after the few rows they need.
+        items = self._paginate(
+            self.table.query,
+            IndexName=self.DEPLOYMENT_INDEX_NAME,
+            KeyConditionExpression=Key("gsi2pk").eq(f"DEPLOYMENT#{service}#{environment}"),
+            FilterExpression=Attr("state").eq("SUCCEEDED"),
+            ScanIndexForward=False,
+        )
+        return map(self._deployment_from_item, items)
+
+    def backfill_deployment_index_keys(self) -> int:
+        updated = 0
+        for item in self._query_partition("DEPLOYMENT"):
+            if item.get("gsi2pk") or not item.get("service"):
+                continue
+            keys = self._deployment_index_keys(item)
+            self.table.update_item(
+                Key={"pk": "DEPLOYMENT", "sk": item["sk"]},
+                UpdateExpression="SET gsi2pk = :gsi2pk, gsi2sk = :gsi2sk",
+                ExpressionAttributeValues={":gsi2pk": keys["gsi2pk"], ":gsi2sk": keys["gsi2sk"]},
+            )
+            updated += 1
+        return updated
 
     def find_prior_successful_deployment(self, deployment_id: str) -> Optional[dict]:
         target = self.get_deployment(deployment_id)
         if not target:
             return None
-        response = self.table.query(KeyConditionExpression=Key("pk").eq("DEPLOYMENT"))
-        items = response.get("Items", [])
-        candidates = []
-        for item in items:
-            if item.get("service") != target.get("service"):
-                continue
-            if item.get("environment") != target.get("environment"):
-                continue
-            if item.get("state") != "SUCCEEDED":
-                continue
-            created_at = item.get("createdAt", "")
-            if created_at and target.get("createdAt") and created_at >= target.get("createdAt"):
-                continue
-            candidates.append(item)
-        if not candidates:
+        if target.get("environment") and target.get("createdAt"):
+            # Newest first below the target's createdAt, so the first SUCCEEDED row is the prior one.
+            items = self._paginate(
+                self.table.query,
+                IndexName=self.DEPLOYMENT_INDEX_NAME,
+                KeyConditionExpression=Key("gsi2pk").eq(f"DEPLOYMENT#{target.get('service')}#{target['environment']}")
+                & Key("gsi2sk").lt(f"{target['createdAt']}#"),
+                FilterExpression=Attr("state").eq("SUCCEEDED"),
+                ScanIndexForward=False,
+                **self._projection(self.PRIOR_DEPLOYMENT_ATTRIBUTES),
+            )
+            item = next(items, None)
+        else:
+            filter_expression = (
+                Attr("service").eq(target.get("service"))
+                & Attr("environment").eq(target.get("environment"))
+                & Attr("state").eq("SUCCEEDED")
+            )
+            if target.get("createdAt"):
+                filter_expression = filter_expression & Attr("createdAt").lt(target["createdAt"])
+            items = self._query_partition(
+                "DEPLOYMENT",
+                filter_expression=filter_expression,
+                attributes=self.PRIOR_DEPLOYMENT_ATTRIBUTES,
+            )
+            item = max(items, key=lambda item: item.get("createdAt", ""), default=None)
+        if not item:
             return None
-        candidates.sort(key=lambda item: item.get("createdAt", ""), reverse=True)
-        item = candidates[0]
-        return {
-            "id": item.get("id"),
-            "service": item.get("service"),
-            "environment": item.get("environment"),
-            "version": item.get("version"),
-            "recipeId": item.get("recipeId"),
-            "recipeRevision": item.get("recipeRevision"),
-            "effectiveBehaviorSummary": item.get("effectiveBehaviorSummary"),
-            "state": item.get("state"),
-            "deploymentKind": item.get("deploymentKind"),
-            "outcome": item.get("outcome"),
-            "intentCorrelationId": item.get("intentCorrelationId"),
-            "supersededBy": item.get("supersededBy"),
-            "changeSummary": item.get("changeSummary"),
-            "createdAt": item.get("createdAt"),
-            "updatedAt": item.get("updatedAt"),
-            "spinnakerExecutionId": item.get("spinnakerExecutionId"),
-            "spinnakerExecutionUrl": item.get("spinnakerExecutionUrl"),
-            "spinnakerApplication": item.get("spinnakerApplication"),
-            "spinnakerPipeline": item.get("spinnakerPipeline"),
-            "rollbackOf": item.get("rollbackOf"),
-            "failures": item.get("failures", []),
-        }
+        prior = dict(zip(self.PRIOR_DEPLOYMENT_ATTRIBUTES, map(item.get, self.PRIOR_DEPLOYMENT_ATTRIBUTES)))
+        prior["failures"] = item.get("failures", [])
+        return prior
 
     def insert_upload_capability(
         self,
@@ -3568,19 +3908,17 @@ class DynamoStorage:
         sha256: str,
         content_type: str,
     ) -> Optional[dict]:
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("UPLOAD_CAPABILITY")
-            & Attr("service").eq(service)
+        matches = self._query_partition(
+            "UPLOAD_CAPABILITY",
+            filter_expression=Attr("service").eq(service)
             & Attr("version").eq(version)
             & Attr("expectedSizeBytes").eq(self._dec(size_bytes))
             & Attr("expectedSha256").eq(sha256)
             & Attr("expectedContentType").eq(content_type),
-            Limit=1,
         )
-        items = response.get("Items", [])
-        if not items:
+        item = next(matches, None)
+        if not item:
             return None
-        item = items[0]
         return {
             "id": item.get("id"),
             "expiresAt": item.get("expiresAt"),
@@ -3592,99 +3930,77 @@ class DynamoStorage:
 
     def insert_build(self, record: dict) -> dict:
         build_id = str(uuid.uuid4())
-        item = {
-            "pk": "BUILD",
-            "sk": build_id,
-            "id": build_id,
-            "service": record["service"],
-            "version": record["version"],
-            "artifactRef": record["artifactRef"],
-            "git_sha": record.get("git_sha"),
-            "git_branch": record.get("git_branch"),
-            "ci_publisher": record.get("ci_publisher"),
-            "ci_provider": record.get("ci_provider"),
-            "ci_run_id": record.get("ci_run_id"),
-            "built_at": record.get("built_at"),
-            "sha256": record["sha256"],
-            "sizeBytes": self._dec(record["sizeBytes"]),
-            "contentType": record["contentType"],
-            "checksum_sha256": record.get("checksum_sha256"),
-            "repo": record.get("repo"),
-            "actor": record.get("actor"),
-            "commit_url": record.get("commit_url"),
-            "run_url": record.get("run_url"),
-            "registeredAt": record["registeredAt"],
-        }
-        self.table.put_item(Item=item)
+        item = {"pk": "BUILD", "sk": build_id, "id": build_id}
+        item.update(zip(_BUILD_RECORD_KEYS, map(record.get, _BUILD_RECORD_KEYS)))
+        item["sizeBytes"] = self._dec(record["sizeBytes"])
+        item.update(self._build_index_keys(item))
+        self._put_item(item)
         record["id"] = build_id
         return record
 
+    def _build_from_item(self, item: dict) -> dict:
+        build = {key: item.get(key) for key in _BUILD_KEYS}
+        build["sizeBytes"] = int(item.get("sizeBytes", 0))
+        return build
+
+    def _build_index_keys(self, item: dict) -> dict:
+        return {
+            "gsi1pk": f"BUILD#{item.get('service')}",
+            "gsi1sk": f"{item.get('version')}#{item.get('registeredAt') or ''}",
+        }
+
+    def backfill_build_index_keys(self) -> int:
+        updated = 0
+        for item in self._query_partition("BUILD"):
+            if item.get("gsi1pk") or not item.get("service"):
+                continue
+            keys = self._build_index_keys(item)
+            self.table.update_item(
+                Key={"pk": "BUILD", "sk": item["sk"]},
+                UpdateExpression="SET gsi1pk = :gsi1pk, gsi1sk = :gsi1sk",
+                ExpressionAttributeValues={":gsi1pk": keys["gsi1pk"], ":gsi1sk": keys["gsi1sk"]},
+            )
+            updated += 1
+        return updated
+
     def find_latest_build(self, service: str, version: str) -> Optional[dict]:
-        # TODO: Full table scan (1MB page limit); at scale this can miss the true latest build without pagination.
-        # Replace before production with a GSI on (service, createdAt) or a monotonic sort key to enable Query.
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("BUILD")
-            & Attr("service").eq(service)
-            & Attr("version").eq(version)
+        response = self.table.query(
+            IndexName=self.BUILD_INDEX_NAME,
+            KeyConditionExpression=Key("gsi1pk").eq(f"BUILD#{service}") & Key("gsi1sk").begins_with(f"{version}#"),
+            ScanIndexForward=False,
+            Limit=1,
         )
         items = response.get("Items", [])
         if not items:
             return None
-        items.sort(key=lambda item: item.get("registeredAt", ""), reverse=True)
-        item = items[0]
-        return {
-            "id": item.get("id"),
-            "service": item.get("service"),
-            "version": item.get("version"),
-            "artifactRef": item.get("artifactRef"),
-            "git_sha": item.get("git_sha"),
-            "git_branch": item.get("git_branch"),
-            "ci_publisher": item.get("ci_publisher"),
-            "ci_provider": item.get("ci_provider"),
-            "ci_run_id": item.get("ci_run_id"),
-            "built_at": item.get("built_at"),
-            "sha256": item.get("sha256"),
-            "sizeBytes": int(item.get("sizeBytes", 0)),
-            "contentType": item.get("contentType"),
-            "checksum_sha256": item.get("checksum_sha256"),
-            "repo": item.get("repo"),
-            "actor": item.get("actor"),
-            "commit_url": item.get("commit_url"),
-            "run_url": item.get("run_url"),
-            "registeredAt": item.get("registeredAt"),
-        }
+        return self._build_from_item(items[0])
 
     def list_builds_for_service(self, service: str) -> List[dict]:
-        # TODO: Full table scan (1MB page limit); at scale this can miss results without pagination.
-        response = self.table.scan(
-            FilterExpression=Attr("pk").eq("BUILD") & Attr("service").eq(service)
+        items = list(
+            self._paginate(
+                self.table.query,
+                IndexName=self.BUILD_INDEX_NAME,
+                KeyConditionExpression=Key("gsi1pk").eq(f"BUILD#{service}"),
+            )
         )
-        items = response.get("Items", [])
         items.sort(key=lambda item: item.get("registeredAt", ""), reverse=True)
-        return [
-            {
-                "id": item.get("id"),
-                "service": item.get("service"),
-                "version": item.get("version"),
-                "artifactRef": item.get("artifactRef"),
-                "git_sha": item.get("git_sha"),
-                "git_branch": item.get("git_branch"),
-                "ci_publisher": item.get("ci_publisher"),
-                "ci_provider": item.get("ci_provider"),
-                "ci_run_id": item.get("ci_run_id"),
-                "built_at": item.get("built_at"),
-                "sha256": item.get("sha256"),
-                "sizeBytes": int(item.get("sizeBytes", 0)),
-                "contentType": item.get("contentType"),
-                "checksum_sha256": item.get("checksum_sha256"),
-                "repo": item.get("repo"),
-                "actor": item.get("actor"),
-                "commit_url": item.get("commit_url"),
-                "run_url": item.get("run_url"),
-                "registeredAt": item.get("registeredAt"),
-            }
-            for item in items
-        ]
+        return [self._build_from_item(item) for item in items]
+
+    def list_builds_for_service_page(self, service: str, limit: int = 50, cursor: Optional[str] = None) -> dict:
+        # The index orders builds by version first, so the newest page is picked with a bounded heap.
+        builds = map(
+            self._build_from_item,
+            self._paginate(
+                self.table.query,
+                IndexName=self.BUILD_INDEX_NAME,
+                KeyConditionExpression=Key("gsi1pk").eq(f"BUILD#{service}"),
+            ),
+        )
+        if cursor:
+            after = tuple(_decode_page_cursor(cursor, 2))
+            builds = (build for build in builds if _build_page_key(build) < after)
+        page = heapq.nlargest(limit + 1, builds, key=_build_page_key)
+        return _page_result(page[:limit], len(page) > limit, "registeredAt", "id")
 
 
 def build_storage():
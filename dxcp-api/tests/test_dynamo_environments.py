@@ -1,9 +1,15 @@
 from pathlib import Path
+import re
 import sys
 import importlib.util
 
+import pytest
+from botocore.exceptions import ClientError
+
 
 class _FakeDdbTable:
+    name = "dxcp-test"
+
     def __init__(self) -> None:
         self.items: dict[tuple[str, str], dict] = {}
 
@@ -20,6 +26,75 @@ class _FakeDdbTable:
     def delete_item(self, Key: dict) -> None:
         self.items.pop((Key["pk"], Key["sk"]), None)
 
+    def update_item(self, Key: dict, UpdateExpression: str, ExpressionAttributeValues: dict) -> None:
+        item = self.items[(Key["pk"], Key["sk"])]
+        for assignment in UpdateExpression.removeprefix("SET ").split(", "):
+            name, placeholder = assignment.split(" = ")
+            item[name] = ExpressionAttributeValues[placeholder]
+
+    def query(
+        self,
+        KeyConditionExpression,
+        IndexName: str | None = None,
+        FilterExpression=None,
+        ScanIndexForward: bool = True,
+        Limit: int | None = None,
+        ExclusiveStartKey: dict | None = None,
+        **params,
+    ) -> dict:
+        # Same paging as DynamoDB: Limit caps the items read before FilterExpression is applied.
+        hash_key, range_key = _FAKE_INDEX_KEYS.get(IndexName, ("pk", "sk"))
+
+        def position(item: dict) -> tuple:
+            return item[range_key], item["pk"], item["sk"]
+
+        rows = sorted(
+            (
+                dict(item)
+                for item in self.items.values()
+                if hash_key in item and range_key in item and _fake_condition_matches(KeyConditionExpression, item)
+            ),
+            key=position,
+            reverse=not ScanIndexForward,
+        )
+        if ExclusiveStartKey:
+            start = position(ExclusiveStartKey)
+            rows = [row for row in rows if (position(row) < start if not ScanIndexForward else position(row) > start)]
+        page = rows[:Limit] if Limit else rows
+        response = {
+            "Items": [row for row in page if FilterExpression is None or _fake_condition_matches(FilterExpression, row)]
+        }
+        if Limit and len(rows) > Limit:
+            last = page[-1]
+            response["LastEvaluatedKey"] = {name: last[name] for name in {"pk", "sk", hash_key, range_key}}
+        return response
+
+
+_FAKE_INDEX_KEYS = {"GSI1": ("gsi1pk", "gsi1sk"), "GSI2": ("gsi2pk", "gsi2sk")}
+
+
+def _fake_condition_matches(condition, item: dict) -> bool:
+    expression = condition.get_expression()
+    operator, values = expression["operator"], expression["values"]
+    if operator == "AND":
+        return all(_fake_condition_matches(value, item) for value in values)
+    actual = item.get(values[0].name)
+    if operator == "=":
+        return actual == values[1]
+    if actual is None:
+        return False
+    if operator == "<":
+        return actual < values[1]
+    if operator == "<=":
+        return actual <= values[1]
+    if operator == ">=":
+        return actual >= values[1]
+    if operator == "BETWEEN":
+        return values[1] <= actual <= values[2]
+    if operator == "begins_with":
+        return actual.startswith(values[1])
+    raise AssertionError(f"unsupported condition operator {operator}")
+
 
 def _load_storage_module():
     dxcp_api_dir = Path(__file__).resolve().parents[1]
@@ -34,6 +109,9 @@ def _load_storage_module():
 def _build_storage(storage_module, fake_table: _FakeDdbTable):
     instance = storage_module.DynamoStorage.__new__(storage_module.DynamoStorage)
     instance.table = fake_table
+    instance._serialize = storage_module.TypeSerializer().serialize
+    instance._admin_environment_cache = {}
+    instance._listing_cache = {}
     return instance
 
 
@@ -246,3 +324,381 @@ def test_dynamo_migration_normalizes_legacy_composite_environment_identity():
     assert table.items[("SERVICE_ENV_ROUTING", "demo-service#sandbox")]["environment_id"] == "sandbox"
     assert table.items[("DEPLOYMENT", "dep-1")]["environment"] == "sandbox"
     assert table.items[("DEPLOYMENT", "dep-1")]["sourceEnvironment"] == "sandbox"
+
+
+def test_dynamo_admin_environment_lookups_are_cached_until_written():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    table.items[("ENVIRONMENT", "sandbox")] = {
+        "pk": "ENVIRONMENT",
+        "sk": "sandbox",
+        "id": "sandbox",
+        "name": "sandbox",
+        "display_name": "Sandbox",
+        "type": "non_prod",
+        "is_enabled": True,
+        "created_at": "2026-03-30T00:00:00Z",
+        "updated_at": "2026-03-30T00:00:00Z",
+    }
+    dynamo = _build_storage(storage_module, table)
+    reads = []
+    original_get_item = table.get_item
+    table.get_item = lambda Key: reads.append(Key["sk"]) or original_get_item(Key)
+
+    first = dynamo.get_admin_environment("sandbox")
+    first["display_name"] = "mutated"
+    assert dynamo.get_admin_environment("sandbox")["display_name"] == "Sandbox"
+    assert reads == ["sandbox"]
+
+    dynamo.update_admin_environment(
+        {
+            "environment_id": "sandbox",
+            "display_name": "Sandbox Renamed",
+            "type": "non_prod",
+            "updated_at": "2026-03-31T00:00:00Z",
+        }
+    )
+    assert dynamo.get_admin_environment("sandbox")["display_name"] == "Sandbox Renamed"
+
+
+def test_dynamo_paginate_follows_last_evaluated_key_and_honors_limit():
+    storage_module = _load_storage_module()
+    dynamo = _build_storage(storage_module, _FakeDdbTable())
+    pages = [
+        {"Items": [{"sk": "a"}, {"sk": "b"}], "LastEvaluatedKey": {"pk": "RECIPE", "sk": "b"}},
+        {"Items": [{"sk": "c"}]},
+    ]
+    calls = []
+
+    def operation(**params):
+        calls.append(dict(params))
+        return pages[len(calls) - 1]
+
+    assert [item["sk"] for item in dynamo._paginate(operation)] == ["a", "b", "c"]
+    assert calls[1]["ExclusiveStartKey"] == {"pk": "RECIPE", "sk": "b"}
+
+    calls.clear()
+    assert [item["sk"] for item in dynamo._paginate(operation, limit=1)] == ["a"]
+    assert calls == [{"Limit": 1}]
+
+
+def test_dynamo_delivery_group_listing_is_cached_until_written():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    table.items[("DELIVERY_GROUP", "default")] = {
+        "pk": "DELIVERY_GROUP",
+        "sk": "default",
+        "id": "default",
+        "name": "Default",
+        "services": ["demo-service"],
+    }
+    dynamo = _build_storage(storage_module, table)
+    dynamo._ensure_group_environments = lambda group: None
+    scans = []
+
+    def scan_delivery_groups(limit=None):
+        scans.append(limit)
+        return [dict(item) for (pk, _), item in table.items.items() if pk == "DELIVERY_GROUP"]
+
+    dynamo._scan_delivery_groups = scan_delivery_groups
+
+    assert dynamo.get_delivery_group_for_service("demo-service")["id"] == "default"
+    dynamo.list_delivery_groups()[0]["name"] = "mutated"
+    dynamo.list_delivery_groups()[0]["services"].append("other-service")
+    assert dynamo.list_delivery_groups()[0]["name"] == "Default"
+    assert dynamo.list_delivery_groups()[0]["services"] == ["demo-service"]
+    assert dynamo.get_delivery_group_for_service("other-service") is None
+    assert len(scans) == 1
+
+    dynamo.update_delivery_group({"id": "default", "name": "Renamed", "services": []})
+    assert dynamo.get_delivery_group_for_service("demo-service") is None
+    assert len(scans) == 2
+
+
+def test_dynamo_supersession_counts_record_missing_from_lagging_index():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    prior = {
+        "pk": "DEPLOYMENT",
+        "sk": "dep-1",
+        "id": "dep-1",
+        "service": "demo-service",
+        "environment": "sandbox",
+        "version": "1.0.0",
+        "state": "SUCCEEDED",
+        "createdAt": "2026-10-16T00:00:00Z",
+    }
+    queries = []
+
+    def query(**params):
+        # GSI2 has not caught up with dep-2 yet, so only the older success comes back.
+        queries.append(params.get("IndexName"))
+        return {"Items": [dict(prior)]}
+
+    table.query = query
+    dynamo = _build_storage(storage_module, table)
+    superseded = []
+    dynamo.update_deployment_superseded_by = lambda deployment_id, superseded_by: superseded.append(
+        (deployment_id, superseded_by)
+    )
+
+    dynamo.apply_supersession(
+        {
+            "id": "dep-2",
+            "service": "demo-service",
+            "environment": "sandbox",
+            "version": "1.1.0",
+            "state": "SUCCEEDED",
+            "createdAt": "2026-10-16T01:00:00Z",
+        }
+    )
+
+    assert queries == [storage_module.DynamoStorage.DEPLOYMENT_INDEX_NAME]
+    assert superseded == [("dep-1", "dep-2")]
+
+
+class _ConditionFailingClient:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def update_item(self, **params) -> None:
+        self.calls.append(params)
+        raise ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": "The conditional request failed"}},
+            "UpdateItem",
+        )
+
+
+def _stored_deployment(table: _FakeDdbTable, deployment_id: str, indexed: bool = False, **fields) -> None:
+    item = {
+        "pk": "DEPLOYMENT",
+        "sk": deployment_id,
+        "id": deployment_id,
+        "service": "demo-service",
+        "environment": "sandbox",
+        "version": "1.0.0",
+        "createdAt": "2026-10-16T00:00:00Z",
+        **fields,
+    }
+    if indexed:
+        item.update(
+            {
+                "gsi2pk": f"DEPLOYMENT#{item['service']}#{item['environment']}",
+                "gsi2sk": f"{item['createdAt']}#{deployment_id}",
+            }
+        )
+    table.items[("DEPLOYMENT", deployment_id)] = item
+
+
+def test_dynamo_update_deployment_maps_failed_condition_to_immutable_error():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    _stored_deployment(table, "dep-1", state="SUCCEEDED", outcome="SUCCEEDED")
+    dynamo = _build_storage(storage_module, table)
+    dynamo._client = _ConditionFailingClient()
+
+    with pytest.raises(storage_module.ImmutableDeploymentError, match="state"):
+        dynamo.update_deployment("dep-1", "FAILED", [])
+    with pytest.raises(storage_module.ImmutableDeploymentError, match="outcome"):
+        dynamo.update_deployment("dep-1", "SUCCEEDED", [], outcome="SUPERSEDED")
+
+    dynamo.update_deployment("missing", "FAILED", [])
+
+    assert [call["Key"]["sk"]["S"] for call in dynamo._client.calls] == ["dep-1", "dep-1", "missing"]
+    assert table.items[("DEPLOYMENT", "dep-1")]["state"] == "SUCCEEDED"
+    assert ("DEPLOYMENT", "missing") not in table.items
+
+
+@pytest.mark.parametrize("outcome", [None, "SUCCEEDED"])
+def test_dynamo_update_deployment_condition_placeholders_match_values(outcome):
+    storage_module = _load_storage_module()
+    dynamo = _build_storage(storage_module, _FakeDdbTable())
+    dynamo._client = _ConditionFailingClient()
+
+    dynamo.update_deployment("missing", "SUCCEEDED", [], outcome=outcome)
+
+    params = dynamo._client.calls[0]
+    expressions = f"{params['UpdateExpression']} {params['ConditionExpression']}"
+    assert set(re.findall(r":\w+", expressions)) == set(params["ExpressionAttributeValues"])
+    assert set(re.findall(r"#\w+", expressions)) == set(params["ExpressionAttributeNames"])
+    assert params["ConditionExpression"].startswith("attribute_exists(pk) AND ")
+    assert ("outcome" in params["ConditionExpression"]) is (outcome is not None)
+
+
+def _stored_build(table: _FakeDdbTable, build_id: str, version: str, registered_at: str, indexed: bool = True) -> None:
+    item = {
+        "pk": "BUILD",
+        "sk": build_id,
+        "id": build_id,
+        "service": "demo-service",
+        "version": version,
+        "artifactRef": f"s3://bucket/demo-service-{version}.zip",
+        "sha256": "a" * 64,
+        "sizeBytes": 10,
+        "contentType": "application/zip",
+        "registeredAt": registered_at,
+    }
+    if indexed:
+        item.update({"gsi1pk": "BUILD#demo-service", "gsi1sk": f"{version}#{registered_at}"})
+    table.items[("BUILD", build_id)] = item
+
+
+def test_dynamo_find_latest_build_matches_whole_version_only():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    _stored_build(table, "b-1", "1.0", "2026-01-01T00:00:00Z")
+    _stored_build(table, "b-2", "1.0", "2026-01-02T00:00:00Z")
+    _stored_build(table, "b-3", "1.0.1", "2026-01-03T00:00:00Z")
+    dynamo = _build_storage(storage_module, table)
+
+    assert dynamo.find_latest_build("demo-service", "1.0")["id"] == "b-2"
+    assert dynamo.find_latest_build("demo-service", "1.0.1")["id"] == "b-3"
+    assert dynamo.find_latest_build("demo-service", "1.1") is None
+
+
+def test_dynamo_builds_page_orders_version_keyed_index_by_registration():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    # Index order is by version, so it disagrees with registration order.
+    _stored_build(table, "b-1", "2.0.0", "2026-01-01T00:00:00Z")
+    _stored_build(table, "b-2", "1.0.0", "2026-01-03T00:00:00Z")
+    _stored_build(table, "b-3", "1.5.0", "2026-01-02T00:00:00Z")
+    dynamo = _build_storage(storage_module, table)
+
+    first = dynamo.list_builds_for_service_page("demo-service", limit=2)
+    second = dynamo.list_builds_for_service_page("demo-service", limit=2, cursor=first["next_cursor"])
+
+    assert [build["version"] for build in first["items"]] == ["1.0.0", "1.5.0"]
+    assert [build["version"] for build in second["items"]] == ["2.0.0"]
+    assert second["next_cursor"] is None
+
+
+def test_dynamo_build_index_backfill_skips_keyed_items():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    _stored_build(table, "b-1", "1.0.0", "2026-01-01T00:00:00Z", indexed=False)
+    _stored_build(table, "b-2", "1.1.0", "2026-01-02T00:00:00Z")
+    table.items[("BUILD", "b-2")]["gsi1sk"] = "kept"
+    dynamo = _build_storage(storage_module, table)
+
+    assert dynamo.backfill_build_index_keys() == 1
+    assert table.items[("BUILD", "b-1")]["gsi1pk"] == "BUILD#demo-service"
+    assert table.items[("BUILD", "b-1")]["gsi1sk"] == "1.0.0#2026-01-01T00:00:00Z"
+    assert table.items[("BUILD", "b-2")]["gsi1sk"] == "kept"
+    assert dynamo.backfill_build_index_keys() == 0
+
+
+def _recording_queries(table: _FakeDdbTable) -> list:
+    indexes = []
+    original_query = table.query
+
+    def query(**params):
+        indexes.append(params.get("IndexName"))
+        return original_query(**params)
+
+    table.query = query
+    return indexes
+
+
+def test_dynamo_prior_successful_deployment_skips_same_created_at():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    _stored_deployment(table, "dep-1", indexed=True, state="SUCCEEDED", createdAt="2026-10-16T01:00:00Z")
+    _stored_deployment(table, "dep-2", indexed=True, state="FAILED", createdAt="2026-10-16T02:00:00Z")
+    _stored_deployment(
+        table, "dep-3", indexed=True, state="SUCCEEDED", environment="prod", createdAt="2026-10-16T02:30:00Z"
+    )
+    _stored_deployment(table, "dep-4", indexed=True, state="SUCCEEDED", createdAt="2026-10-16T03:00:00Z")
+    _stored_deployment(table, "dep-5", indexed=True, state="SUCCEEDED", createdAt="2026-10-16T03:00:00Z")
+    dynamo = _build_storage(storage_module, table)
+    indexes = _recording_queries(table)
+
+    assert dynamo.find_prior_successful_deployment("dep-5")["id"] == "dep-1"
+    assert dynamo.find_prior_successful_deployment("dep-1") is None
+    assert indexes == [storage_module.DynamoStorage.DEPLOYMENT_INDEX_NAME] * 2
+
+
+@pytest.mark.parametrize("missing", ["environment", "createdAt"])
+def test_dynamo_prior_successful_deployment_falls_back_to_partition_query(missing):
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    _stored_deployment(table, "dep-1", state="SUCCEEDED", createdAt="2026-10-16T01:00:00Z")
+    _stored_deployment(table, "dep-2", state="SUCCEEDED", createdAt="2026-10-16T02:00:00Z")
+    _stored_deployment(table, "dep-3", state="FAILED", createdAt="2026-10-16T03:00:00Z")
+    for item in table.items.values():
+        item.pop(missing)
+    _stored_deployment(table, "target", state="RUNNING", createdAt="2026-10-16T04:00:00Z")
+    table.items[("DEPLOYMENT", "target")].pop(missing)
+    dynamo = _build_storage(storage_module, table)
+    indexes = _recording_queries(table)
+
+    assert dynamo.find_prior_successful_deployment("target")["id"] in {"dep-1", "dep-2"}
+    assert indexes == [None]
+
+
+def test_dynamo_deployment_index_backfill_skips_keyed_items():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    _stored_deployment(table, "dep-1", state="SUCCEEDED", createdAt="2026-10-16T01:00:00Z")
+    _stored_deployment(table, "dep-2", indexed=True, state="SUCCEEDED")
+    table.items[("DEPLOYMENT", "dep-2")]["gsi2sk"] = "kept"
+    dynamo = _build_storage(storage_module, table)
+
+    assert dynamo.backfill_deployment_index_keys() == 1
+    assert table.items[("DEPLOYMENT", "dep-1")]["gsi2pk"] == "DEPLOYMENT#demo-service#sandbox"
+    assert table.items[("DEPLOYMENT", "dep-1")]["gsi2sk"] == "2026-10-16T01:00:00Z#dep-1"
+    assert table.items[("DEPLOYMENT", "dep-2")]["gsi2sk"] == "kept"
+    assert dynamo.backfill_deployment_index_keys() == 0
+
+
+def _audit_event(event_id: str, timestamp: str, event_type: str = "DEPLOY_SUBMIT") -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": event_type,
+        "actor_id": "user-1",
+        "actor_role": "PLATFORM_ADMIN",
+        "target_type": "DEPLOYMENT",
+        "target_id": "dep-1",
+        "timestamp": timestamp,
+        "outcome": "SUCCESS",
+        "summary": "audit",
+    }
+
+
+def test_dynamo_audit_events_page_keeps_reading_until_filter_fills_page():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    dynamo = _build_storage(storage_module, table)
+    for index in range(10):
+        event_type = "ROLLBACK_SUBMIT" if index in (1, 4, 8) else "DEPLOY_SUBMIT"
+        dynamo.insert_audit_event(_audit_event(f"evt-{index}", f"2026-01-01T00:00:0{index}Z", event_type))
+    indexes = _recording_queries(table)
+
+    first = dynamo.list_audit_events_page(event_type="ROLLBACK_SUBMIT", limit=2)
+    assert [event["event_id"] for event in first["items"]] == ["evt-8", "evt-4"]
+    assert len(indexes) == 3
+
+    second = dynamo.list_audit_events_page(event_type="ROLLBACK_SUBMIT", limit=2, cursor=first["next_cursor"])
+    assert [event["event_id"] for event in second["items"]] == ["evt-1"]
+    assert second["next_cursor"] is None
+
+
+def test_dynamo_audit_events_page_bounds_include_whole_end_timestamp():
+    storage_module = _load_storage_module()
+    table = _FakeDdbTable()
+    dynamo = _build_storage(storage_module, table)
+    for index in range(4):
+        dynamo.insert_audit_event(_audit_event(f"evt-{index}", f"2026-01-0{index + 1}T00:00:00Z"))
+    # Same timestamp as evt-2, so only its event_id separates them in the sort key.
+    dynamo.insert_audit_event(_audit_event("evt-z", "2026-01-03T00:00:00Z"))
+
+    def event_ids(**bounds) -> list:
+        return [event["event_id"] for event in dynamo.list_audit_events(**bounds)]
+
+    assert event_ids(start_time="2026-01-02T00:00:00Z", end_time="2026-01-03T00:00:00Z") == [
+        "evt-z",
+        "evt-2",
+        "evt-1",
+    ]
+    assert event_ids(start_time="2026-01-03T00:00:00Z") == ["evt-3", "evt-z", "evt-2"]
+    assert event_ids(end_time="2026-01-02T00:00:00Z") == ["evt-1", "evt-0"]
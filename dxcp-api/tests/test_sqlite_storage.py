@@ -0,0 +1,567 @@
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from storage import ImmutableDeploymentError, Storage
+
+
+def _storage(tmp_path) -> Storage:
+    return Storage(str(tmp_path / "dxcp.db"), str(tmp_path / "services.json"))
+
+
+def _recipe(recipe_id: str) -> dict:
+    return {
+        "id": recipe_id,
+        "name": recipe_id.title(),
+        "allowed_parameters": [],
+        "spinnaker_application": "demo-app",
+        "deploy_pipeline": "demo-deploy",
+        "rollback_pipeline": "rollback-demo-service",
+    }
+
+
+def test_read_pool_connections_reject_writes(tmp_path):
+    storage = _storage(tmp_path)
+
+    with pytest.raises(sqlite3.OperationalError):
+        with storage._ro_conn() as cur:
+            cur.execute("DELETE FROM recipes")
+
+
+def test_write_pool_rolls_back_on_error(tmp_path):
+    storage = _storage(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with storage._rw_conn() as cur:
+            cur.execute(
+                "INSERT INTO recipes (id, name, allowed_parameters) VALUES (?, ?, ?)",
+                ("partial", "Partial", "[]"),
+            )
+            raise RuntimeError("boom")
+
+    assert storage.get_recipe("partial") is None
+
+
+def test_pooled_readers_see_committed_writes_across_threads(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_recipe(_recipe("default"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: storage.get_recipe("default"), range(32)))
+    assert all(result and result["id"] == "default" for result in results)
+
+    storage.insert_recipe(_recipe("canary"))
+    assert [recipe["id"] for recipe in storage.list_recipes()] == ["canary", "default"]
+    assert storage._read_pool.qsize() == Storage.READ_POOL_SIZE
+    assert storage._write_pool.qsize() == Storage.WRITE_POOL_SIZE
+
+
+def _deployment(deployment_id: str, created_at: str, state: str = "IN_PROGRESS") -> dict:
+    return {
+        "id": deployment_id,
+        "service": "demo-service",
+        "environment": "sandbox",
+        "version": "1.0.0",
+        "state": state,
+        "changeSummary": "test",
+        "createdAt": created_at,
+        "updatedAt": created_at,
+        "spinnakerExecutionId": f"exec-{deployment_id}",
+        "spinnakerExecutionUrl": f"http://spinnaker/{deployment_id}",
+    }
+
+
+def _failure(summary: str) -> dict:
+    return {
+        "category": "APP",
+        "summary": summary,
+        "detail": None,
+        "actionHint": None,
+        "observedAt": "2026-01-01T00:00:00Z",
+    }
+
+
+def test_update_deployment_replaces_failures_in_order(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_deployment(_deployment("dep-1", "2026-01-01T00:00:00Z"), [_failure("old")])
+
+    storage.update_deployment("dep-1", "IN_PROGRESS", [_failure("first"), _failure("second")])
+    assert [f["summary"] for f in storage.get_deployment("dep-1")["failures"]] == ["first", "second"]
+
+    storage.update_deployment("dep-1", "IN_PROGRESS", [])
+    assert storage.get_deployment("dep-1")["failures"] == []
+
+
+def test_list_deployments_attaches_failures_per_deployment(tmp_path, monkeypatch):
+    storage = _storage(tmp_path)
+    monkeypatch.setattr(Storage, "SQL_IN_CHUNK_SIZE", 2)
+    storage.insert_deployment(_deployment("dep-1", "2026-01-01T00:00:00Z"), [_failure("a1"), _failure("a2")])
+    storage.insert_deployment(_deployment("dep-2", "2026-01-02T00:00:00Z"), [])
+    storage.insert_deployment(_deployment("dep-3", "2026-01-03T00:00:00Z"), [_failure("c1")])
+
+    deployments = storage.list_deployments("demo-service", None)
+
+    assert [d["id"] for d in deployments] == ["dep-3", "dep-2", "dep-1"]
+    assert [[f["summary"] for f in d["failures"]] for d in deployments] == [["c1"], [], ["a1", "a2"]]
+    assert [d["id"] for d in storage.list_deployments("demo-service", None, limit=2)] == ["dep-3", "dep-2"]
+    assert [d["id"] for d in storage.list_deployments("demo-service", None, offset=1)] == ["dep-2", "dep-1"]
+    assert [d["id"] for d in storage.list_deployments("demo-service", None, limit=1, offset=2)] == ["dep-1"]
+
+
+def test_get_delivery_group_for_service_matches_exact_member(tmp_path):
+    storage = _storage(tmp_path)
+    for group_id, services in [("b-group", ["svc-a"]), ("a-group", ["svc-ab", "svc-b"])]:
+        storage.insert_delivery_group(
+            {"id": group_id, "name": group_id, "services": services, "allowed_recipes": []}
+        )
+
+    assert storage.get_delivery_group_for_service("svc-a")["id"] == "b-group"
+    assert storage.get_delivery_group_for_service("svc-b")["id"] == "a-group"
+    assert storage.get_delivery_group_for_service("svc") is None
+
+
+def test_insert_environment_keeps_existing_row(tmp_path):
+    storage = _storage(tmp_path)
+    first = storage.insert_environment({"name": "sandbox", "type": "non_prod", "display_name": "Sandbox"})
+    second = storage.insert_environment({"name": "sandbox", "type": "prod", "display_name": "Other"})
+
+    assert first["display_name"] == "Sandbox"
+    assert second == first
+
+
+def test_ensure_default_recipe_only_reports_first_run(tmp_path):
+    storage = _storage(tmp_path)
+
+    assert storage.ensure_default_recipe()["id"] == "default"
+    assert storage.ensure_default_recipe() is None
+    assert [recipe["id"] for recipe in storage.list_recipes()] == ["bluegreen", "canary", "default"]
+
+
+def test_ensure_default_delivery_group_rechecks_inside_its_transaction(tmp_path, monkeypatch):
+    storage = _storage(tmp_path)
+    assert storage.ensure_default_delivery_group()["id"] == "default"
+
+    checks = []
+    real_check = Storage._has_delivery_groups
+
+    def racing_check(self):
+        # The first (unlocked) check misses the existing group, as if another worker seeded it concurrently.
+        checks.append(1)
+        return len(checks) > 1 and real_check(self)
+
+    monkeypatch.setattr(Storage, "_has_delivery_groups", racing_check)
+
+    assert storage.ensure_default_delivery_group() is None
+    assert len(checks) == 2
+    assert [group["id"] for group in storage.list_delivery_groups()] == ["default"]
+
+
+def test_ensure_default_environments_seeds_envs_and_policy_once(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_delivery_group(
+        {"id": "alpha", "name": "Alpha", "services": [], "allowed_recipes": []}
+    )
+    with storage._rw_conn() as cur:
+        cur.execute("UPDATE delivery_groups SET allowed_environments = ? WHERE id = ?", ('["sandbox", "prod"]', "alpha"))
+    storage.insert_delivery_group({"id": "beta", "name": "Beta", "services": [], "allowed_recipes": []})
+
+    created = storage.ensure_default_environments()
+
+    assert [env["id"] for env in created] == ["sandbox", "prod"]
+    assert created[1]["type"] == "prod"
+    assert [(row["environment_id"], row["order_index"]) for row in storage.list_delivery_group_environment_policy("alpha")] == [
+        ("sandbox", 1),
+        ("prod", 2),
+    ]
+    assert [row["environment_id"] for row in storage.list_delivery_group_environment_policy("beta")] == ["sandbox"]
+    assert storage.ensure_default_environments() == []
+
+
+def test_cached_json_columns_are_not_shared_between_reads(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_delivery_group(
+        {
+            "id": "alpha",
+            "name": "Alpha",
+            "services": ["svc-a"],
+            "allowed_recipes": [],
+            "guardrails": {"max_concurrent_deployments": 1},
+        }
+    )
+
+    first = storage.get_delivery_group("alpha")
+    first["services"].append("svc-b")
+    first["guardrails"]["max_concurrent_deployments"] = 5
+
+    second = storage.get_delivery_group("alpha")
+    assert second["services"] == ["svc-a"]
+    assert second["guardrails"] == {"max_concurrent_deployments": 1}
+
+
+def _query_plan(storage: Storage, sql: str, params: tuple) -> str:
+    with storage._ro_conn() as cur:
+        cur.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return " ".join(row["detail"] for row in cur.fetchall())
+
+
+def test_deployment_lookups_use_indexes(tmp_path):
+    storage = _storage(tmp_path)
+
+    prior_plan = _query_plan(
+        storage,
+        "SELECT * FROM deployments WHERE service = ? AND environment = ? AND state = ? AND created_at < ? "
+        "ORDER BY created_at DESC LIMIT 1",
+        ("svc", "sandbox", "SUCCEEDED", "2026-01-01T00:00:00Z"),
+    )
+    group_plan = _query_plan(
+        storage,
+        "SELECT COUNT(*) FROM deployments WHERE delivery_group_id = ? AND state IN (?, ?)",
+        ("default", "ACTIVE", "IN_PROGRESS"),
+    )
+    active_plan = _query_plan(storage, "SELECT 1 FROM deployments WHERE state IN (?, ?) LIMIT 1", ("ACTIVE", "IN_PROGRESS"))
+    failures_plan = _query_plan(storage, "SELECT * FROM failures WHERE deployment_id = ?", ("dep-1",))
+
+    assert "idx_deployments_service_env_state_created" in prior_plan
+    assert "TEMP B-TREE" not in prior_plan
+    assert "COVERING INDEX idx_deployments_state_group_env" in group_plan
+    assert "COVERING INDEX idx_deployments_state_group_env" in active_plan
+    assert "idx_failures_deployment_id" in failures_plan
+
+
+def test_build_lookups_use_indexes_without_sorting(tmp_path):
+    storage = _storage(tmp_path)
+
+    latest_plan = _query_plan(
+        storage,
+        "SELECT * FROM builds WHERE service = ? AND version = ? ORDER BY registered_at DESC LIMIT 1",
+        ("svc", "1.0.0"),
+    )
+    list_plan = _query_plan(storage, "SELECT * FROM builds WHERE service = ? ORDER BY registered_at DESC", ("svc",))
+    cap_plan = _query_plan(
+        storage,
+        "SELECT id, expires_at, token FROM build_upload_caps WHERE service = ? AND version = ? AND expected_size_bytes = ? "
+        "AND expected_sha256 = ? AND expected_content_type = ?",
+        ("svc", "1.0.0", 10, "abc", "application/zip"),
+    )
+
+    assert "idx_builds_service_version_registered" in latest_plan
+    assert "idx_builds_service_registered" in list_plan
+    assert "idx_build_upload_caps_lookup" in cap_plan
+    assert "TEMP B-TREE" not in latest_plan + list_plan
+
+
+def test_apply_supersession_links_latest_and_prior_success(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_deployment(_deployment("dep-1", "2026-01-01T00:00:00Z", state="SUCCEEDED"), [])
+    storage.insert_deployment(_deployment("dep-2", "2026-01-02T00:00:00Z", state="FAILED"), [])
+    storage.insert_deployment(_deployment("dep-3", "2026-01-03T00:00:00Z", state="SUCCEEDED"), [])
+
+    assert storage.get_deployment("dep-1")["supersededBy"] == "dep-3"
+    assert storage.get_deployment("dep-2")["supersededBy"] is None
+    assert storage.get_deployment("dep-3")["supersededBy"] is None
+
+    storage.insert_deployment(_deployment("dep-0", "2025-12-31T00:00:00Z", state="SUCCEEDED"), [])
+    assert storage.get_deployment("dep-0")["supersededBy"] == "dep-3"
+
+
+def test_update_deployment_rejects_terminal_change_without_writing(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_deployment(_deployment("dep-1", "2026-01-01T00:00:00Z", state="FAILED"), [_failure("kept")])
+
+    with pytest.raises(ImmutableDeploymentError):
+        storage.update_deployment("dep-1", "SUCCEEDED", [])
+
+    stored = storage.get_deployment("dep-1")
+    assert stored["state"] == "FAILED"
+    assert [f["summary"] for f in stored["failures"]] == ["kept"]
+
+
+def test_bulk_policy_and_routing_lists_group_rows_by_id(tmp_path):
+    storage = _storage(tmp_path)
+    for group_id, env_id, order_index in [("alpha", "sandbox", 1), ("alpha", "prod", 2), ("beta", "sandbox", 1)]:
+        storage.upsert_delivery_group_environment_policy(
+            {"delivery_group_id": group_id, "environment_id": env_id, "is_enabled": True, "order_index": order_index}
+        )
+    storage.upsert_service_environment_routing({"service_id": "svc-a", "environment_id": "sandbox", "recipe_id": "default"})
+
+    policies = storage.list_delivery_group_environment_policy_bulk(["beta", "alpha", "missing"])
+    routes = storage.list_service_environment_routing_bulk(["svc-a", "svc-b"])
+
+    assert [row["environment_id"] for row in policies["alpha"]] == ["sandbox", "prod"]
+    assert policies["alpha"] == storage.list_delivery_group_environment_policy("alpha")
+    assert [row["environment_id"] for row in policies["beta"]] == ["sandbox"]
+    assert policies["missing"] == []
+    assert [row["recipe_id"] for row in routes["svc-a"]] == ["default"]
+    assert routes["svc-b"] == []
+
+
+def test_pooled_cursor_is_reused_and_drained_between_checkouts(tmp_path):
+    storage = _storage(tmp_path)
+    storage.ensure_default_recipe()
+
+    with storage._ro_conn() as cur:
+        cur.execute("SELECT id FROM recipes ORDER BY id")
+        cur.fetchone()
+        first = cur
+    external = sqlite3.connect(str(tmp_path / "dxcp.db"))
+    external.execute("DELETE FROM recipes WHERE id = ?", ("canary",))
+    external.commit()
+    external.close()
+
+    with storage._ro_conn() as cur:
+        assert cur is first
+        assert [row["id"] for row in cur.execute("SELECT id FROM recipes ORDER BY id")] == ["bluegreen", "default"]
+
+
+def test_find_prior_successful_deployment_uses_target_scope(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_deployment(_deployment("dep-1", "2026-01-01T00:00:00Z", state="SUCCEEDED"), [_failure("old")])
+    storage.insert_deployment(_deployment("dep-2", "2026-01-02T00:00:00Z", state="FAILED"), [])
+    storage.insert_deployment(_deployment("dep-3", "2026-01-03T00:00:00Z"), [])
+
+    prior = storage.find_prior_successful_deployment("dep-3")
+
+    assert prior["id"] == "dep-1"
+    assert [f["summary"] for f in prior["failures"]] == ["old"]
+    assert storage.find_prior_successful_deployment("dep-1") is None
+    assert storage.find_prior_successful_deployment("missing") is None
+
+
+def test_row_converters_do_not_depend_on_physical_column_order(tmp_path):
+    storage = _storage(tmp_path)
+    storage.ensure_default_environments()
+    storage.insert_deployment(_deployment("dep-1", "2026-01-01T00:00:00Z"), [_failure("boom")])
+    storage.insert_recipe(_recipe("default"))
+    storage.ensure_default_delivery_group()
+    expected_environment = storage.get_environment("sandbox")
+    expected_deployment = storage.get_deployment("dep-1")
+    expected_recipe = storage.get_recipe("default")
+    expected_group = storage.get_delivery_group("default")
+
+    with storage._rw_conn() as cur:
+        cur.execute("ALTER TABLE deployments RENAME COLUMN state TO state_old")
+        cur.execute("ALTER TABLE deployments ADD COLUMN state TEXT")
+        cur.execute("UPDATE deployments SET state = state_old")
+        cur.execute("ALTER TABLE environments RENAME COLUMN name TO name_old")
+        cur.execute("ALTER TABLE environments ADD COLUMN name TEXT")
+        cur.execute("UPDATE environments SET name = name_old")
+        for table, column in (("recipes", "name"), ("delivery_groups", "services"), ("failures", "summary")):
+            cur.execute(f"ALTER TABLE {table} RENAME COLUMN {column} TO {column}_old")
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+            cur.execute(f"UPDATE {table} SET {column} = {column}_old")
+
+    assert storage.get_environment("sandbox") == expected_environment
+    assert storage.get_deployment("dep-1") == expected_deployment
+    assert storage.list_deployments(None, None) == [expected_deployment]
+    assert storage.get_recipe("default") == expected_recipe
+    assert storage.get_delivery_group("default") == expected_group
+    storage.update_deployment("dep-1", "SUCCEEDED", [])
+    updated = storage.get_deployment("dep-1")
+    assert updated["state"] == "SUCCEEDED"
+    assert updated["service"] == expected_deployment["service"]
+
+
+def test_schema_setup_is_skipped_once_user_version_is_current(tmp_path, monkeypatch):
+    storage = _storage(tmp_path)
+    with storage._ro_conn() as cur:
+        assert cur.execute("PRAGMA user_version").fetchone()[0] == Storage.SCHEMA_VERSION
+
+    monkeypatch.setattr(Storage, "_ensure_column", lambda *args: pytest.fail("schema already current"))
+    reopened = _storage(tmp_path)
+    reopened.insert_recipe(_recipe("default"))
+    assert reopened.get_recipe("default")["id"] == "default"
+
+
+def test_pooled_connections_apply_wal_tuning_pragmas(tmp_path):
+    storage = _storage(tmp_path)
+
+    with storage._ro_conn() as cur:
+        assert cur.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert cur.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert cur.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert cur.execute("PRAGMA cache_size").fetchone()[0] == -Storage.PAGE_CACHE_KIB
+        assert cur.execute("PRAGMA mmap_size").fetchone()[0] == Storage.MMAP_SIZE_BYTES
+
+
+def test_group_environments_are_seeded_in_one_batch(tmp_path):
+    storage = _storage(tmp_path)
+    storage.insert_admin_environment(
+        {
+            "environment_id": "sandbox",
+            "display_name": "Sandbox",
+            "type": "non_prod",
+            "is_enabled": True,
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+        }
+    )
+    existing = storage.get_environment("sandbox")
+
+    storage.insert_delivery_group(
+        {
+            "id": "payments",
+            "name": "Payments",
+            "services": [],
+            "allowed_environments": ["sandbox", "staging", "", "perf", "staging"],
+            "allowed_recipes": [],
+        }
+    )
+
+    assert storage.get_environment("sandbox") == existing
+    assert storage.get_environment("staging")["type"] == "non_prod"
+    policy = storage.list_delivery_group_environment_policy("payments")
+    assert [(row["environment_id"], row["order_index"]) for row in policy] == [("staging", 2), ("perf", 4)]
+
+
+def _audit_event(event_id: str, timestamp: str, event_type: str = "ADMIN_UPDATE") -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": event_type,
+        "actor_id": "admin",
+        "actor_role": "PLATFORM_ADMIN",
+        "target_type": "recipe",
+        "target_id": "default",
+        "timestamp": timestamp,
+        "outcome": "SUCCESS",
+        "summary": "updated",
+    }
+
+
+def test_audit_events_page_with_keyset_cursor(tmp_path):
+    storage = _storage(tmp_path)
+    for index in range(5):
+        storage.insert_audit_event(_audit_event(f"evt-{index}", "2026-01-01T00:00:00Z" if index < 3 else f"2026-01-0{index}T00:00:00Z"))
+
+    pages = []
+    cursor = None
+    while True:
+        page = storage.list_audit_events_page(limit=2, cursor=cursor)
+        pages.append([event["event_id"] for event in page["items"]])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert pages == [["evt-4", "evt-3"], ["evt-2", "evt-1"], ["evt-0"]]
+    assert [event["event_id"] for event in storage.list_audit_events(limit=3)] == ["evt-4", "evt-3", "evt-2"]
+    with pytest.raises(ValueError):
+        storage.list_audit_events_page(cursor="not-a-cursor")
+
+
+def test_builds_page_with_keyset_cursor(tmp_path):
+    storage = _storage(tmp_path)
+    for index in range(3):
+        storage.insert_build(
+            {
+                "service": "demo-service",
+                "version": f"1.0.{index}",
+                "artifactRef": f"s3://bucket/demo-service-1.0.{index}.zip",
+                "sha256": "a" * 64,
+                "sizeBytes": 10,
+                "contentType": "application/zip",
+                "registeredAt": f"2026-01-0{index + 1}T00:00:00Z",
+            }
+        )
+
+    first = storage.list_builds_for_service_page("demo-service", limit=2)
+    second = storage.list_builds_for_service_page("demo-service", limit=2, cursor=first["next_cursor"])
+
+    assert [build["version"] for build in first["items"]] == ["1.0.2", "1.0.1"]
+    assert [build["version"] for build in second["items"]] == ["1.0.0"]
+    assert second["next_cursor"] is None
+
+
+def test_group_membership_lookups_filter_and_order_in_sql(tmp_path):
+    storage = _storage(tmp_path)
+    for group_id, environments, recipes in (
+        ("zeta", ["sandbox"], ["default"]),
+        ("alpha", ["sandbox", "prod"], ["canary", "default"]),
+        ("open", None, []),
+    ):
+        storage.insert_delivery_group(
+            {
+                "id": group_id,
+                "name": group_id.title(),
+                "services": [],
+                "allowed_environments": environments,
+                "allowed_recipes": recipes,
+            }
+        )
+
+    assert storage.list_delivery_groups_by_allowed_environment("sandbox") == [
+        {"delivery_group_id": "alpha", "environment_id": "sandbox"},
+        {"delivery_group_id": "zeta", "environment_id": "sandbox"},
+    ]
+    assert storage.list_delivery_groups_by_allowed_recipe("default") == [
+        {"id": "alpha", "name": "Alpha"},
+        {"id": "zeta", "name": "Zeta"},
+    ]
+    assert storage.list_delivery_groups_by_allowed_recipe("missing") == []
+
+
+def test_transaction_groups_writes_and_sees_its_own_changes(tmp_path):
+    storage = _storage(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.insert_recipe(_recipe("canary"))
+            assert storage.get_recipe("canary")["id"] == "canary"
+            raise RuntimeError("boom")
+    assert storage.get_recipe("canary") is None
+
+    with storage.transaction():
+        storage.insert_recipe(_recipe("canary"))
+        with storage.transaction():
+            storage.insert_recipe(_recipe("default"))
+    assert [recipe["id"] for recipe in storage.list_recipes()] == ["canary", "default"]
+    assert storage._write_pool.qsize() == Storage.WRITE_POOL_SIZE
+
+
+def test_service_registry_is_reparsed_only_when_file_changes(tmp_path, monkeypatch):
+    storage = _storage(tmp_path)
+    registry = tmp_path / "services.json"
+    registry.write_text(json.dumps([{"service_name": "zeta"}, {"service_name": "alpha", "allowed_environments": ["sandbox"]}]))
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(json, "load", lambda handle: loads.append(1) or real_load(handle))
+
+    assert [service["service_name"] for service in storage.list_services()] == ["alpha", "zeta"]
+    storage.get_service("alpha")["allowed_environments"].append("prod")
+    assert storage.get_service("alpha")["allowed_environments"] == ["sandbox"]
+    assert len(loads) == 1
+
+    registry.write_text(json.dumps([{"service_name": "beta"}, {"service_name": "alpha", "allowed_environments": ["sandbox"]}]))
+    assert [service["service_name"] for service in storage.list_services()] == ["alpha", "beta"]
+    assert len(loads) == 2
+
+
+def test_get_service_looks_up_first_registry_entry_by_name(tmp_path, monkeypatch):
+    storage = _storage(tmp_path)
+    (tmp_path / "services.json").write_text(
+        json.dumps(
+            [
+                {"service_name": "alpha", "allowed_recipes": ["default"]},
+                {"service_name": "beta"},
+                {"service_name": "alpha", "allowed_recipes": ["canary"]},
+            ]
+        )
+    )
+    monkeypatch.setattr(Storage, "list_services", lambda self: pytest.fail("get_service should not list the registry"))
+
+    assert storage.get_service("alpha")["allowed_recipes"] == ["default"]
+    assert storage.get_service("beta")["service_name"] == "beta"
+    assert storage.get_service("missing") is None
+
+
+def test_get_recipes_bulk_returns_found_recipes_by_id(tmp_path, monkeypatch):
+    storage = _storage(tmp_path)
+    monkeypatch.setattr(Storage, "SQL_IN_CHUNK_SIZE", 2)
+    for recipe_id in ("default", "canary", "bluegreen"):
+        storage.insert_recipe(_recipe(recipe_id))
+
+    recipes = storage.get_recipes_bulk(["canary", "missing", "default", "bluegreen", "canary"])
+
+    assert sorted(recipes) == ["bluegreen", "canary", "default"]
+    assert recipes["canary"] == storage.get_recipe("canary")
+    assert storage.get_recipes_bulk([]) == {}
@@ -362,9 +362,10 @@ set -e
 run_cdk_deploy() {
   local stack="$1"
   local verbose_flag="${2:-0}"
+  shift 2
   # Deploy each stack explicitly; dependencies are already ordered in CDK_STACKS below.
   # Without --exclusively, CDK may re-process dependency stacks on later deploy calls.
-  local cmd=(npx cdk deploy "$stack" --exclusively --require-approval never --progress events --outputs-file "$CDK_OUTPUTS_FILE" --no-notices)
+  local cmd=(npx cdk deploy "$stack" --exclusively --require-approval never --progress events --outputs-file "$CDK_OUTPUTS_FILE" --no-notices "$@")
   if [[ "$verbose_flag" -eq 1 ]]; then
     cmd+=(--verbose)
   fi
@@ -378,6 +379,28 @@ run_cdk_deploy() {
   CDK_DISABLE_NOTICES=1 "${cmd[@]}"
 }
 
+# DynamoDB adds one GSI per table update. An existing table without GSI1 gets it in a first
+# DxcpDataStack pass that leaves GSI2 out; the regular pass below then adds GSI2.
+data_table_needs_staged_indexes() {
+  local table
+  local index_names
+  table="$(trim "$(stack_output "DxcpDataStack" "DxcpTableName" 2>/dev/null)")"
+  if [[ -z "$table" || "$table" == "None" ]]; then
+    return 1
+  fi
+  index_names="$(aws dynamodb describe-table --table-name "$table" --query "Table.GlobalSecondaryIndexes[].IndexName" --output text 2>/dev/null)" || return 1
+  [[ " $index_names " != *[[:space:]]GSI1[[:space:]]* ]]
+}
+
+SEED_SCRIPT="$ROOT_DIR/scripts/seed_registry.py"
+MIGRATION_SCRIPT="$ROOT_DIR/scripts/run_migrations.py"
+PYTHONPATH_DIR="$API_BUILD_DIR"
+if [[ -n "$ROOT_DIR_WIN" && -n "$API_BUILD_DIR_WIN" ]]; then
+  SEED_SCRIPT="$ROOT_DIR_WIN\\scripts\\seed_registry.py"
+  MIGRATION_SCRIPT="$ROOT_DIR_WIN\\scripts\\run_migrations.py"
+  PYTHONPATH_DIR="$API_BUILD_DIR_WIN"
+fi
+
 set +e
 CDK_DEPLOY_STATUS=0
 CDK_STACKS=(DxcpDataStack DxcpDemoRuntimeStack DxcpApiStack DxcpUiStack)
@@ -386,15 +409,37 @@ if [[ -n "$DXCP_CDK_SINGLE_STACK" ]]; then
   echo "CDK single-stack mode enabled: ${DXCP_CDK_SINGLE_STACK}"
 fi
 for stack in "${CDK_STACKS[@]}"; do
-  run_cdk_deploy "$stack" 0
-  STACK_STATUS=$?
+  STACK_ARGS=()
+  STACK_STATUS=0
+  if [[ "$stack" == "DxcpDataStack" ]] && data_table_needs_staged_indexes; then
+    echo "DxcpTable has no GSI1 yet: adding it before GSI2 (DynamoDB allows one new index per update)."
+    STACK_ARGS=(-c deploymentIndex=false)
+    run_cdk_deploy "$stack" 0 "${STACK_ARGS[@]}"
+    STACK_STATUS=$?
+  fi
+  if [[ "$STACK_STATUS" -eq 0 ]]; then
+    STACK_ARGS=()
+    run_cdk_deploy "$stack" 0
+    STACK_STATUS=$?
+  fi
   if [[ "$STACK_STATUS" -ne 0 ]]; then
     CDK_DEPLOY_STATUS=$STACK_STATUS
     echo "WARNING: CDK deploy failed for stack=${stack}. Capturing verbose diagnostics to $CDK_DEBUG_LOG ..." >&2
-    run_cdk_deploy "$stack" 1 >/dev/null 2>&1
+    run_cdk_deploy "$stack" 1 "${STACK_ARGS[@]}" >/dev/null 2>&1
     echo "WARNING: verbose diagnostics capture complete for stack=${stack}" >&2
     break
   fi
+  if [[ "$stack" == "DxcpDataStack" ]]; then
+    # Backfill migrations (such as GSI keys) must land before DxcpApiStack ships code that reads them.
+    # Seeding goes first because the default delivery group migration reads the service registry.
+    DDB_TABLE="$(trim "$(stack_output "DxcpDataStack" "DxcpTableName")")"
+    PYTHONPATH="$PYTHONPATH_DIR" python "$SEED_SCRIPT" --table "$DDB_TABLE" && python "$MIGRATION_SCRIPT" --table "$DDB_TABLE"
+    STACK_STATUS=$?
+    if [[ "$STACK_STATUS" -ne 0 ]]; then
+      echo "Registry seeding or migrations failed after stack=${stack}; not deploying later stacks." >&2
+      exit "$STACK_STATUS"
+    fi
+  fi
 done
 set -e
 if [[ "$CDK_DEPLOY_STATUS" -ne 0 ]]; then
@@ -498,16 +543,9 @@ aws s3 sync "$UI_DIST_DIR" "s3://$UI_BUCKET" --delete
 aws cloudfront create-invalidation --distribution-id "$UI_DIST_ID" --paths "/*"
 
 if [[ "$UI_ONLY" -eq 0 ]]; then
-  SEED_SCRIPT="$ROOT_DIR/scripts/seed_registry.py"
-  MIGRATION_SCRIPT="$ROOT_DIR/scripts/run_migrations.py"
-  PYTHONPATH_DIR="$API_BUILD_DIR"
-  if [[ -n "$ROOT_DIR_WIN" && -n "$API_BUILD_DIR_WIN" ]]; then
-    SEED_SCRIPT="$ROOT_DIR_WIN\\scripts\\seed_registry.py"
-    MIGRATION_SCRIPT="$ROOT_DIR_WIN\\scripts\\run_migrations.py"
-    PYTHONPATH_DIR="$API_BUILD_DIR_WIN"
-  fi
   PYTHONPATH="$PYTHONPATH_DIR" python "$SEED_SCRIPT" --table "$DDB_TABLE"
-  python "$MIGRATION_SCRIPT" --table "$DDB_TABLE"
+  # Re-sweeps GSI keys for builds and deployments written by the previous API version while this deploy ran.
+  python "$MIGRATION_SCRIPT" --table "$DDB_TABLE" --backfill-index-keys
 else
   DDB_TABLE="skipped (--ui-only)"
 fi
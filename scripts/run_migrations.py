@@ -70,6 +70,11 @@ def record_migration(table, migration_id: str) -> bool:
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run DXCP DynamoDB migrations")
     parser.add_argument("--table", required=True, help="DynamoDB table name")
+    parser.add_argument(
+        "--backfill-index-keys",
+        action="store_true",
+        help="Also add missing GSI keys to build and deployment items, even if their migrations were applied",
+    )
     args = parser.parse_args()
 
     table = boto3.resource("dynamodb").Table(args.table)
@@ -77,6 +82,11 @@ def main() -> int:
     applied = get_applied_migrations(table)
     migrations = discover_migrations()
 
+    if args.backfill_index_keys:
+        # Migrations run before DxcpApiStack updates, so the previous API version may still write items without keys.
+        print(f"Backfilled index keys on {storage.backfill_build_index_keys()} build(s).")
+        print(f"Backfilled index keys on {storage.backfill_deployment_index_keys()} deployment(s).")
+
     if not migrations:
         print("No migrations found.")
         return 0